@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vectorized BM25 backend - sparse CSR term-document matrix with precomputed
+BM25F weights, scoring one or many queries as a single sparse matrix product.
+
+Optional: needs numpy + scipy. core.py uses it when UIPRO_BM25_BACKEND=numpy
+and falls back to the pure-Python BM25 otherwise.
+
+Usage:
+    python bm25_numpy.py --check              # parity against core.BM25 on every CSV
+    python bm25_numpy.py --benchmark          # timings at 1x / 10x / 100x corpus size
+"""
+
+import argparse
+import sys
+import time
+
+try:
+    import numpy as np
+    from scipy import sparse
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class VectorBM25:
+    """Sparse-matrix view of a fitted core.BM25 (same tokenizer and precomputed weights)"""
+
+    def __init__(self, bm25):
+        if not HAS_NUMPY:
+            raise ImportError("numpy and scipy are required for the vectorized BM25 backend")
+        self.bm25 = bm25
+        self.vocab = bm25.vocab
+
+        # The postings are a term-major CSR layout already, i.e. the V x N transpose
+        by_term = sparse.csr_matrix(
+            (np.frombuffer(bm25.weights, dtype=np.float64),
+             np.frombuffer(bm25.doc_ids, dtype=np.uint32).astype(np.int64),
+             np.frombuffer(bm25.offsets, dtype=np.uint32).astype(np.int64)),
+            shape=(len(self.vocab), bm25.N),
+        )
+        # N docs x V terms, each cell the full BM25 contribution of that term to that doc
+        self.matrix = by_term.T.tocsr()
+
+    def _query_matrix(self, token_lists, weight_lists=None):
+        """V x Q matrix of query term weights (repeated terms count repeatedly, as in BM25.score)"""
+        rows, cols, data = [], [], []
+        for q, query_tokens in enumerate(token_lists):
+            weights = weight_lists[q] if weight_lists else None
+            for i, token in enumerate(query_tokens):
+                j = self.vocab.get(token)
+                if j is not None:
+                    rows.append(j)
+                    cols.append(q)
+                    data.append(weights[i] if weights else 1.0)
+        # Duplicate (row, col) entries are summed on conversion
+        return sparse.csr_matrix((np.asarray(data, dtype=np.float64), (rows, cols)), shape=(len(self.vocab), len(token_lists)))
+
+    def score_many(self, queries, top_k=None):
+        """Score several queries at once; returns one [(idx, score), ...] list per query, best first"""
+        return self.score_many_tokens([self.bm25.tokenize(query) for query in queries], top_k)
+
+    def score_many_tokens(self, token_lists, top_k=None, weight_lists=None):
+        """score_many() for already tokenized queries, optionally with a weight per token"""
+        if not token_lists:
+            return []
+        if self.bm25.N == 0 or not self.vocab:
+            return [[] for _ in token_lists]
+
+        scores = (self.matrix @ self._query_matrix(token_lists, weight_lists)).toarray()
+        results = []
+        for q in range(len(token_lists)):
+            column = scores[:, q]
+            candidates = np.flatnonzero(column > 0)
+            if top_k is not None and len(candidates) > top_k:
+                # Partial select, then widen to every candidate tied with the k-th score
+                kth = np.argpartition(-column[candidates], top_k - 1)[top_k - 1]
+                candidates = candidates[column[candidates] >= column[candidates[kth]]]
+            # Highest score first; ties keep document order
+            order = np.lexsort((candidates, -column[candidates]))
+            ranked = [(int(candidates[i]), float(column[candidates[i]])) for i in order]
+            results.append(ranked[:top_k] if top_k is not None else ranked)
+        return results
+
+    def score(self, query, top_k=None):
+        return self.score_many([query], top_k)[0]
+
+    def score_tokens(self, query_tokens, top_k=None, weights=None):
+        return self.score_many_tokens([query_tokens], top_k, [weights] if weights else None)[0]
+
+    def expand_tokens(self, query_tokens):
+        return self.bm25.expand_tokens(query_tokens)
+
+
+# ============ PARITY CHECK ============
+_CHECK_QUERIES = [
+    "saas dashboard dark mode", "glassmorphism", "fintech crypto banking", "animation accessibility",
+    "elegant luxury serif", "layout responsive form", "beauty spa wellness service", "ecommerce landing hero",
+    "chart trend comparison", "react memo rerender", "icons lucide navigation", "aria focus outline",
+    "minimal minimal minimal clean", "zzz-no-match",
+]
+
+
+def _targets():
+    from core import CSV_CONFIG, STACK_CONFIG, _STACK_COLS, DATA_DIR, _load_csv
+    for cfg in CSV_CONFIG.values():
+        yield cfg["file"], _load_csv(DATA_DIR / cfg["file"]), cfg["search_cols"], cfg.get("field_weights")
+    for cfg in STACK_CONFIG.values():
+        yield cfg["file"], _load_csv(DATA_DIR / cfg["file"]), _STACK_COLS["search_cols"], _STACK_COLS["field_weights"]
+
+
+def _same_ranking(expected, actual, rel_tol=1e-9):
+    """Equal up to float summation order: same scores, and same ids except inside exact-score ties"""
+    if len(expected) != len(actual):
+        return False
+    for (e_idx, e_score), (a_idx, a_score) in zip(expected, actual):
+        if abs(e_score - a_score) > rel_tol * max(abs(e_score), 1.0):
+            return False
+        if e_idx != a_idx and not any(i == a_idx and abs(s - e_score) <= rel_tol * max(abs(e_score), 1.0) for i, s in expected):
+            return False
+    return True
+
+
+def check_parity(top_k=5):
+    """Compare VectorBM25 to core.BM25 for every CSV and query; returns list of mismatches"""
+    from core import fit_rows
+    mismatches = []
+    for name, data, search_cols, field_weights in _targets():
+        bm25 = fit_rows(data, search_cols, field_weights)
+        vector = VectorBM25(bm25)
+        batched = vector.score_many(_CHECK_QUERIES, top_k)
+        for query, actual in zip(_CHECK_QUERIES, batched):
+            expected = bm25.score(query, top_k=top_k)
+            if not _same_ranking(expected, actual):
+                mismatches.append((name, query, expected, actual))
+    return mismatches
+
+
+def benchmark(scales=(1, 10, 100), repeats=3):
+    """Time pure-Python vs vectorized scoring of all check queries on replicated corpora"""
+    from core import fit_rows
+    corpora = [(data, cols, weights) for _, data, cols, weights in _targets()]
+    print(f"{'scale':>6} {'docs':>8} {'python (ms)':>12} {'numpy (ms)':>11} {'speedup':>8}")
+    for scale in scales:
+        py_total = np_total = 0.0
+        docs_total = 0
+        for data, search_cols, field_weights in corpora:
+            bm25 = fit_rows(data * scale, search_cols, field_weights)
+            vector = VectorBM25(bm25)
+            docs_total += bm25.N
+
+            start = time.perf_counter()
+            for _ in range(repeats):
+                for query in _CHECK_QUERIES:
+                    bm25.score(query, top_k=3)
+            py_total += (time.perf_counter() - start) / repeats
+
+            start = time.perf_counter()
+            for _ in range(repeats):
+                vector.score_many(_CHECK_QUERIES, top_k=3)
+            np_total += (time.perf_counter() - start) / repeats
+        print(f"{scale:>5}x {docs_total:>8} {py_total * 1000:>12.2f} {np_total * 1000:>11.2f} {py_total / np_total:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vectorized BM25 backend")
+    parser.add_argument("--check", action="store_true", help="Verify parity with core.BM25")
+    parser.add_argument("--benchmark", action="store_true", help="Benchmark at 1x/10x/100x corpus size")
+    args = parser.parse_args()
+
+    if not HAS_NUMPY:
+        print("numpy and scipy are required: pip install numpy scipy")
+        sys.exit(1)
+    if not (args.check or args.benchmark):
+        parser.print_help()
+    if args.check:
+        mismatches = check_parity()
+        for name, query, expected, actual in mismatches:
+            print(f"❌ {name} | {query!r}\n   python: {expected}\n   numpy:  {actual}")
+        if mismatches:
+            sys.exit(1)
+        print("✅ Vectorized BM25 matches core.BM25 on all CSVs")
+    if args.benchmark:
+        benchmark()
@@ -5,69 +5,102 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import os
+import pickle
 import re
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from math import log
 from collections import defaultdict
 
+from spelling import DeletionIndex
+from tokenizer import Vocabulary, is_phrase, tokenize
+
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
+INDEX_DIR = Path(os.environ.get("UIPRO_INDEX_DIR", DATA_DIR / ".index"))
+INDEX_VERSION = 4
+# "numpy" scores through the sparse-matrix backend in bm25_numpy.py (needs numpy + scipy)
+BM25_BACKEND = os.environ.get("UIPRO_BM25_BACKEND", "python")
 MAX_RESULTS = 3
+# Multiplier on adjacent-word phrase terms ("dark mode") over single words
+PHRASE_BOOST = 1.5
+# Misspelled query words are expanded to vocabulary terms within edit distance 2,
+# each scoring TYPO_WEIGHT ** distance of an exact match
+TYPO_WEIGHT = 0.5
+
+# field_weights: BM25F weight per search column (unlisted columns weigh 1.0).
+# Short, curated columns (names, keywords) outrank long free-text ones.
 
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
         "search_cols": ["Style Category", "Keywords", "Best For", "Type"],
+        "field_weights": {"Style Category": 3.0, "Keywords": 2.0, "Best For": 1.0, "Type": 1.0},
         "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity"]
     },
     "prompt": {
         "file": "prompts.csv",
         "search_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords"],
+        "field_weights": {"Style Category": 3.0, "AI Prompt Keywords (Copy-Paste Ready)": 1.5, "CSS/Technical Keywords": 1.0},
         "output_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords", "Implementation Checklist"]
     },
     "color": {
         "file": "colors.csv",
         "search_cols": ["Product Type", "Keywords", "Notes"],
+        "field_weights": {"Product Type": 3.0, "Keywords": 2.0, "Notes": 1.0},
         "output_cols": ["Product Type", "Keywords", "Primary (Hex)", "Secondary (Hex)", "CTA (Hex)", "Background (Hex)", "Text (Hex)", "Border (Hex)", "Notes"]
     },
     "chart": {
         "file": "charts.csv",
         "search_cols": ["Data Type", "Keywords", "Best Chart Type", "Accessibility Notes"],
+        "field_weights": {"Data Type": 3.0, "Keywords": 2.0, "Best Chart Type": 1.5, "Accessibility Notes": 0.5},
         "output_cols": ["Data Type", "Keywords", "Best Chart Type", "Secondary Options", "Color Guidance", "Accessibility Notes", "Library Recommendation", "Interactive Level"]
     },
     "landing": {
         "file": "landing.csv",
         "search_cols": ["Pattern Name", "Keywords", "Conversion Optimization", "Section Order"],
+        "field_weights": {"Pattern Name": 3.0, "Keywords": 2.0, "Conversion Optimization": 1.0, "Section Order": 0.5},
         "output_cols": ["Pattern Name", "Keywords", "Section Order", "Primary CTA Placement", "Color Strategy", "Conversion Optimization"]
     },
     "product": {
         "file": "products.csv",
         "search_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Key Considerations"],
+        "field_weights": {"Product Type": 3.0, "Keywords": 2.0, "Primary Style Recommendation": 1.0, "Key Considerations": 0.5},
         "output_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Secondary Styles", "Landing Page Pattern", "Dashboard Style (if applicable)", "Color Palette Focus"]
     },
     "ux": {
         "file": "ux-guidelines.csv",
         "search_cols": ["Category", "Issue", "Description", "Platform"],
+        "field_weights": {"Category": 2.0, "Issue": 3.0, "Description": 1.0, "Platform": 0.5},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "typography": {
         "file": "typography.csv",
         "search_cols": ["Font Pairing Name", "Category", "Mood/Style Keywords", "Best For", "Heading Font", "Body Font"],
+        "field_weights": {"Font Pairing Name": 3.0, "Category": 1.0, "Mood/Style Keywords": 2.0, "Best For": 1.5, "Heading Font": 1.0, "Body Font": 1.0},
         "output_cols": ["Font Pairing Name", "Category", "Heading Font", "Body Font", "Mood/Style Keywords", "Best For", "Google Fonts URL", "CSS Import", "Tailwind Config", "Notes"]
     },
     "icons": {
         "file": "icons.csv",
         "search_cols": ["Category", "Icon Name", "Keywords", "Best For"],
+        "field_weights": {"Category": 1.5, "Icon Name": 3.0, "Keywords": 2.0, "Best For": 1.0},
         "output_cols": ["Category", "Icon Name", "Keywords", "Library", "Import Code", "Usage", "Best For", "Style"]
     },
     "react": {
         "file": "react-performance.csv",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "field_weights": {"Category": 1.5, "Issue": 3.0, "Keywords": 2.0, "Description": 1.0},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "web": {
         "file": "web-interface.csv",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "field_weights": {"Category": 1.5, "Issue": 3.0, "Keywords": 2.0, "Description": 1.0},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     }
 }
@@ -90,6 +123,7 @@ STACK_CONFIG = {
 # Common columns for all stacks
 _STACK_COLS = {
     "search_cols": ["Category", "Guideline", "Description", "Do", "Don't"],
+    "field_weights": {"Category": 1.5, "Guideline": 3.0, "Description": 1.0, "Do": 0.5, "Don't": 0.5},
     "output_cols": ["Category", "Guideline", "Description", "Do", "Don't", "Code Good", "Code Bad", "Severity", "Docs URL"]
 }
 
@@ -98,65 +132,330 @@ AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """BM25F ranking (per-field weights, phrase terms) over an inverted index"""
 
     def __init__(self, k1=1.5, b=0.75):
         self.k1 = k1
         self.b = b
-        self.corpus = []
-        self.doc_lengths = []
-        self.avgdl = 0
-        self.idf = {}
-        self.doc_freqs = defaultdict(int)
+        self.vocab = Vocabulary()
+        # Postings in CSR layout: term id t owns doc_ids/weights[offsets[t]:offsets[t + 1]]
+        self.offsets = array("I", [0])
+        self.doc_ids = array("I")
+        self.weights = array("d")
+        self.idf = array("d")
         self.N = 0
 
     def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
-
-    def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        """Shared tokenizer (see tokenizer.py)"""
+        return tokenize(text)
+
+    def fit(self, documents, weights=None):
+        """Build postings (term id -> doc ids + weights) with each term's full score precomputed.
+
+        A document is a string or a list of field strings, with `weights` giving one
+        weight per field. Field term frequencies are length-normalized per field and
+        weighted before saturation (BM25F), so a hit in a short, heavy field wins.
+        """
+        docs = [[self.tokenize(doc)] if isinstance(doc, str) else [self.tokenize(text) for text in doc] for doc in documents]
+        self.N = len(docs)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
-        self.avgdl = sum(self.doc_lengths) / self.N
-
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
-
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+        n_fields = max(len(doc) for doc in docs)
+        weights = list(weights) if weights else [1.0] * n_fields
+        avg_lengths = [sum(len(doc[f]) for doc in docs if f < len(doc)) / self.N or 1.0 for f in range(n_fields)]
+
+        doc_freqs = defaultdict(int)
+        term_weights = []
+        for doc in docs:
+            tf = defaultdict(float)
+            for f, tokens in enumerate(doc):
+                if not tokens:
+                    continue
+                field_tf = weights[f] / (1 - self.b + self.b * len(tokens) / avg_lengths[f])
+                for token in tokens:
+                    tf[token] += field_tf
+            term_weights.append(tf)
+            for token in tf:
+                doc_freqs[token] += 1
+
+        self.vocab = Vocabulary(doc_freqs)
+        self.idf = array("d", (log((self.N - freq + 0.5) / (freq + 0.5) + 1) for freq in doc_freqs.values()))
+
+        postings = [[] for _ in range(len(self.vocab))]
+        for idx, tf in enumerate(term_weights):
+            for token, weight in tf.items():
+                term_id = self.vocab.get(token)
+                boost = PHRASE_BOOST if is_phrase(token) else 1.0
+                postings[term_id].append((idx, boost * self.idf[term_id] * weight * (self.k1 + 1) / (weight + self.k1)))
+
+        self.offsets = array("I", [0])
+        self.doc_ids = array("I")
+        self.weights = array("d")
+        for plist in postings:
+            self.doc_ids.extend(idx for idx, _ in plist)
+            self.weights.extend(weight for _, weight in plist)
+            self.offsets.append(len(self.doc_ids))
+
+    def doc_freqs(self):
+        """Single-word term -> number of documents containing it"""
+        return {term: self.offsets[i + 1] - self.offsets[i] for i, term in enumerate(self.vocab.terms) if not is_phrase(term)}
+
+    def expand_tokens(self, query_tokens):
+        """Replace misspelled query words by their nearest vocabulary terms.
+
+        A word counts as misspelled only if no CSV knows it (see spelling_index()).
+        Returns (tokens, weights, expansions): expanded terms are down-weighted by
+        TYPO_WEIGHT ** distance and reported as {typo: [terms]}. Phrases are rebuilt
+        from corrected words when the corrected phrase is indexed.
+        """
+        tokens, weights, expansions, corrected = [], [], {}, {}
+        known = None
+        for token in query_tokens:
+            if token in self.vocab:
+                tokens.append(token)
+                weights.append(1.0)
+                continue
+            if is_phrase(token) or token in expansions:
+                continue
+            if known is None:
+                known = global_vocabulary()
+            if token not in known:
+                distance, terms = spelling_index().lookup(token)
+                terms = [term for term in terms if term in self.vocab]
+                if terms:
+                    expansions[token] = terms
+                    corrected[token] = terms[0]
+                    tokens += terms
+                    weights += [TYPO_WEIGHT ** distance] * len(terms)
+
+        for token in query_tokens:
+            if is_phrase(token) and token not in self.vocab:
+                first, second = token.split(" ")
+                phrase = f"{corrected.get(first, first)} {corrected.get(second, second)}"
+                if phrase != token and phrase in self.vocab:
+                    tokens.append(phrase)
+                    weights.append(TYPO_WEIGHT)
+        return tokens, weights, expansions
+
+    def score(self, query, top_k=None):
+        """Score documents containing any query term; returns (idx, score) best first"""
+        return self.score_tokens(self.tokenize(query), top_k)
+
+    def score_tokens(self, query_tokens, top_k=None, weights=None):
+        """score() for an already tokenized query, optionally with a weight per token"""
+        scores = {}
+        for i, token in enumerate(query_tokens):
+            term_id = self.vocab.get(token)
+            if term_id is None:
+                continue
+            token_weight = weights[i] if weights else 1.0
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            for idx, weight in zip(self.doc_ids[start:end], self.weights[start:end]):
+                scores[idx] = scores.get(idx, 0) + weight * token_weight
+
+        # Highest score first; ties keep document order
+        rank_key = lambda x: (x[1], -x[0])
+        if top_k is not None:
+            return heapq.nlargest(top_k, scores.items(), key=rank_key)
+        return sorted(scores.items(), key=rank_key, reverse=True)
+
+    def to_dict(self):
+        """Serialize fitted state to plain builtins (for the on-disk index)"""
+        return {"k1": self.k1, "b": self.b, "terms": self.vocab.terms, "offsets": self.offsets,
+                "doc_ids": self.doc_ids, "weights": self.weights, "idf": self.idf, "N": self.N}
+
+    @classmethod
+    def from_dict(cls, state):
+        bm25 = cls(state["k1"], state["b"])
+        bm25.vocab = Vocabulary(state["terms"])
+        bm25.offsets = state["offsets"]
+        bm25.doc_ids = state["doc_ids"]
+        bm25.weights = state["weights"]
+        bm25.idf = state["idf"]
+        bm25.N = state["N"]
+        return bm25
+
+
+# ============ PERSISTENT INDEX ============
+# One prebuilt index per CSV in INDEX_DIR, holding the fitted BM25 state and the
+# output rows. Stale indexes are detected by CSV mtime/size, then content hash.
+_INDEX_CACHE = {}
+_SPELLING_CACHE = {}
+
+
+def _index_name(filepath):
+    """Stable index file name for a CSV (e.g. stacks/react.csv -> stacks__react)"""
+    return str(Path(filepath).relative_to(DATA_DIR).with_suffix("")).replace(os.sep, "__")
+
+
+def _file_hash(filepath):
+    return hashlib.sha1(Path(filepath).read_bytes()).hexdigest()
+
+
+def fit_rows(data, search_cols, field_weights=None):
+    """Fit a BM25 over CSV rows, one field per search column"""
+    bm25 = BM25()
+    bm25.fit(
+        [[str(row.get(col, "")) for col in search_cols] for row in data],
+        [(field_weights or {}).get(col, 1.0) for col in search_cols],
+    )
+    return bm25
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
+def _build_index(filepath, search_cols, output_cols, field_weights=None):
+    """Tokenize and fit a CSV; returns the serializable index payload"""
+    data = _load_csv(filepath)
+    bm25 = fit_rows(data, search_cols, field_weights)
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    stat = filepath.stat()
+    return {
+        "version": INDEX_VERSION,
+        "config": [list(search_cols), list(output_cols), dict(field_weights or {})],
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha1": _file_hash(filepath),
+        "bm25": bm25.to_dict(),
+        "rows": [{col: row.get(col, "") for col in output_cols if col in row} for row in data],
+    }
 
-            scores.append((idx, score))
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+def _read_index(index_path):
+    """The stored payload, or None when it is missing or cannot be unpickled (treated as stale)"""
+    try:
+        with open(index_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_index(index_path, payload):
+    """Atomic write; a read-only checkout just keeps the in-memory index"""
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer thread: load_index runs on a thread pool
+        tmp_path = index_path.with_suffix(f".tmp{os.getpid()}-{threading.get_ident()}")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        pass
+
+
+def _make_scorer(bm25):
+    """Wrap a fitted BM25 in the configured backend; both expose score(query, top_k)"""
+    if BM25_BACKEND == "numpy":
+        from bm25_numpy import HAS_NUMPY, VectorBM25
+        if HAS_NUMPY:
+            return VectorBM25(bm25)
+    return bm25
+
+
+def load_index(filepath, search_cols, output_cols, field_weights=None, force=False):
+    """Return (scorer, rows) for a CSV, loading the prebuilt index or (re)building it"""
+    filepath = Path(filepath)
+    stat = filepath.stat()
+    config = [list(search_cols), list(output_cols), dict(field_weights or {})]
+    name = _index_name(filepath)
+
+    cached = _INDEX_CACHE.get(name)
+    if not force and cached and cached[0] == (stat.st_mtime_ns, stat.st_size) and cached[1] == config:
+        return cached[2], cached[3]
+    if cached:
+        # A CSV changed under a running process: the cross-CSV vocabulary is stale too
+        _SPELLING_CACHE.clear()
+
+    index_path = INDEX_DIR / f"{name}.idx"
+    payload = None if force else _read_index(index_path)
+
+    if payload and (payload.get("version") != INDEX_VERSION or payload.get("config") != config):
+        payload = None
+    if payload and (payload["mtime_ns"], payload["size"]) != (stat.st_mtime_ns, stat.st_size):
+        # Touched but possibly unchanged (e.g. fresh checkout): compare content
+        if payload["sha1"] == _file_hash(filepath):
+            payload["mtime_ns"], payload["size"] = stat.st_mtime_ns, stat.st_size
+            _write_index(index_path, payload)
+        else:
+            payload = None
+    if payload is None:
+        payload = _build_index(filepath, search_cols, output_cols, field_weights)
+        _write_index(index_path, payload)
+
+    scorer = _make_scorer(BM25.from_dict(payload["bm25"]))
+    _INDEX_CACHE[name] = ((stat.st_mtime_ns, stat.st_size), config, scorer, payload["rows"])
+    return scorer, payload["rows"]
+
+
+def _index_targets():
+    """(filepath, search_cols, output_cols, field_weights) for every existing domain and stack CSV"""
+    targets = [(DATA_DIR / cfg["file"], cfg["search_cols"], cfg["output_cols"], cfg.get("field_weights")) for cfg in CSV_CONFIG.values()]
+    targets += [(DATA_DIR / cfg["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], _STACK_COLS["field_weights"])
+                for cfg in STACK_CONFIG.values()]
+    return [target for target in targets if target[0].exists()]
+
+
+def build_indexes(force=False):
+    """Prebuild indexes for every domain and stack CSV; returns the names processed"""
+    built = []
+    for filepath, search_cols, output_cols, field_weights in _index_targets():
+        load_index(filepath, search_cols, output_cols, field_weights, force=force)
+        built.append(_index_name(filepath))
+    global_vocabulary(force=force)
+    spelling_index(force=force)
+    return built
+
+
+# ============ SPELLING ============
+# Typo expansion works against the vocabulary of every CSV: a word any CSV knows
+# is never "corrected". Both the vocabulary (checked on most queries) and its
+# deletion index (needed only for real typos) are persisted next to the indexes
+# and rebuilt when any CSV changes. In memory they are validated once per
+# process, then dropped whenever load_index() sees a CSV change.
+
+
+def _corpus_stamps():
+    stamps = {}
+    for filepath, _, _, _ in _index_targets():
+        stat = filepath.stat()
+        stamps[_index_name(filepath)] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def _load_spelling_part(name, build, wrap=None, force=False):
+    """Load or rebuild one persisted spelling structure, keyed by the CSV stamps"""
+    if not force and name in _SPELLING_CACHE:
+        return _SPELLING_CACHE[name]
+
+    stamps = _corpus_stamps()
+    index_path = INDEX_DIR / f"_{name}.idx"
+    payload = None if force else _read_index(index_path)
+    if not payload or payload.get("version") != INDEX_VERSION or payload.get("stamps") != stamps:
+        payload = {"version": INDEX_VERSION, "stamps": stamps, "data": build()}
+        _write_index(index_path, payload)
+    value = wrap(payload["data"]) if wrap else payload["data"]
+    _SPELLING_CACHE[name] = value
+    return value
+
+
+def _build_global_vocabulary():
+    doc_freqs = defaultdict(int)
+    for filepath, search_cols, output_cols, field_weights in _index_targets():
+        scorer, _ = load_index(filepath, search_cols, output_cols, field_weights)
+        for term, freq in getattr(scorer, "bm25", scorer).doc_freqs().items():
+            doc_freqs[term] += freq
+    return dict(doc_freqs)
+
+
+def global_vocabulary(force=False):
+    """Single-word term -> document frequency, summed over every CSV"""
+    return _load_spelling_part("vocabulary", _build_global_vocabulary, force=force)
+
+
+def spelling_index(force=False):
+    """DeletionIndex over global_vocabulary(), ranking corrections by frequency"""
+    def build():
+        doc_freqs = global_vocabulary()
+        return DeletionIndex(doc_freqs, doc_freqs).to_dict()
+    return _load_spelling_part("spelling", build, DeletionIndex.from_dict, force)
 
 
 # ============ SEARCH FUNCTIONS ============
@@ -166,36 +465,26 @@ def _load_csv(filepath):
         return list(csv.DictReader(f))
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
+def _search_csv(filepath, search_cols, output_cols, query, max_results, field_weights=None):
+    """Core search function using BM25F; returns (results, typo expansions)"""
     if not filepath.exists():
-        return []
-
-    data = _load_csv(filepath)
+        return [], {}
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
-
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+    # BM25F search over the prebuilt index, with misspelled words expanded
+    scorer, rows = load_index(filepath, search_cols, output_cols, field_weights)
+    tokens, weights, expansions = scorer.expand_tokens(tokenize(query))
+    ranked = scorer.score_tokens(tokens, max_results, weights)
 
     # Get top results with score > 0
     results = []
-    for idx, score in ranked[:max_results]:
+    for idx, score in ranked:
         if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+            results.append(dict(rows[idx]))
 
-    return results
+    return results, expansions
 
 
-def detect_domain(query):
-    """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
-
-    domain_keywords = {
+_DOMAIN_KEYWORDS = {
         "color": ["color", "palette", "hex", "#", "rgb"],
         "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
         "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
@@ -207,10 +496,24 @@ def detect_domain(query):
         "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
         "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
         "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
-    }
+}
+_domain_spelling = None
+
 
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
+def detect_domain(query):
+    """Auto-detect the most relevant domain from query"""
+    global _domain_spelling
+    query_lower = query.lower()
+
+    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in _DOMAIN_KEYWORDS.items()}
     best = max(scores, key=scores.get)
+    if scores[best] == 0:
+        # No keyword hit: retry with misspelled words corrected against the keywords
+        if _domain_spelling is None:
+            _domain_spelling = DeletionIndex(word for keywords in _DOMAIN_KEYWORDS.values() for kw in keywords for word in re.findall(r"\w+", kw))
+        corrected = " ".join(terms[0] for terms in (_domain_spelling.lookup(w)[1] for w in re.findall(r"\w+", query_lower)) if terms)
+        scores = {domain: sum(1 for kw in keywords if kw in corrected) for domain, keywords in _DOMAIN_KEYWORDS.items()}
+        best = max(scores, key=scores.get)
     return best if scores[best] > 0 else "style"
 
 
@@ -225,15 +528,74 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"File not found: {filepath}", "domain": domain}
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    results, expansions = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results, config.get("field_weights"))
 
-    return {
+    response = {
         "domain": domain,
         "query": query,
         "file": config["file"],
         "count": len(results),
         "results": results
     }
+    if expansions:
+        response["expansions"] = expansions
+    return response
+
+
+def search_batch(requests, max_workers=None):
+    """Run many (query, domain, max_results) searches in one pass.
+
+    Requests are grouped per domain index, each distinct query is tokenized once,
+    and domains are scored concurrently. Returns search()-shaped dicts in request order.
+    """
+    requests = [(query, domain or detect_domain(query), max_results) for query, domain, max_results in requests]
+    tokens = {query: tokenize(query) for query in {r[0] for r in requests}}
+
+    groups = defaultdict(list)
+    for i, (query, domain, max_results) in enumerate(requests):
+        groups[domain].append((i, query, max_results))
+
+    def run_domain(domain, items):
+        config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            return [(i, {"error": f"File not found: {filepath}", "domain": domain}) for i, _, _ in items]
+
+        scorer, rows = load_index(filepath, config["search_cols"], config["output_cols"], config.get("field_weights"))
+        # One scoring pass per distinct query, at the largest k asked for it
+        top_k = {}
+        for _, query, max_results in items:
+            top_k[query] = max(top_k.get(query, 0), max_results)
+        queries = list(top_k)
+        expanded = [scorer.expand_tokens(tokens[q]) for q in queries]
+        if hasattr(scorer, "score_many_tokens"):
+            ranked = scorer.score_many_tokens([e[0] for e in expanded], max(top_k.values()), [e[1] for e in expanded])
+        else:
+            ranked = [scorer.score_tokens(e[0], top_k[q], e[1]) for q, e in zip(queries, expanded)]
+        ranked = dict(zip(queries, ranked))
+        expansions = {q: e[2] for q, e in zip(queries, expanded)}
+
+        out = []
+        for i, query, max_results in items:
+            results = [dict(rows[idx]) for idx, score in ranked[query][:max_results] if score > 0]
+            response = {
+                "domain": domain,
+                "query": query,
+                "file": config["file"],
+                "count": len(results),
+                "results": results
+            }
+            if expansions[query]:
+                response["expansions"] = expansions[query]
+            out.append((i, response))
+        return out
+
+    responses = [None] * len(requests)
+    with ThreadPoolExecutor(max_workers=max_workers or len(groups) or 1) as pool:
+        for out in pool.map(lambda item: run_domain(*item), groups.items()):
+            for i, result in out:
+                responses[i] = result
+    return responses
 
 
 def search_stack(query, stack, max_results=MAX_RESULTS):
@@ -246,9 +608,9 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    results, expansions = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results, _STACK_COLS["field_weights"])
 
-    return {
+    response = {
         "domain": "stack",
         "stack": stack,
         "query": query,
@@ -256,3 +618,6 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+    if expansions:
+        response["expansions"] = expansions
+    return response
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Daemon - keeps every index in memory and serves search,
+stack search and design-system requests as line-delimited JSON over a Unix
+domain socket (localhost TCP where Unix sockets are unavailable).
+
+Usage:
+    python daemon.py start [--idle-timeout 1800]   # detach into the background
+    python daemon.py run                           # serve in the foreground
+    python daemon.py status | stop
+
+Client side, search.py goes through call(): it talks to the daemon when one is
+running and silently falls back to in-process search when it is not.
+
+Each kit checkout gets its own daemon: the socket name carries a hash of this
+scripts directory, the data directory and INDEX_VERSION, and `ping` answers
+with that identity. A daemon serving another tree (a shared UIPRO_SOCKET or
+TCP port, an older copy of the kit) is ignored and the search runs in-process.
+
+Protocol (one JSON object per line, each way):
+    -> {"op": "search", "args": {"query": "saas", "domain": "style", "max_results": 3}}
+    <- {"ok": true, "result": {...}}
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from core import DATA_DIR, INDEX_VERSION
+
+IDENTITY = hashlib.blake2b(
+    f"{Path(__file__).resolve().parent}\0{DATA_DIR.resolve()}\0{INDEX_VERSION}".encode("utf-8"), digest_size=6
+).hexdigest()
+HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+SOCKET_PATH = os.environ.get("UIPRO_SOCKET") or str(
+    Path(tempfile.gettempdir()) / f"uipro-search-{os.getuid() if hasattr(os, 'getuid') else 'user'}-{IDENTITY}.sock"
+)
+TCP_ADDRESS = ("127.0.0.1", int(os.environ.get("UIPRO_PORT", "47631")))
+CONNECT_TIMEOUT = 0.2
+IDLE_TIMEOUT = 1800
+
+
+# ============ CLIENT ============
+def request(op, args=None, timeout=30.0):
+    """Send one request to the daemon. Raises OSError if no daemon is listening."""
+    if HAS_UNIX_SOCKETS:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = SOCKET_PATH
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = TCP_ADDRESS
+
+    with sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(address)
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps({"op": op, "args": args or {}}).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+
+    if not line:
+        raise ConnectionError("daemon closed the connection")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error", "daemon error"))
+    return response["result"]
+
+
+_matches = None
+
+
+def _daemon_matches():
+    """Whether the listening daemon serves this tree; a mismatch is remembered for the process"""
+    global _matches
+    if _matches is None:
+        try:
+            _matches = request("ping", timeout=1.0) == IDENTITY
+        except (OSError, ConnectionError, ValueError, RuntimeError):
+            return False
+    return _matches
+
+
+def call(op, **kwargs):
+    """Run an op on the daemon if it is up and serves this tree, otherwise in this process"""
+    if os.environ.get("UIPRO_NO_DAEMON") != "1" and _daemon_matches():
+        try:
+            return request(op, kwargs)
+        except (OSError, ConnectionError, ValueError):
+            pass
+    return _ops()[op](**kwargs)
+
+
+# ============ SERVER ============
+def _ops():
+    from core import search, search_stack, search_batch
+    from design_system import generate_design_system
+
+    return {
+        "ping": lambda: IDENTITY,
+        "search": search,
+        "search_stack": search_stack,
+        "search_batch": lambda requests, max_workers=None: search_batch([tuple(r) for r in requests], max_workers),
+        "design_system": generate_design_system,
+    }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.server.last_request = time.monotonic()
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            message = json.loads(line)
+            op = message.get("op")
+            if op == "shutdown":
+                response = {"ok": True, "result": "bye"}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            elif op in self.server.ops:
+                response = {"ok": True, "result": self.server.ops[op](**message.get("args", {}))}
+            else:
+                response = {"ok": False, "error": f"Unknown op: {op}"}
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+if HAS_UNIX_SOCKETS:
+    class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+else:
+    class _Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+        daemon_threads = True
+        allow_reuse_address = True
+
+
+def _watch_idle(server, idle_timeout):
+    while True:
+        time.sleep(min(idle_timeout, 30))
+        if time.monotonic() - server.last_request > idle_timeout:
+            server.shutdown()
+            return
+
+
+def serve(idle_timeout=IDLE_TIMEOUT):
+    """Load all indexes and serve until shutdown or `idle_timeout` seconds without requests"""
+    from core import build_indexes
+
+    build_indexes()
+    ops = _ops()
+
+    if HAS_UNIX_SOCKETS:
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+        server = _Server(SOCKET_PATH, _Handler)
+        os.chmod(SOCKET_PATH, 0o600)
+    else:
+        server = _Server(TCP_ADDRESS, _Handler)
+
+    server.ops = ops
+    server.last_request = time.monotonic()
+    if idle_timeout:
+        threading.Thread(target=_watch_idle, args=(server, idle_timeout), daemon=True).start()
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if HAS_UNIX_SOCKETS and os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+
+
+def is_running():
+    """Whether a daemon for this tree is answering"""
+    try:
+        return request("ping", timeout=1.0) == IDENTITY
+    except (OSError, ConnectionError, ValueError, RuntimeError):
+        return False
+
+
+def start(idle_timeout=IDLE_TIMEOUT, wait=10.0):
+    """Spawn a detached daemon and wait until it answers"""
+    if is_running():
+        return True
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "run", "--idle-timeout", str(idle_timeout)],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if is_running():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search daemon")
+    parser.add_argument("command", choices=["start", "run", "status", "stop"])
+    parser.add_argument("--idle-timeout", type=int, default=IDLE_TIMEOUT, help="Exit after N idle seconds (0 = never)")
+    args = parser.parse_args()
+
+    address = SOCKET_PATH if HAS_UNIX_SOCKETS else "%s:%d" % TCP_ADDRESS
+    if args.command == "run":
+        serve(args.idle_timeout)
+    elif args.command == "start":
+        if start(args.idle_timeout):
+            print(f"✅ Search daemon running on {address}")
+        else:
+            print("❌ Search daemon failed to start")
+            sys.exit(1)
+    elif args.command == "status":
+        print(f"✅ Running on {address}" if is_running() else "⏹  Not running")
+    elif args.command == "stop":
+        try:
+            request("shutdown")
+            print("⏹  Search daemon stopped")
+        except (OSError, ConnectionError, ValueError):
+            print("⏹  Not running")
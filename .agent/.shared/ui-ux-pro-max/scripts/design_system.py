@@ -11,18 +11,25 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+    result = generate_design_system("SaaS dashboard", "My Project", persist=True, page=["dashboard", "settings"])
 """
 
 import csv
+import hashlib
 import json
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, search_batch, DATA_DIR
 
 
 # ============ CONFIGURATION ============
 REASONING_FILE = "ui-reasoning.csv"
+REASONING_CACHE_SIZE = 256
 
 SEARCH_CONFIG = {
     "product": {"max_results": 1},
@@ -33,91 +40,135 @@ SEARCH_CONFIG = {
 }
 
 
+# ============ REASONING RULES ============
+DEFAULT_REASONING = {
+    "pattern": "Hero + Features + CTA",
+    "style_priority": ["Minimalism", "Flat Design"],
+    "color_mood": "Professional",
+    "typography_mood": "Clean",
+    "key_effects": "Subtle hover transitions",
+    "anti_patterns": "",
+    "decision_rules": {},
+    "severity": "MEDIUM"
+}
+
+
+def _parse_rule(rule: dict) -> dict:
+    """Turn a reasoning CSV row into the reasoning dict used by generate()."""
+    decision_rules = {}
+    try:
+        decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
+    except json.JSONDecodeError:
+        pass
+
+    return {
+        "pattern": rule.get("Recommended_Pattern", ""),
+        "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
+        "color_mood": rule.get("Color_Mood", ""),
+        "typography_mood": rule.get("Typography_Mood", ""),
+        "key_effects": rule.get("Key_Effects", ""),
+        "anti_patterns": rule.get("Anti_Patterns", ""),
+        "decision_rules": decision_rules,
+        "severity": rule.get("Severity", "MEDIUM")
+    }
+
+
+class ReasoningIndex:
+    """Reasoning rules compiled for lookup by product category.
+
+    Matching order is exact name, then substring either way, then any word of a
+    rule's category appearing in the query category; the first rule in CSV order
+    wins at each stage. Lookups are memoized per category.
+    """
+
+    def __init__(self, rules: list):
+        self.rules = rules
+        self.parsed = [_parse_rule(rule) for rule in rules]
+        self.categories = [rule.get("UI_Category", "").lower() for rule in rules]
+
+        self.exact = {}
+        self.keywords = {}
+        for i, ui_cat in enumerate(self.categories):
+            self.exact.setdefault(ui_cat, i)
+            # Only the earliest rule per keyword can ever win
+            for kw in ui_cat.replace("/", " ").replace("-", " ").split():
+                self.keywords.setdefault(kw, i)
+
+        self.find = lru_cache(maxsize=REASONING_CACHE_SIZE)(self._find)
+
+    def _find(self, category_lower: str):
+        """Index of the matching rule, or None."""
+        if category_lower in self.exact:
+            return self.exact[category_lower]
+
+        for i, ui_cat in enumerate(self.categories):
+            if ui_cat in category_lower or category_lower in ui_cat:
+                return i
+
+        matches = [i for kw, i in self.keywords.items() if kw in category_lower]
+        return min(matches) if matches else None
+
+    def rule(self, category: str) -> dict:
+        i = self.find(category.lower())
+        return self.rules[i] if i is not None else {}
+
+    def reasoning(self, category: str) -> dict:
+        """Parsed reasoning for a category (a copy, safe to modify)."""
+        i = self.find(category.lower())
+        parsed = self.parsed[i] if i is not None else DEFAULT_REASONING
+        return {**parsed, "style_priority": list(parsed["style_priority"]), "decision_rules": dict(parsed["decision_rules"])}
+
+
+def _load_reasoning() -> list:
+    """Load reasoning rules from CSV."""
+    filepath = DATA_DIR / REASONING_FILE
+    if not filepath.exists():
+        return []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+@lru_cache(maxsize=1)
+def _compile_reasoning(stamp) -> ReasoningIndex:
+    return ReasoningIndex(_load_reasoning())
+
+
+def reasoning_index() -> ReasoningIndex:
+    """Compiled reasoning rules, rebuilt only when the CSV changes."""
+    filepath = DATA_DIR / REASONING_FILE
+    stat = filepath.stat() if filepath.exists() else None
+    return _compile_reasoning((stat.st_mtime_ns, stat.st_size) if stat else None)
+
+
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
     def __init__(self):
-        self.reasoning_data = self._load_reasoning()
-
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
-        filepath = DATA_DIR / REASONING_FILE
-        if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
+        self.reasoning = reasoning_index()
+        self.reasoning_data = self.reasoning.rules
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
+    def _multi_domain_search(self, query: str, style_priority: list = None, skip: tuple = ()) -> dict:
+        """Execute searches across multiple domains as one batch."""
+        requests = []
         for domain, config in SEARCH_CONFIG.items():
+            if domain in skip:
+                continue
             if domain == "style" and style_priority:
                 # For style, also search with priority keywords
                 priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
+                requests.append((f"{query} {priority_query}", domain, config["max_results"]))
             else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
+                requests.append((query, domain, config["max_results"]))
+        return {domain: result for (_, domain, _), result in zip(requests, search_batch(requests))}
 
     def _find_reasoning_rule(self, category: str) -> dict:
         """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
-
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
+        return self.reasoning.rule(category)
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
-
-        if not rule:
-            return {
-                "pattern": "Hero + Features + CTA",
-                "style_priority": ["Minimalism", "Flat Design"],
-                "color_mood": "Professional",
-                "typography_mood": "Clean",
-                "key_effects": "Subtle hover transitions",
-                "anti_patterns": "",
-                "decision_rules": {},
-                "severity": "MEDIUM"
-            }
-
-        # Parse decision rules JSON
-        decision_rules = {}
-        try:
-            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
-            pass
-
-        return {
-            "pattern": rule.get("Recommended_Pattern", ""),
-            "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
-            "color_mood": rule.get("Color_Mood", ""),
-            "typography_mood": rule.get("Typography_Mood", ""),
-            "key_effects": rule.get("Key_Effects", ""),
-            "anti_patterns": rule.get("Anti_Patterns", ""),
-            "decision_rules": decision_rules,
-            "severity": rule.get("Severity", "MEDIUM")
-        }
+        return self.reasoning.reasoning(category)
 
     def _select_best_match(self, results: list, priority_keywords: list) -> dict:
         """Select best matching result based on priority keywords."""
@@ -174,7 +225,7 @@ class DesignSystemGenerator:
         style_priority = reasoning.get("style_priority", [])
 
         # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
+        search_results = self._multi_domain_search(query, style_priority, skip=("product",))
         search_results["product"] = product_result  # Reuse product search
 
         # Step 4: Select best matches from each domain using priority
@@ -460,7 +511,7 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page=None, output_dir: str = None) -> str:
     """
     Main entry point for design system generation.
 
@@ -469,7 +520,7 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         project_name: Optional project name for output header
         output_format: "ascii" (default) or "markdown"
         persist: If True, save design system to design-system/ folder
-        page: Optional page name for page-specific override file
+        page: Optional page name (or list of page names) for page-specific override files
         output_dir: Optional output directory (defaults to current working directory)
 
     Returns:
@@ -488,18 +539,49 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
 
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+# The "Generated:" timestamp line is ignored when deciding whether a file changed
+_TIMESTAMP_LINE_RE = re.compile(r"^.*\*\*Generated:\*\*.*$", re.MULTILINE)
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha1(_TIMESTAMP_LINE_RE.sub("", content).encode("utf-8")).hexdigest()
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write content unless the file already holds it. Returns True if written."""
+    try:
+        if _content_hash(path.read_text(encoding="utf-8")) == _content_hash(content):
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    # Unique per writer thread, so concurrent writes never share a temp file
+    tmp_path = path.with_name(f".{path.name}.tmp{os.getpid()}-{threading.get_ident()}")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return True
+
+
+def persist_design_system(design_system: dict, page=None, output_dir: str = None, page_query: str = None,
+                          max_workers: int = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
     
     Args:
         design_system: The generated design system dictionary
-        page: Optional page name for page-specific override file
+        page: Optional page name, or list of page names, for page-specific override files
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        max_workers: Threads used to render and write page overrides
     
     Returns:
-        dict with created file paths and status
+        dict with written file paths, unchanged (skipped) file paths and status
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
     
@@ -510,32 +592,35 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     design_system_dir = base_dir / "design-system" / project_slug
     pages_dir = design_system_dir / "pages"
     
-    created_files = []
-    
     # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
     pages_dir.mkdir(parents=True, exist_ok=True)
     
-    master_file = design_system_dir / "MASTER.md"
-    
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
-    
-    # If page is specified, create page override file with intelligent content
-    if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
-    
+    # MASTER.md first, then every page override from one batched search pass
+    targets = [(design_system_dir / "MASTER.md", format_master_md(design_system))]
+    # One override per file: names that only differ in case or surrounding spaces
+    # share a slug, and the first of them wins
+    pages = {}
+    for page_name in ([page] if isinstance(page, str) else page or []):
+        pages.setdefault(page_name.strip().lower().replace(' ', '-'), page_name)
+    if pages:
+        all_overrides = _generate_intelligent_overrides_batch(list(pages.values()), page_query)
+
+        def render(item):
+            (slug, page_name), overrides = item
+            return pages_dir / f"{slug}.md", format_page_override_md(design_system, page_name, page_query, overrides)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            targets += pool.map(render, zip(pages.items(), all_overrides))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        written = list(pool.map(lambda target: _write_if_changed(*target), targets))
+
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": [str(path) for (path, _), changed in zip(targets, written) if changed],
+        "unchanged_files": [str(path) for (path, _), changed in zip(targets, written) if not changed]
     }
 
 
@@ -802,14 +887,15 @@ def format_master_md(design_system: dict) -> str:
     return "\n".join(lines)
 
 
-def format_page_override_md(design_system: dict, page_name: str, page_query: str = None) -> str:
+def format_page_override_md(design_system: dict, page_name: str, page_query: str = None, page_overrides: dict = None) -> str:
     """Format a page-specific override file with intelligent AI-generated content."""
     project = design_system.get("project_name", "PROJECT")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     page_title = page_name.replace("-", " ").replace("_", " ").title()
     
-    # Detect page type and generate intelligent overrides
-    page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
+    # Detect page type and generate intelligent overrides (unless precomputed in a batch)
+    if page_overrides is None:
+        page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
     
     lines = []
     
@@ -911,6 +997,10 @@ def format_page_override_md(design_system: dict, page_name: str, page_query: str
     return "\n".join(lines)
 
 
+# Per-page searches behind the overrides: (domain, max_results)
+OVERRIDE_SEARCHES = [("style", 1), ("ux", 3), ("landing", 1)]
+
+
 def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict) -> dict:
     """
     Generate intelligent overrides based on page type using layered search.
@@ -918,22 +1008,32 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
-    page_lower = page_name.lower()
+    return _generate_intelligent_overrides_batch([page_name], page_query)[0]
+
+
+def _generate_intelligent_overrides_batch(page_names: list, page_query: str = None) -> list:
+    """Overrides for many pages, with every page's searches run as one batch."""
     query_lower = (page_query or "").lower()
-    combined_context = f"{page_lower} {query_lower}"
-    
+    contexts = [f"{page_name.lower()} {query_lower}" for page_name in page_names]
+
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
-    
-    # Extract results from search response
-    style_results = style_search.get("results", [])
-    ux_results = ux_search.get("results", [])
-    landing_results = landing_search.get("results", [])
-    
+    requests = [(context, domain, max_results) for context in contexts for domain, max_results in OVERRIDE_SEARCHES]
+    responses = search_batch(requests)
+
+    overrides = []
+    for i, context in enumerate(contexts):
+        style_search, ux_search, landing_search = responses[i * len(OVERRIDE_SEARCHES):(i + 1) * len(OVERRIDE_SEARCHES)]
+        overrides.append(_build_overrides(
+            context,
+            style_search.get("results", []),
+            ux_search.get("results", []),
+            landing_search.get("results", []),
+        ))
+    return overrides
+
+
+def _build_overrides(combined_context: str, style_results: list, ux_results: list, landing_results: list) -> dict:
+    """Turn page-specific search results into override sections."""
     # Detect page type from search results or context
     page_type = _detect_page_type(combined_context, style_results)
     
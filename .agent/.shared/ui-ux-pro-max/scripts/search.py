@@ -5,6 +5,7 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --build-index [--force]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,11 +13,20 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+               (repeat for several pages; unchanged files are not rewritten)
+
+Indexes:
+  --build-index  Prebuild the on-disk BM25 indexes (data/.index/); queries also build them lazily
+
+Daemon:
+  Queries go to the resident search daemon when it is running (python daemon.py start)
+  and run in-process otherwise. --local forces in-process search.
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import os
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, build_indexes
+from daemon import call
 
 
 def format_output(result):
@@ -31,6 +41,9 @@ def format_output(result):
     else:
         output.append(f"## UI Pro Max Search Results")
         output.append(f"**Domain:** {result['domain']} | **Query:** {result['query']}")
+    if result.get("expansions"):
+        expanded = ", ".join(f"{typo} → {' / '.join(terms)}" for typo, terms in result["expansions"].items())
+        output.append(f"**Expanded:** {expanded}")
     output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
 
     for i, row in enumerate(result['results'], 1):
@@ -47,7 +60,7 @@ def format_output(result):
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
@@ -58,20 +71,34 @@ if __name__ == "__main__":
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
     # Persistence (Master + Overrides pattern)
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
-    parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
+    parser.add_argument("--page", type=str, action="append", default=None, help="Create page-specific override file in design-system/pages/ (repeatable)")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
 
+    # Index maintenance
+    parser.add_argument("--build-index", action="store_true", help="Prebuild on-disk search indexes for all domains and stacks")
+    parser.add_argument("--force", action="store_true", help="With --build-index: rebuild even if indexes are fresh")
+    parser.add_argument("--local", action="store_true", help="Search in-process even if the daemon is running")
+
     args = parser.parse_args()
+    if args.local:
+        os.environ["UIPRO_NO_DAEMON"] = "1"
 
+    if args.build_index:
+        built = build_indexes(force=args.force)
+        print(f"✅ {len(built)} indexes ready: {', '.join(built)}")
+    elif not args.query:
+        parser.error("the following arguments are required: query")
     # Design system takes priority
-    if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
+    elif args.design_system:
+        result = call(
+            "design_system",
+            query=args.query,
+            project_name=args.project_name,
+            output_format=args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            # The daemon runs elsewhere; pin persistence to this process's cwd
+            output_dir=os.path.abspath(args.output_dir) if args.output_dir else os.getcwd()
         )
         print(result)
         
@@ -81,8 +108,8 @@ if __name__ == "__main__":
             print("\n" + "=" * 60)
             print(f"✅ Design system persisted to design-system/{project_slug}/")
             print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
-            if args.page:
-                page_filename = args.page.lower().replace(' ', '-')
+            for page in args.page or []:
+                page_filename = page.lower().replace(' ', '-')
                 print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
             print("")
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
@@ -90,7 +117,7 @@ if __name__ == "__main__":
             print("=" * 60)
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        result = call("search_stack", query=args.query, stack=args.stack, max_results=args.max_results)
         if args.json:
             import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -98,7 +125,7 @@ if __name__ == "__main__":
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        result = call("search", query=args.query, domain=args.domain, max_results=args.max_results)
         if args.json:
             import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
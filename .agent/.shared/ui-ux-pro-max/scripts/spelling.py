@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Spelling - SymSpell-style typo correction against an index vocabulary
+
+Every vocabulary term is stored under all of its deletion variants (up to
+MAX_EDIT_DISTANCE characters removed). A misspelled query term generates its
+own deletions, and the shared keys give candidates. Each candidate is then
+verified with an optimal-string-alignment (Damerau) edit distance. A lookup
+is a handful of dict probes, not a scan of the vocabulary.
+
+Usage:
+    from spelling import DeletionIndex
+    index = DeletionIndex(["glassmorphism", "neumorphism"])
+    index.lookup("glasmorphism")  # (1, ['glassmorphism'])
+"""
+
+from collections import defaultdict
+from functools import lru_cache
+
+MAX_EDIT_DISTANCE = 2
+# Words shorter than this are never corrected (too many near neighbours)
+MIN_TERM_LENGTH = 4
+MAX_SUGGESTIONS = 3
+
+
+def max_distance_for(word):
+    """Allowed edits grow with word length: none below 4 chars, 1 up to 6, then 2"""
+    if len(word) < MIN_TERM_LENGTH:
+        return 0
+    return 1 if len(word) <= 6 else MAX_EDIT_DISTANCE
+
+
+def _deletes(word, max_distance):
+    """All strings reachable from word by removing up to max_distance characters"""
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier if len(w) > 1 for i in range(len(w))}
+        result |= frontier
+    return result
+
+
+def edit_distance(a, b, max_distance):
+    """Optimal string alignment distance, or max_distance + 1 once it is exceeded"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev_prev, prev = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(prev[j] + 1, current[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], prev_prev[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        prev_prev, prev = prev, current
+    return prev[-1]
+
+
+class DeletionIndex:
+    """Deletion-variant index over a vocabulary; `weights` (e.g. document frequency) rank ties"""
+
+    def __init__(self, terms, weights=None, max_distance=MAX_EDIT_DISTANCE):
+        self.max_distance = max_distance
+        self.weights = weights or {}
+        self.terms = set()
+        deletes = defaultdict(list)
+        for term in terms:
+            if len(term) < MIN_TERM_LENGTH - max_distance or term in self.terms:
+                continue
+            self.terms.add(term)
+            for variant in _deletes(term, max_distance):
+                deletes[variant].append(term)
+        # Tab-joined rather than lists: unpickles several times faster
+        self.deletes = {variant: "\t".join(terms) for variant, terms in deletes.items()}
+        # The same query is typically looked up once per searched domain
+        self.lookup = lru_cache(maxsize=1024)(self._lookup)
+
+    def to_dict(self):
+        return {"max_distance": self.max_distance, "weights": self.weights, "terms": self.terms, "deletes": self.deletes}
+
+    @classmethod
+    def from_dict(cls, state):
+        index = cls((), state["weights"], state["max_distance"])
+        index.terms = state["terms"]
+        index.deletes = state["deletes"]
+        return index
+
+    def _lookup(self, word, max_suggestions=MAX_SUGGESTIONS):
+        """Nearest vocabulary terms as (distance, [terms]); (0, [word]) if known, (None, []) if none"""
+        if word in self.terms:
+            return 0, [word]
+        max_distance = min(max_distance_for(word), self.max_distance)
+        if max_distance == 0:
+            return None, []
+
+        best, found, seen = max_distance, set(), set()
+        for variant in _deletes(word, max_distance):
+            candidates = self.deletes.get(variant)
+            if not candidates:
+                continue
+            for term in candidates.split("\t"):
+                if term in seen:
+                    continue
+                seen.add(term)
+                distance = edit_distance(word, term, best)
+                if distance < best:
+                    best, found = distance, {term}
+                elif distance == best:
+                    found.add(term)
+
+        if not found:
+            return None, []
+        ranked = sorted(found, key=lambda term: (-self.weights.get(term, 0), term))
+        return best, ranked[:max_suggestions]
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Tokenizer - shared text normalization for the BM25 indexes
+
+Lowercases, splits on punctuation, keeps an allowlist of meaningful short
+tokens (ui, ux, ai, 3d...), drops stopwords, applies a light plural stemmer
+and adds a phrase term for each pair of adjacent words ("dark mode").
+Vocabulary interns terms to dense integer IDs for compact postings.
+
+Usage:
+    from tokenizer import tokenize, Vocabulary
+    tokenize("Dark mode animations for UI")
+    # ['dark', 'mode', 'dark mode', 'animation', 'mode animation', 'ui']
+"""
+
+import re
+from functools import lru_cache
+
+_SEGMENT_RE = re.compile(r"[^\w\s]+")
+
+# Tokens of two characters or fewer are noise, except these
+SHORT_TOKENS = frozenset({
+    "ui", "ux", "ai", "ml", "3d", "2d", "ar", "vr", "xr", "js", "ts", "qr", "os", "tv",
+})
+
+STOPWORDS = frozenset({
+    "the", "and", "for", "with", "from", "into", "that", "this", "these", "those",
+    "are", "was", "were", "has", "have", "had", "but", "not", "its", "their",
+    "them", "they", "then", "than", "there", "what", "when", "where", "which",
+    "while", "who", "will", "can", "you", "your", "all", "any", "each", "also",
+    "such", "only", "more", "most", "use", "using", "via",
+})
+
+
+@lru_cache(maxsize=65536)
+def stem(word):
+    """Light plural stemmer (Harman S-stemmer): animations -> animation, categories -> category"""
+    if len(word) <= 3 or not word.endswith("s") or word in SHORT_TOKENS:
+        return word
+    if word.endswith("ies") and not word.endswith(("eies", "aies")):
+        return word[:-3] + "y"
+    if word.endswith("sses"):
+        return word[:-2]
+    if word.endswith("es") and not word.endswith(("aes", "ees", "oes")):
+        return word[:-1]
+    if word.endswith(("us", "ss", "is")):
+        return word
+    return word[:-1]
+
+
+def _term(word):
+    """Normalized term for a lowercase word, or None if it is dropped"""
+    if len(word) <= 2 and word not in SHORT_TOKENS:
+        return None
+    if word in STOPWORDS:
+        return None
+    return stem(word)
+
+
+def tokenize(text):
+    """Terms for a document field or a query: words plus adjacent-word phrase terms"""
+    tokens = []
+    for segment in _SEGMENT_RE.split(str(text).lower()):
+        prev = None
+        for word in segment.split():
+            term = _term(word)
+            if term is None:
+                # Dropped words break phrases; punctuation does too (via segments)
+                prev = None
+                continue
+            tokens.append(term)
+            if prev:
+                tokens.append(f"{prev} {term}")
+            prev = term
+    return tokens
+
+
+def is_phrase(term):
+    return " " in term
+
+
+class Vocabulary:
+    """Interns terms to dense integer IDs (term -> id, id -> term)"""
+
+    def __init__(self, terms=()):
+        self.terms = []
+        self.ids = {}
+        for term in terms:
+            self.intern(term)
+
+    def intern(self, term):
+        term_id = self.ids.get(term)
+        if term_id is None:
+            term_id = self.ids[term] = len(self.terms)
+            self.terms.append(term)
+        return term_id
+
+    def get(self, term):
+        """ID of a known term, or None (lookups never grow the vocabulary)"""
+        return self.ids.get(term)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, term):
+        return term in self.ids
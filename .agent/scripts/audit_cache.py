@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Audit Cache - incremental per-file result cache shared by the skill audit scripts
+
+security_scan.py, ux_audit.py, mobile_audit.py, accessibility_checker.py,
+seo_checker.py and geo_checker.py store each file's findings keyed by
+(file path, mtime + size, content hash, rule-set version). On the next run an
+unchanged file reuses its findings; only new or edited files are re-audited.
+
+    - mtime + size unchanged   -> hit, the file is not even read
+    - content hash unchanged   -> hit (touched but identical file)
+    - otherwise, or rules edited -> miss, the script audits the file again
+
+The rule-set version is a hash of the auditing script's own source, so editing
+a rule invalidates that tool's cache automatically.
+
+Cache files live in ~/.cache/agent-audit/ (override with AGENT_AUDIT_CACHE_DIR),
+one per (tool, project); when that directory cannot be written the results
+are simply not stored. Set AGENT_AUDIT_NO_CACHE=1 or pass --no-cache to the
+scripts to disable it.
+
+Usage:
+    from audit_cache import AuditCache, source_version
+    cache = AuditCache("ux_audit", project_path, source_version(__file__))
+    result = cache.result(filepath, lambda: audit(filepath))   # must be JSON-serializable
+    cache.save()
+    cache.stats()   # {"hits": 120, "misses": 2, "hit_ratio": 0.98}
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+CACHE_FORMAT = 1
+CACHE_DIR = Path(os.environ.get("AGENT_AUDIT_CACHE_DIR") or Path.home() / ".cache" / "agent-audit")
+
+
+def source_version(*paths) -> str:
+    """Rule-set version from the source of the files that define the rules"""
+    digest = hashlib.blake2b(str(CACHE_FORMAT).encode(), digest_size=16)
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def _file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+class AuditCache:
+    """Per-file findings of one audit tool over one project tree"""
+
+    def __init__(self, tool: str, project_path, version: str, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = os.environ.get("AGENT_AUDIT_NO_CACHE") != "1"
+        self.enabled = enabled
+        self.version = version
+        project = os.path.abspath(project_path)
+        key = hashlib.blake2b(project.encode("utf-8"), digest_size=8).hexdigest()
+        self.path = CACHE_DIR / f"{tool}-{key}.json"
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, dict] = {}
+        self._touched: Dict[str, dict] = {}
+        self._pending: Dict[str, dict] = {}
+        if enabled:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.version:
+            self._entries = data.get("files", {})
+
+    def get(self, path) -> Optional[Any]:
+        """Cached result for an unchanged file, or None (call put() with the fresh result)"""
+        if not self.enabled:
+            return None
+        key = os.path.abspath(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        entry = self._entries.get(key)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            self.hits += 1
+            self._touched[key] = entry
+            return entry["result"]
+
+        try:
+            digest = _file_hash(key)
+        except OSError:
+            return None
+        if entry and entry["hash"] == digest:
+            # Same content under a new mtime: refresh the stat so the next run skips hashing
+            entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+            self.hits += 1
+            self._touched[key] = entry
+            return entry["result"]
+
+        self._pending[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": digest}
+        return None
+
+    def put(self, path, result: Any) -> Any:
+        """Record a freshly computed result for a file that get() missed; returns the result"""
+        if not self.enabled:
+            return result
+        self.misses += 1
+        pending = self._pending.pop(os.path.abspath(path), None)
+        if pending is not None:
+            pending["result"] = result
+            self._touched[os.path.abspath(path)] = pending
+        return result
+
+    def result(self, path, compute: Callable[[], Any]) -> Any:
+        """Cached result for path, computing (and recording) it on a miss"""
+        cached = self.get(path)
+        if cached is not None:
+            return cached
+        return self.put(path, compute())
+
+    def save(self, prune: bool = True) -> None:
+        """
+        Write the entries seen this run; files that were not visited (deleted) drop
+        out. A partial run (e.g. only changed files) passes prune=False to keep them.
+        """
+        if not self.enabled:
+            return
+        files = self._touched if prune else {**self._entries, **self._touched}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "files": files}, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            # Unwritable cache directory (read-only HOME, sandbox): the audit still completes
+            self.enabled = False
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+def open_cache(tool: str, project_path, script: str, enabled: bool = True) -> AuditCache:
+    """AuditCache for a script, versioned by that script's own source"""
+    return AuditCache(tool, project_path, source_version(script), None if enabled else False)
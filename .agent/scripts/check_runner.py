@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Check Runner - executes skill validation scripts for checklist.py and verify_all.py
+
+A skill script that defines `run(context) -> Result` is imported and run inside
+the calling interpreter: no interpreter start-up per check, shared imports, and
+every check reads files through the same file_index content store, so a file
+read by one check is free for the next. Scripts without run(), scripts that
+fail to import, and every script when isolation is requested go through a
+subprocess as before.
+
+Plugin interface (in a skill script):
+    def run(context):
+        \"\"\"In-process entry point for checklist.py / verify_all.py\"\"\"
+        from check_runner import run_main
+        return run_main(main, [__file__, context.project_path])
+
+Output written by an in-process check is captured per thread, so several
+checks may run concurrently. In-process checks run on a worker thread and are
+abandoned after context.timeout seconds, like a subprocess would be killed.
+"""
+
+import importlib.util
+import io
+import re
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_TIMEOUT = 300
+
+
+@dataclass
+class Context:
+    """What a check gets to know about the run"""
+    project_path: str
+    url: Optional[str] = None
+    timeout: int = DEFAULT_TIMEOUT
+
+
+@dataclass
+class Result:
+    """Outcome of one check: pass/fail plus its captured output"""
+    passed: bool
+    output: str = ""
+    error: str = ""
+    details: Dict = field(default_factory=dict)
+
+
+# ============================================================================
+#  OUTPUT CAPTURE
+# ============================================================================
+
+_capture = threading.local()
+_install_lock = threading.Lock()
+
+
+class _ThreadCapture(io.TextIOBase):
+    """sys.stdout / sys.stderr stand-in: writes go to the current thread's buffer when it has one"""
+
+    def __init__(self, stream, slot: str):
+        self._stream = stream
+        self._slot = slot
+
+    def _target(self):
+        return getattr(_capture, self._slot, None) or self._stream
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        # encoding, isatty, reconfigure... come from the real stream
+        return getattr(self._stream, name)
+
+
+def _install_capture() -> None:
+    with _install_lock:
+        if not isinstance(sys.stdout, _ThreadCapture):
+            sys.stdout = _ThreadCapture(sys.stdout, "stdout")
+        if not isinstance(sys.stderr, _ThreadCapture):
+            sys.stderr = _ThreadCapture(sys.stderr, "stderr")
+
+
+def run_main(main: Callable, argv: List[str]) -> Result:
+    """Run a script's CLI main(argv) in this process; its exit status decides pass/fail"""
+    _install_capture()
+    out, err = io.StringIO(), io.StringIO()
+    _capture.stdout, _capture.stderr = out, err
+    code = 0
+    try:
+        main(argv)
+    except SystemExit as e:
+        if isinstance(e.code, str):
+            err.write(e.code + "\n")
+            code = 1
+        else:
+            code = e.code or 0
+    finally:
+        _capture.stdout = _capture.stderr = None
+    return Result(passed=code == 0, output=out.getvalue(), error=err.getvalue())
+
+
+# ============================================================================
+#  RUNNER
+# ============================================================================
+
+_RUN_DEF_RE = re.compile(r"^def run\(context", re.MULTILINE)
+_plugins: Dict[Path, Optional[object]] = {}
+_plugins_lock = threading.Lock()
+
+
+def load_plugin(script_path: Path):
+    """The script's module if it exposes run(context), else None; imported once per process"""
+    script_path = Path(script_path).resolve()
+    with _plugins_lock:
+        if script_path not in _plugins:
+            module = None
+            try:
+                # Only import scripts that declare the entry point: importing anything
+                # else would run whatever it does at module level
+                if _RUN_DEF_RE.search(script_path.read_text(encoding="utf-8", errors="ignore")):
+                    spec = importlib.util.spec_from_file_location(f"_check_{script_path.stem}", script_path)
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+            except (Exception, SystemExit):
+                module = None
+            _plugins[script_path] = module if callable(getattr(module, "run", None)) else None
+        return _plugins[script_path]
+
+
+def script_args(script_path: Path, context: Context) -> List[str]:
+    """Command-line arguments a script gets in the subprocess path"""
+    args = [context.project_path]
+    name = Path(script_path).name.lower()
+    if context.url and ("lighthouse" in name or "playwright" in name):
+        args.append(context.url)
+    return args
+
+
+def _run_subprocess(script_path: Path, context: Context) -> Result:
+    try:
+        result = subprocess.run(
+            [sys.executable, str(script_path)] + script_args(script_path, context),
+            capture_output=True,
+            text=True,
+            timeout=context.timeout
+        )
+    except subprocess.TimeoutExpired:
+        return Result(passed=False, error="Timeout", details={"timeout": True})
+    return Result(passed=result.returncode == 0, output=result.stdout, error=result.stderr)
+
+
+def _run_plugin(plugin, context: Context) -> Result:
+    """plugin.run(context) on a worker thread, given up on after context.timeout seconds"""
+    outcome: Dict[str, Result] = {}
+
+    def target():
+        try:
+            outcome["result"] = plugin.run(context)
+        except Exception:
+            outcome["result"] = Result(passed=False, error=traceback.format_exc())
+
+    # A thread cannot be killed: a timed-out check is abandoned, and being a
+    # daemon it does not keep the interpreter alive once the caller is done
+    worker = threading.Thread(target=target, name=f"check-{context.project_path}", daemon=True)
+    worker.start()
+    worker.join(context.timeout)
+    if worker.is_alive():
+        return Result(passed=False, error="Timeout", details={"timeout": True})
+    return outcome["result"]
+
+
+def run_check(name: str, script_path: Path, context: Context, isolate: bool = False) -> dict:
+    """
+    Run one check, in-process when the script supports it.
+
+    Returns:
+        dict with keys: name, passed, output, error, skipped, duration, mode
+    """
+    start = time.perf_counter()
+    plugin = None if isolate else load_plugin(script_path)
+    mode = "in-process" if plugin else "subprocess"
+    try:
+        result = _run_plugin(plugin, context) if plugin else _run_subprocess(script_path, context)
+    except Exception:
+        result = Result(passed=False, error=traceback.format_exc())
+    return {
+        "name": name,
+        "passed": result.passed,
+        "output": result.output,
+        "error": result.error,
+        "skipped": False,
+        "duration": time.perf_counter() - start,
+        "mode": mode,
+        "timeout": result.details.get("timeout", False),
+    }
@@ -9,6 +9,7 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --isolate          # Run every check in its own interpreter
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -18,14 +19,19 @@ Priority Order:
     P4: UX Audit (psychology laws, accessibility)
     P5: SEO Check (meta tags, structure)
     P6: Performance (lighthouse - requires URL)
+
+Checks whose script exposes run(context) execute in this interpreter and share
+one file content store; the rest run as subprocesses (see check_runner.py).
 """
 
 import sys
-import subprocess
+import time
 import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from check_runner import Context, run_check
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -73,59 +79,33 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None, isolate: bool = False) -> dict:
     """
     Run a validation script and capture results
     
     Returns:
-        dict with keys: name, passed, output, skipped
+        dict with keys: name, passed, output, skipped, duration, mode
     """
     if not check_script_exists(script_path):
         print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "output": "", "skipped": True}
+        return {"name": name, "passed": True, "output": "", "skipped": True, "duration": 0}
     
     print_step(f"Running: {name}")
     
-    # Build command
-    cmd = [sys.executable, str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
-    
-    # Run script
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED")
-        else:
-            print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
-        
-        return {
-            "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False
-        }
-    
-    except subprocess.TimeoutExpired:
+    result = run_check(name, script_path, Context(project_path, url, timeout=300), isolate)  # 5 minute timeout
+    
+    if result["timeout"]:
         print_error(f"{name}: TIMEOUT (>5 minutes)")
-        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
+    elif result["passed"]:
+        print_success(f"{name}: PASSED ({result['duration']:.1f}s, {result['mode']})")
+    else:
+        print_error(f"{name}: FAILED ({result['duration']:.1f}s, {result['mode']})")
+        if result["error"]:
+            print(f"  Error: {result['error'][:200]}")
     
-    except Exception as e:
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
+    return result
 
-def print_summary(results: List[dict]):
+def print_summary(results: List[dict], total_duration: float = 0.0):
     """Print final summary report"""
     print_header("📊 CHECKLIST SUMMARY")
     
@@ -133,6 +113,7 @@ def print_summary(results: List[dict]):
     failed_count = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
     skipped_count = sum(1 for r in results if r.get("skipped"))
     
+    print(f"Total Duration: {total_duration:.1f}s")
     print(f"Total Checks: {len(results)}")
     print(f"{Colors.GREEN}✅ Passed: {passed_count}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed_count}{Colors.ENDC}")
@@ -148,7 +129,8 @@ def print_summary(results: List[dict]):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        print(f"{status} {r['name']}")
+        duration_str = f"({r['duration']:.1f}s, {r['mode']})" if not r.get("skipped") else ""
+        print(f"{status} {r['name']} {duration_str}")
     
     print()
     
@@ -172,6 +154,7 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--isolate", action="store_true", help="Run every check as a subprocess instead of in-process")
     
     args = parser.parse_args()
     
@@ -185,19 +168,20 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
     
+    start_time = time.perf_counter()
     results = []
     
     # Run core checks
     print_header("📋 CORE CHECKS")
     for name, script_path, required in CORE_CHECKS:
         script = project_path / script_path
-        result = run_script(name, script, str(project_path))
+        result = run_script(name, script, str(project_path), isolate=args.isolate)
         results.append(result)
         
         # If required check fails, stop
         if required and not result["passed"] and not result.get("skipped"):
             print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
+            print_summary(results, time.perf_counter() - start_time)
             sys.exit(1)
     
     # Run performance checks if URL provided
@@ -205,11 +189,11 @@ Examples:
         print_header("⚡ PERFORMANCE CHECKS")
         for name, script_path, required in PERFORMANCE_CHECKS:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            result = run_script(name, script, str(project_path), args.url, args.isolate)
             results.append(result)
     
     # Print summary
-    all_passed = print_summary(results)
+    all_passed = print_summary(results, time.perf_counter() - start_time)
     
     sys.exit(0 if all_passed else 1)
 
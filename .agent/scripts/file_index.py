@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+File Index - shared tree traversal and read-once file contents for the skill scripts
+
+Every audit script used to walk the project itself (os.walk, rglob, glob) and
+read the same files again. This module gives them one traversal and one
+content store:
+
+    walk_files()   os.scandir walk, pruning skip directories before descending
+                   and honouring .gitignore files (root and nested, with ! negation)
+    walk_includes() the same filter for a single path (e.g. a changed file)
+    ContentStore   reads each file once per process; large files are kept
+                   memory-mapped instead of copied onto the heap
+
+When several checks run in one interpreter (see checklist.py / verify_all.py)
+they share shared_store(), so a file read by one check is free for the next.
+
+Usage:
+    from file_index import walk_files, read_text
+    for path in walk_files(project, extensions={'.tsx', '.jsx'}):
+        content = read_text(path, errors='ignore')
+"""
+
+import mmap
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_SKIP_DIRS = frozenset({
+    'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next',
+})
+
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 1 << 20
+# Stop retaining contents (bytes plus decoded text) once this much is held;
+# later reads still work, uncached
+MAX_CACHED_BYTES = 256 << 20
+
+
+# ============================================================================
+#  .gitignore
+# ============================================================================
+
+def _translate(pattern: str) -> str:
+    """gitignore glob to regex: * and ? stay within a path segment, ** spans segments"""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class GitIgnore:
+    """Rules of one .gitignore file, matched against paths relative to its directory"""
+
+    def __init__(self, lines: Iterable[str]):
+        self.rules: List[Tuple["re.Pattern", bool, bool]] = []
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            # A slash anywhere but the end anchors the pattern to this directory
+            anchored = "/" in line
+            regex = _translate(line.lstrip("/"))
+            if not anchored:
+                regex = "(?:.*/)?" + regex
+            self.rules.append((re.compile(regex + r"\Z"), negate, dir_only))
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["GitIgnore"]:
+        try:
+            with open(os.path.join(directory, ".gitignore"), "r", encoding="utf-8", errors="ignore") as f:
+                ignore = cls(f)
+        except OSError:
+            return None
+        return ignore if ignore.rules else None
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """True (ignored), False (re-included by !) or None (no rule applies); the last match wins"""
+        result = None
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                result = not negate
+        return result
+
+
+def _ignored(stack: List[Tuple[str, GitIgnore]], path: str, is_dir: bool) -> bool:
+    ignored = False
+    for base, ignore in stack:
+        verdict = ignore.match(os.path.relpath(path, base).replace(os.sep, "/"), is_dir)
+        if verdict is not None:
+            ignored = verdict
+    return ignored
+
+
+# ============================================================================
+#  WALKER
+# ============================================================================
+
+def walk_files(root, extensions: Optional[Iterable[str]] = None, skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+               gitignore: bool = True) -> Iterator[str]:
+    """
+    File paths under root, in os.walk top-down order (a directory's files, then
+    its subdirectories). skip_dirs are pruned by name before descending;
+    extensions (e.g. {'.ts', '.tsx'}) filter by exact suffix; gitignore applies
+    every .gitignore from root downwards.
+    """
+    root = os.fspath(root)
+    extensions = frozenset(extensions) if extensions is not None else None
+    skip_dirs = frozenset(skip_dirs)
+    yield from _walk(root, extensions, skip_dirs, [] if gitignore else None)
+
+
+def _walk(directory: str, extensions, skip_dirs, stack) -> Iterator[str]:
+    if stack is not None:
+        ignore = GitIgnore.load(directory)
+        if ignore:
+            stack = stack + [(directory, ignore)]
+
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if entry.name in skip_dirs or entry.is_symlink():
+                continue
+            if stack and _ignored(stack, entry.path, True):
+                continue
+            subdirs.append(entry.path)
+            continue
+        if extensions is not None and os.path.splitext(entry.name)[1] not in extensions:
+            continue
+        if stack and _ignored(stack, entry.path, False):
+            continue
+        yield entry.path
+
+    for subdir in subdirs:
+        yield from _walk(subdir, extensions, skip_dirs, stack)
+
+
+def walk_includes(root, path, extensions: Optional[Iterable[str]] = None,
+                  skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS, gitignore: bool = True) -> bool:
+    """Whether walk_files(root, ...) with the same filters would yield path (which need not exist)"""
+    root = os.path.abspath(root)
+    path = os.path.abspath(os.path.join(root, path))
+    rel = os.path.relpath(path, root)
+    if rel == os.curdir or rel == os.pardir or rel.startswith(os.pardir + os.sep):
+        return False
+    if extensions is not None and os.path.splitext(path)[1] not in extensions:
+        return False
+
+    stack = [] if gitignore else None
+    directory = root
+    for name in rel.split(os.sep)[:-1]:
+        if stack is not None:
+            ignore = GitIgnore.load(directory)
+            if ignore:
+                stack = stack + [(directory, ignore)]
+        directory = os.path.join(directory, name)
+        if name in skip_dirs or os.path.islink(directory):
+            return False
+        if stack and _ignored(stack, directory, True):
+            return False
+    if stack is not None:
+        ignore = GitIgnore.load(directory)
+        if ignore:
+            stack = stack + [(directory, ignore)]
+    return not (stack and _ignored(stack, path, False))
+
+
+# ============================================================================
+#  CONTENT STORE
+# ============================================================================
+
+class ContentStore:
+    """Read-once file contents; text is decoded on demand with open()'s newline handling
+
+    Decoded text is only retained for files held as bytes: a memory-mapped
+    file's text would put the whole file back on the heap.
+    """
+
+    def __init__(self, mmap_threshold: int = MMAP_THRESHOLD, max_bytes: int = MAX_CACHED_BYTES):
+        self.mmap_threshold = mmap_threshold
+        self.max_bytes = max_bytes
+        self.cached_bytes = 0
+        self.reads = 0
+        self._data: Dict[str, object] = {}
+        # path -> {(encoding, errors): text}
+        self._text: Dict[str, Dict[Tuple[str, str], str]] = {}
+
+    def read_bytes(self, path):
+        """File contents as bytes, or a read-only mmap for large files; raises OSError like open()"""
+        key = os.path.abspath(path)
+        data = self._data.get(key)
+        if data is not None:
+            return data
+
+        self.reads += 1
+        with open(key, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if self.mmap_threshold and size >= self.mmap_threshold:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = f.read()
+        if self.cached_bytes + size <= self.max_bytes:
+            self._data[key] = data
+            self.cached_bytes += size
+        return data
+
+    def read_text(self, path, encoding: str = "utf-8", errors: str = "strict") -> str:
+        """Same result as open(path, encoding=..., errors=...).read(), decoded once per encoding and errors mode"""
+        key = os.path.abspath(path)
+        text = self._text.get(key, {}).get((encoding, errors))
+        if text is None:
+            data = self.read_bytes(key)
+            text = str(memoryview(data), encoding, errors)
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            if (isinstance(data, bytes) and key in self._data
+                    and self.cached_bytes + len(text) <= self.max_bytes):
+                self._text.setdefault(key, {})[(encoding, errors)] = text
+                self.cached_bytes += len(text)
+        return text
+
+    def forget(self, path) -> None:
+        """Drop a file's cached bytes and text, so the next read sees it as it is on disk now"""
+        key = os.path.abspath(path)
+        data = self._data.pop(key, None)
+        if data is not None:
+            # A mapping may still be in a caller's hands: it is released with its last reference
+            self.cached_bytes -= len(data)
+        for text in self._text.pop(key, {}).values():
+            self.cached_bytes -= len(text)
+
+    def clear(self) -> None:
+        for data in self._data.values():
+            if isinstance(data, mmap.mmap):
+                data.close()
+        self._data.clear()
+        self._text.clear()
+        self.cached_bytes = 0
+
+
+_SHARED_STORE = ContentStore()
+
+
+def shared_store() -> ContentStore:
+    """The process-wide store every check reads through"""
+    return _SHARED_STORE
+
+
+def read_text(path, encoding: str = "utf-8", errors: str = "strict") -> str:
+    return _SHARED_STORE.read_text(path, encoding, errors)
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Import Graph - module graph of a TS/JS project for bundle-weight analysis
+
+Parses every .ts/.tsx/.js/.jsx file's imports once and resolves them the way
+the bundler would:
+
+    ./x, ../x          relative to the importing file
+    @/x, ~/x, ...      tsconfig.json / jsconfig.json compilerOptions.paths
+                       (Next.js' default `@/*` -> src/* or ./* without a config)
+    components/x       compilerOptions.baseUrl
+    x, x.ts, x/index   extension and index-file lookup (./x.js also finds x.ts)
+
+Edges are static imports, re-exports and require(); `import type` is dropped
+and import() / dynamic() are kept apart, since they start a separate chunk.
+On top of the graph: importers of a module, the transitive closure (files and
+bytes) of every entry page, and barrel files (modules that only re-export).
+
+The parsed imports are persisted per project next to the audit cache
+(~/.cache/agent-audit/, see audit_cache.py). refresh() re-parses only files
+whose mtime or size changed; update(paths) re-parses just the given files.
+
+Usage:
+    python import_graph.py <project>            # bundle weight per entry page
+    python import_graph.py <project> --json
+    python import_graph.py <project> --no-cache # ignore and do not write the stored graph
+
+    from import_graph import ModuleGraph
+    graph = ModuleGraph.open(project)
+    graph.importers(path), graph.closure(path), graph.entries(), graph.is_barrel(path)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from file_index import walk_files, walk_includes, read_text, shared_store
+from audit_cache import CACHE_DIR
+
+GRAPH_FORMAT = 2
+
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+# Tried in this order for extensionless specifiers, then as <dir>/index.*
+RESOLVE_EXTENSIONS = ('.tsx', '.ts', '.jsx', '.js')
+CONFIG_FILES = ('tsconfig.json', 'jsconfig.json')
+
+# Edge kinds; STATIC ones end up in the importing chunk
+IMPORT, REEXPORT, REQUIRE, DYNAMIC = "import", "reexport", "require", "dynamic"
+STATIC = (IMPORT, REEXPORT, REQUIRE)
+
+# Strings are kept (specifiers live in them), comments are dropped
+_COMMENT_RE = re.compile(r"""("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)|//[^\n]*|/\*.*?\*/""", re.DOTALL)
+_STATIC_RE = re.compile(
+    r"""^[ \t]*(import|export)\s+(?!type\s)(?:[\w*{}\s,$]+?\s+from\s+)?['"]([^'"\n]+)['"][ \t]*;?""", re.MULTILINE)
+_REQUIRE_RE = re.compile(r"""\brequire\(\s*['"]([^'"\n]+)['"]\s*\)""")
+_DYNAMIC_RE = re.compile(r"""\bimport\(\s*['"]([^'"\n]+)['"]\s*\)""")
+_TYPE_ONLY_RE = re.compile(
+    r"""^[ \t]*(?:import|export)\s+type\s+[\w*{}\s,$]+?\s+from\s+['"][^'"\n]+['"][ \t]*;?""", re.MULTILINE)
+_DIRECTIVE_RE = re.compile(r"""^[ \t]*['"]use [\w ]+['"][ \t]*;?""", re.MULTILINE)
+
+
+def _strip_comments(text: str) -> str:
+    return _COMMENT_RE.sub(lambda m: m.group(1) or "", text)
+
+
+def parse_module(content: str) -> dict:
+    """Import specifiers of one file as [kind, spec] pairs, and whether it only re-exports"""
+    code = _strip_comments(content)
+    imports = []
+    reexports = 0
+    for m in _STATIC_RE.finditer(code):
+        kind = REEXPORT if m.group(1) == "export" else IMPORT
+        reexports += kind == REEXPORT
+        imports.append([kind, m.group(2)])
+    imports += [[REQUIRE, spec] for spec in _REQUIRE_RE.findall(code)]
+    imports += [[DYNAMIC, spec] for spec in _DYNAMIC_RE.findall(code)]
+    # A barrel re-exports several modules and has no code of its own;
+    # type-only imports and re-exports are erased at build time
+    residue = _DIRECTIVE_RE.sub("", _TYPE_ONLY_RE.sub("", _STATIC_RE.sub("", code)))
+    return {"imports": imports, "barrel": reexports >= 2 and not residue.strip()}
+
+
+def _load_jsonc(path: Path) -> dict:
+    """tsconfig-style JSON: comments and trailing commas allowed"""
+    text = _strip_comments(path.read_text(encoding="utf-8", errors="ignore"))
+    return json.loads(re.sub(r",(\s*[}\]])", r"\1", text))
+
+
+class ModuleGraph:
+    """Files, their parsed imports and the resolved edges between them"""
+
+    def __init__(self, project_path, persist: bool = True):
+        self.root = os.path.abspath(project_path)
+        self.persist = persist and os.environ.get("AGENT_AUDIT_NO_CACHE") != "1"
+        key = hashlib.blake2b(self.root.encode("utf-8"), digest_size=8).hexdigest()
+        self.path = CACHE_DIR / f"import_graph-{key}.json"
+        self.nodes: Dict[str, dict] = {}
+        self.reparsed = 0
+        self._edges: Dict[str, List[Tuple[str, str]]] = {}
+        self._importers: Dict[str, List[str]] = {}
+        self._closures: Dict[str, frozenset] = {}
+        self.base_url, self.aliases = self._load_paths()
+
+    @classmethod
+    def open(cls, project_path, persist: bool = True) -> "ModuleGraph":
+        """The stored graph of a project, brought up to date with the tree"""
+        graph = cls(project_path, persist)
+        graph.load()
+        graph.refresh()
+        return graph
+
+    # ------------------------------------------------------------------
+    #  Resolution
+    # ------------------------------------------------------------------
+
+    def _load_paths(self) -> Tuple[Optional[str], List[Tuple[str, List[str]]]]:
+        """(baseUrl, [(alias pattern, targets)]) from tsconfig/jsconfig, following relative `extends`"""
+        for name in CONFIG_FILES:
+            config_path = Path(self.root) / name
+            base_url, paths = None, None
+            seen = set()
+            while config_path and config_path.is_file() and config_path not in seen:
+                seen.add(config_path)
+                try:
+                    config = _load_jsonc(config_path)
+                except (OSError, ValueError):
+                    break
+                options = config.get("compilerOptions", {})
+                # The most derived config wins; baseUrl and paths are relative to the file declaring them
+                if base_url is None and "baseUrl" in options:
+                    base_url = os.path.normpath(os.path.join(config_path.parent, options["baseUrl"]))
+                if paths is None and "paths" in options:
+                    paths_base = base_url or str(config_path.parent)
+                    paths = [(pattern, [os.path.normpath(os.path.join(paths_base, t)) for t in targets])
+                             for pattern, targets in options["paths"].items()]
+                parent = config.get("extends")
+                config_path = (config_path.parent / parent) if isinstance(parent, str) and parent.startswith(".") else None
+                if config_path and config_path.suffix != ".json":
+                    config_path = config_path.with_name(config_path.name + ".json")
+            if base_url is not None or paths is not None:
+                return base_url, paths or []
+
+        src = os.path.join(self.root, "src")
+        return None, [("@/*", [os.path.join(src if os.path.isdir(src) else self.root, "*")])]
+
+    def _candidates(self, base: str) -> Iterable[str]:
+        base = os.path.normpath(base)
+        stem, ext = os.path.splitext(base)
+        if ext in SOURCE_EXTENSIONS:
+            yield base
+            if ext in (".js", ".jsx"):
+                # ESM-style TypeScript imports name the emitted .js file
+                yield stem + ".ts"
+                yield stem + ".tsx"
+        for ext in RESOLVE_EXTENSIONS:
+            yield base + ext
+        for ext in RESOLVE_EXTENSIONS:
+            yield os.path.join(base, "index" + ext)
+
+    def resolve(self, importer: str, spec: str) -> Optional[str]:
+        """Project file an import specifier refers to; None for packages and files outside the graph"""
+        if spec.startswith("."):
+            bases = [os.path.join(os.path.dirname(importer), spec)]
+        else:
+            bases = []
+            for pattern, targets in self.aliases:
+                prefix, star, suffix = pattern.partition("*")
+                if star and spec.startswith(prefix) and spec.endswith(suffix) and len(spec) >= len(prefix) + len(suffix):
+                    matched = spec[len(prefix):len(spec) - len(suffix)]
+                    bases += [t.replace("*", matched, 1) for t in targets]
+                elif not star and spec == pattern:
+                    bases += targets
+            if self.base_url:
+                bases.append(os.path.join(self.base_url, spec))
+        for base in bases:
+            for candidate in self._candidates(base):
+                if candidate in self.nodes:
+                    return candidate
+        return None
+
+    # ------------------------------------------------------------------
+    #  Building and incremental updates
+    # ------------------------------------------------------------------
+
+    def _parse(self, path: str, st: os.stat_result) -> None:
+        # The shared store never invalidates: a file edited during this process
+        # would otherwise be parsed from its old text under its new mtime
+        shared_store().forget(path)
+        try:
+            parsed = parse_module(read_text(path, errors="ignore"))
+        except OSError:
+            self.nodes.pop(path, None)
+            return
+        self.nodes[path] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, **parsed}
+        self.reparsed += 1
+
+    def refresh(self) -> None:
+        """Walk the tree; re-parse new and changed files, drop deleted ones"""
+        present = set()
+        for path in walk_files(self.root, SOURCE_EXTENSIONS):
+            path = os.path.abspath(path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            present.add(path)
+            node = self.nodes.get(path)
+            if node is None or node["mtime_ns"] != st.st_mtime_ns or node["size"] != st.st_size:
+                self._parse(path, st)
+        for path in set(self.nodes) - present:
+            del self.nodes[path]
+        self._link()
+
+    def update(self, paths: Iterable[str]) -> None:
+        """
+        Re-parse just these files; missing ones are removed. Paths are absolute
+        or relative to the project root, e.g. from a watcher or from
+        `git diff --name-only --relative` run in the project (plain
+        --name-only prints paths relative to the repository root instead).
+        Files refresh() would not walk (skip directories, .gitignore) are left out.
+        """
+        for path in paths:
+            path = os.path.abspath(os.path.join(self.root, path))
+            if not walk_includes(self.root, path, SOURCE_EXTENSIONS):
+                self.nodes.pop(path, None)
+                continue
+            try:
+                self._parse(path, os.stat(path))
+            except OSError:
+                self.nodes.pop(path, None)
+        self._link()
+
+    def _link(self) -> None:
+        """Resolve every specifier against the current file set"""
+        self._edges, self._importers, self._closures = {}, {}, {}
+        for path, node in self.nodes.items():
+            edges = []
+            for kind, spec in node["imports"]:
+                target = self.resolve(path, spec)
+                if target and target != path:
+                    edges.append((kind, target))
+            self._edges[path] = edges
+            for target in dict.fromkeys(t for kind, t in edges if kind in STATIC):
+                self._importers.setdefault(target, []).append(path)
+
+    # ------------------------------------------------------------------
+    #  Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        if not self.persist:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == GRAPH_FORMAT:
+            self.nodes = {os.path.join(self.root, rel): node for rel, node in data.get("files", {}).items()}
+
+    def save(self) -> None:
+        if not self.persist:
+            return
+        files = {os.path.relpath(path, self.root): node for path, node in self.nodes.items()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": GRAPH_FORMAT, "files": files}, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            # Unwritable cache directory: keep the in-memory graph, as AuditCache.save does
+            self.persist = False
+
+    # ------------------------------------------------------------------
+    #  Queries
+    # ------------------------------------------------------------------
+
+    def imports(self, path: str, kinds: Tuple[str, ...] = STATIC) -> List[str]:
+        """Resolved project files a module imports, in source order"""
+        return [target for kind, target in self._edges.get(path, ()) if kind in kinds]
+
+    def specifiers(self, path: str, kinds: Tuple[str, ...] = STATIC) -> List[str]:
+        """Raw specifiers of a module (packages included)"""
+        node = self.nodes.get(path)
+        return [spec for kind, spec in node["imports"] if kind in kinds] if node else []
+
+    def importers(self, path: str) -> List[str]:
+        """Modules that statically import path"""
+        return self._importers.get(path, [])
+
+    def is_barrel(self, path: str) -> bool:
+        node = self.nodes.get(path)
+        return bool(node and node["barrel"])
+
+    def size(self, path: str) -> int:
+        return self.nodes[path]["size"] if path in self.nodes else 0
+
+    def closure(self, *roots: str) -> frozenset:
+        """Every project file reachable from roots over static edges, roots included"""
+        key = roots[0] if len(roots) == 1 else None
+        if key in self._closures:
+            return self._closures[key]
+        seen: Set[str] = set()
+        queue = deque(r for r in roots if r in self.nodes)
+        seen.update(queue)
+        while queue:
+            for target in self.imports(queue.popleft()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        result = frozenset(seen)
+        if key is not None:
+            self._closures[key] = result
+        return result
+
+    def weight(self, paths: Iterable[str]) -> int:
+        return sum(self.size(p) for p in paths)
+
+    def entries(self) -> List[Tuple[str, List[str]]]:
+        """
+        Next.js entry pages as (page, roots): app/**/page.* with the layout.* of
+        every enclosing route segment, and pages/** (outside pages/api, _app and
+        _document) with pages/_app. src/app and src/pages count too.
+        """
+        result = []
+        app_dirs = [os.path.join(self.root, d, "app") for d in ("", "src")]
+        pages_dirs = [os.path.join(self.root, d, "pages") for d in ("", "src")]
+        for path in sorted(self.nodes):
+            stem = os.path.splitext(os.path.basename(path))[0]
+            app = next((d for d in app_dirs if path.startswith(d + os.sep)), None)
+            if app and stem == "page":
+                roots = [path]
+                directory = os.path.dirname(path)
+                while True:
+                    roots += [os.path.join(directory, "layout" + ext) for ext in SOURCE_EXTENSIONS
+                              if os.path.join(directory, "layout" + ext) in self.nodes]
+                    if directory == app:
+                        break
+                    directory = os.path.dirname(directory)
+                result.append((path, roots))
+                continue
+            pages = next((d for d in pages_dirs if path.startswith(d + os.sep)), None)
+            if pages and not stem.startswith("_") and not path.startswith(os.path.join(pages, "api") + os.sep):
+                # pages/_app wraps every page
+                app_shell = [os.path.join(pages, "_app" + ext) for ext in SOURCE_EXTENSIONS
+                             if os.path.join(pages, "_app" + ext) in self.nodes]
+                result.append((path, [path] + app_shell))
+        return result
+
+
+# ============================================================================
+#  MAIN
+# ============================================================================
+
+def bundle_report(graph: ModuleGraph) -> List[dict]:
+    """Static import closure of every entry page, heaviest first"""
+    report = []
+    for page, roots in graph.entries():
+        files = graph.closure(*roots)
+        report.append({
+            "page": os.path.relpath(page, graph.root),
+            "files": len(files),
+            "bytes": graph.weight(files),
+            "barrels": sorted(os.path.relpath(f, graph.root) for f in files if graph.is_barrel(f)),
+        })
+    report.sort(key=lambda r: (-r["bytes"], r["page"]))
+    return report
+
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2 or argv[1].startswith("-"):
+        print("Usage: python import_graph.py <project> [--json] [--no-cache]")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    graph = ModuleGraph.open(argv[1], persist="--no-cache" not in argv)
+    graph.save()
+    report = bundle_report(graph)
+    elapsed = time.perf_counter() - start
+
+    if "--json" in argv:
+        print(json.dumps({"files": len(graph.nodes), "reparsed": graph.reparsed, "entries": report}, indent=2))
+        return
+
+    edges = sum(len(graph.imports(p)) for p in graph.nodes)
+    print(f"[IMPORT GRAPH] {len(graph.nodes)} files, {edges} static edges "
+          f"({graph.reparsed} parsed, {len(graph.nodes) - graph.reparsed} from cache) in {elapsed:.2f}s")
+    print("-" * 60)
+    if not report:
+        print("No entry pages found (app/**/page.*, pages/**)")
+    for entry in report:
+        barrels = f", {len(entry['barrels'])} barrel(s)" if entry["barrels"] else ""
+        print(f"  {entry['bytes'] / 1024:>8.1f} KB  {entry['files']:>5} files  {entry['page']}{barrels}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Incremental updates and persistence of import_graph.ModuleGraph"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import import_graph  # noqa: E402
+from file_index import read_text  # noqa: E402
+from import_graph import ModuleGraph  # noqa: E402
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(import_graph, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.delenv("AGENT_AUDIT_NO_CACHE", raising=False)
+    root = tmp_path / "app-project"
+    (root / "app").mkdir(parents=True)
+    (root / "app" / "a.tsx").write_text("export const A = 1\n")
+    (root / "app" / "b.tsx").write_text("export const B = 2\n")
+    (root / "app" / "page.tsx").write_text("import { A } from './a'\nexport default A\n")
+    return root
+
+
+def _targets(graph, path):
+    return [os.path.basename(p) for p in graph.imports(str(path))]
+
+
+def _edit(path, text):
+    # A different size guarantees the change is seen even on a coarse mtime clock
+    st = os.stat(path)
+    path.write_text(text)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_edit_update_save_reopen(project):
+    page = project / "app" / "page.tsx"
+    graph = ModuleGraph.open(project)
+    graph.save()
+    assert _targets(graph, page) == ["a.tsx"]
+    # Puts the old text in the process-wide content store
+    assert "./a" in read_text(page)
+
+    _edit(page, "import { B } from './b'\nexport default function Page() { return B }\n")
+    graph.update(["app/page.tsx"])
+    graph.save()
+    assert _targets(graph, page) == ["b.tsx"]
+
+    reopened = ModuleGraph.open(project)
+    assert reopened.reparsed == 0
+    assert _targets(reopened, page) == ["b.tsx"]
+
+
+def test_refresh_sees_edit_in_same_process(project):
+    page = project / "app" / "page.tsx"
+    graph = ModuleGraph.open(project)
+    _edit(page, "import { B } from './b'\n")
+    graph.refresh()
+    assert _targets(graph, page) == ["b.tsx"]
+
+
+def test_update_skips_ignored_and_pruned_paths(project):
+    (project / ".gitignore").write_text("generated/\n")
+    for directory in ("generated", "node_modules/pkg"):
+        (project / directory).mkdir(parents=True)
+        (project / directory / "x.ts").write_text("export const X = 1\n")
+    graph = ModuleGraph.open(project)
+    before = set(graph.nodes)
+    graph.update(["generated/x.ts", "node_modules/pkg/x.ts"])
+    assert set(graph.nodes) == before
+
+
+def test_unwritable_cache_dir_keeps_graph(project, monkeypatch, tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setattr(import_graph, "CACHE_DIR", blocker / "cache")
+    graph = ModuleGraph.open(project)
+    graph.save()
+    assert not graph.persist
+    assert _targets(graph, project / "app" / "page.tsx") == ["a.tsx"]
+
+
+def test_type_reexport_barrel():
+    parsed = import_graph.parse_module(
+        "export * from './a'\nexport * from './b'\nexport type { T } from './t'\n")
+    assert parsed["barrel"]
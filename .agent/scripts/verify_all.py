@@ -8,6 +8,8 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --isolate   # every check in its own interpreter
+    python scripts/verify_all.py . --url <URL> --jobs 1    # one check at a time, in suite order
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -20,15 +22,30 @@ Includes ALL checks:
     ✅ Playwright E2E
     ✅ Bundle Analysis (if applicable)
     ✅ Mobile Audit (if applicable)
+
+Checks whose script exposes run(context) execute in this interpreter and share
+one file content store; the rest run as subprocesses (see check_runner.py).
+
+Scheduling: independent checks run concurrently on --jobs workers, highest
+priority first; a check listed in CHECK_DEPENDENCIES waits for its
+prerequisites. Results stream as each check finishes. Checks of a gating
+category (P0 security) are prerequisites of every later category, so nothing
+else runs alongside them, and a failing required gate check stops the suite;
+any required failure with --stop-on-fail stops new checks from starting. In-process checks share the GIL, so
+CPU-bound audits gain most from --isolate.
 """
 
+import os
 import sys
-import subprocess
+import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from check_runner import Context, run_check
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -59,9 +76,10 @@ def print_error(text: str):
 
 # Complete verification suite
 VERIFICATION_SUITE = [
-    # P0: Security (CRITICAL)
+    # P0: Security (CRITICAL) - a required failure here stops the suite
     {
         "category": "Security",
+        "gate": True,
         "checks": [
             ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
             ("Dependency Analysis", ".agent/skills/vulnerability-scanner/scripts/dependency_analyzer.py", False),
@@ -147,57 +165,119 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+# Ordering constraints between checks; everything else may run concurrently
+CHECK_DEPENDENCIES = {
+    # E2E traffic would skew Lighthouse's measurements of the same server
+    "Playwright E2E": ["Lighthouse Audit"],
+}
+
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None, isolate: bool = False) -> dict:
+    """Run validation script (in-process when it exposes run(context)); prints nothing"""
     if not script_path.exists():
-        print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
-    
-    print_step(f"Running: {name}")
-    start_time = datetime.now()
-    
-    # Build command
-    cmd = ["python", str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
-    
-    # Run
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
-        
-        duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
-        
-        return {
-            "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False,
-            "duration": duration
-        }
-    
-    except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
+    return run_check(name, script_path, Context(project_path, url, timeout=600), isolate)  # 10 minute timeout for slow checks
+
+def print_result(result: dict):
+    """Stream one finished check"""
+    name = f"[{result['category']}] {result['name']}"
+    duration = result.get("duration", 0)
+    if result.get("skipped"):
+        print_warning(f"{name}: Script not found, skipping")
+    elif result.get("timeout"):
         print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
-    
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
+    elif result["passed"]:
+        print_success(f"{name}: PASSED ({duration:.1f}s, {result['mode']})")
+    else:
+        print_error(f"{name}: FAILED ({duration:.1f}s, {result['mode']})")
+        if result.get("error"):
+            print(f"  {result['error'][:300]}")
+
+def run_suite(plan: List[dict], project_path: str, url: Optional[str], jobs: int = DEFAULT_JOBS,
+              isolate: bool = False, stop_on_fail: bool = False) -> List[dict]:
+    """
+    Run the planned checks as a dependency DAG on `jobs` workers.
+
+    Ready checks start in plan (priority) order. Each result gets start/end
+    offsets in seconds from the suite start, streams as soon as it finishes,
+    and the list comes back in plan order. Gate checks finish before any check
+    of a later category starts. Checks never started because of a gating
+    failure are left out.
+    """
+    names = {check["name"] for check in plan}
+    waiting_on = {check["name"]: {d for d in CHECK_DEPENDENCIES.get(check["name"], []) if d in names} for check in plan}
+    gates = []
+    for check in plan:
+        waiting_on[check["name"]].update(name for name, category in gates if category != check["category"])
+        if check.get("gate"):
+            gates.append((check["name"], check["category"]))
+    pending = list(plan)
+    running = {}
+    finished = {}
+    stopped = False
+    suite_start = time.perf_counter()
+
+    def execute(check):
+        started = time.perf_counter() - suite_start
+        result = run_script(check["name"], check["script"], project_path, url, isolate)
+        result.update(category=check["category"], start=started, end=time.perf_counter() - suite_start)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while (pending and not stopped) or running:
+            if not stopped:
+                for check in [c for c in pending if not waiting_on[c["name"]]]:
+                    if len(running) >= jobs:
+                        break
+                    pending.remove(check)
+                    print_step(f"Started: [{check['category']}] {check['name']}")
+                    running[pool.submit(execute, check)] = check
+            if not running:
+                break  # only checks whose prerequisites can never finish are left
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                check = running.pop(future)
+                result = future.result()
+                finished[check["name"]] = result
+                print_result(result)
+                for deps in waiting_on.values():
+                    deps.discard(check["name"])
+
+                failed = check["required"] and not result["passed"] and not result.get("skipped")
+                if failed and (check.get("gate") or stop_on_fail) and not stopped:
+                    stopped = True
+                    print_error(f"CRITICAL: {check['name']} failed. No further checks will start.")
+
+    return [finished[check["name"]] for check in plan if check["name"] in finished]
+
+def print_critical_path(results: List[dict], wall_time: float):
+    """Explain where wall time went: the chain of checks that ended last"""
+    ran = [r for r in results if not r.get("skipped")]
+    if not ran:
+        return
+    print(f"{Colors.BOLD}⏱  Critical Path:{Colors.ENDC}")
+
+    # Walk back from the last check to finish. Each check started either when a
+    # prerequisite finished or when a worker slot freed up: whichever ended last
+    # before it started is what it was waiting for.
+    by_name = {r["name"]: r for r in ran}
+    chain = [max(ran, key=lambda r: r["end"])]
+    while True:
+        current = chain[-1]
+        blockers = [by_name[d] for d in CHECK_DEPENDENCIES.get(current["name"], []) if d in by_name]
+        blockers += [r for r in ran if r is not current and r["end"] <= current["start"] + 1e-3]
+        if not blockers or current["start"] < 1e-3:
+            break
+        chain.append(max(blockers, key=lambda r: r["end"]))
+
+    for r in reversed(chain):
+        share = r["duration"] / wall_time * 100 if wall_time else 0
+        print(f"  {r['start']:>6.1f}s → {r['end']:>6.1f}s  {r['name']} ({r['duration']:.1f}s, {share:.0f}% of wall time)")
+    busy = sum(r["duration"] for r in ran)
+    print(f"  Check time {busy:.1f}s in {wall_time:.1f}s wall time ({busy / wall_time if wall_time else 0:.1f}x parallelism)")
+    print()
 
 def print_final_report(results: List[dict], start_time: datetime):
     """Print comprehensive final report"""
@@ -235,11 +315,13 @@ def print_final_report(results: List[dict], start_time: datetime):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        duration_str = f"({r.get('duration', 0):.1f}s)" if not r.get("skipped") else ""
+        duration_str = f"({r.get('duration', 0):.1f}s, {r['mode']})" if not r.get("skipped") else ""
         print(f"  {status} {r['name']} {duration_str}")
     
     print()
     
+    print_critical_path(results, total_duration)
+    
     # Failed checks detail
     if failed > 0:
         print(f"{Colors.BOLD}{Colors.RED}❌ FAILED CHECKS:{Colors.ENDC}")
@@ -274,6 +356,8 @@ Examples:
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--isolate", action="store_true", help="Run every check as a subprocess instead of in-process")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help=f"Checks to run at once (default: {DEFAULT_JOBS})")
     
     args = parser.parse_args()
     
@@ -289,9 +373,9 @@ Examples:
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
-    results = []
     
-    # Run all verification categories
+    # Plan every check of every applicable category, in priority order
+    plan = []
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
         requires_url = suite.get("requires_url", False)
@@ -304,19 +388,21 @@ Examples:
         if args.no_e2e and category == "E2E Testing":
             continue
         
-        print_header(f"📋 {category.upper()}")
-        
         for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+            plan.append({
+                "name": name,
+                "script": project_path / script_path,
+                "required": required,
+                "category": category,
+                "gate": suite.get("gate", False),
+            })
+    
+    print_header(f"📋 RUNNING {len(plan)} CHECKS ({args.jobs} at a time)")
+    results = run_suite(plan, str(project_path), args.url, args.jobs, args.isolate, args.stop_on_fail)
+    
+    if len(results) < len(plan):
+        print_final_report(results, start_time)
+        sys.exit(1)
     
     # Print final report
     all_passed = print_final_report(results, start_time)
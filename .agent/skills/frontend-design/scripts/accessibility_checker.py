@@ -20,6 +20,10 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import walk_files, read_text
+from audit_cache import open_cache
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -29,16 +33,16 @@ except:
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
+    extensions = {'.html', '.jsx', '.tsx'}
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    for f in walk_files(project_path, extensions, skip_dirs):
+        files.append(Path(f))
+        if len(files) == 50:
+            break
     
-    return files[:50]
+    return files
 
 
 def check_accessibility(file_path: Path) -> list:
@@ -46,7 +50,7 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -108,8 +112,9 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    project_path = Path(argv[1] if len(argv) > 1 else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -137,13 +142,16 @@ def main():
     # Check each file
     all_issues = []
     
+    cache = open_cache("accessibility_checker", project_path, __file__) if "--no-cache" not in argv else None
     for f in files:
-        issues = check_accessibility(f)
+        issues = cache.result(f, lambda: check_accessibility(f)) if cache else check_accessibility(f)
         if issues:
             all_issues.append({
                 "file": str(f.name),
                 "issues": issues
             })
+    if cache:
+        cache.save()
     
     # Summary
     print("\n" + "="*60)
@@ -171,7 +179,8 @@ def main():
         "files_checked": len(files),
         "files_with_issues": len(all_issues),
         "issues_found": total_issues,
-        "passed": passed
+        "passed": passed,
+        **({"cache": cache.stats()} if cache else {})
     }
     
     print("\n" + json.dumps(output, indent=2))
@@ -179,5 +188,11 @@ def main():
     sys.exit(0 if passed else 1)
 
 
+def run(context):
+    """In-process entry point for checklist.py / verify_all.py"""
+    from check_runner import run_main
+    return run_main(main, [__file__, context.project_path])
+
+
 if __name__ == "__main__":
     main()
@@ -93,591 +93,526 @@ import sys
 import os
 import re
 import json
+import time
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import walk_files, read_text
+from audit_cache import open_cache
+
+AUDIT_EXTENSIONS = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+
+# ============================================================================
+#  FEATURE TABLE
+# ============================================================================
+#
+# Every pattern the audit looks for is compiled once, here. A feature is
+# evaluated at most once per file and only when a rule asks for it; its anchors
+# are literals (lower case) of which at least one occurs in every match, so a
+# file without any of them is answered with a substring test on one casefolded
+# copy of the content instead of a regex scan. `--check` verifies the anchors.
+
+ANY, COUNT, ALL = "any", "count", "all"
+
+class Feature:
+    """A precompiled pattern, how its hits are recorded, and the anchors that gate it"""
+    __slots__ = ("regex", "anchors", "kind")
+
+    def __init__(self, pattern: str, anchors: tuple, kind: str = ANY, flags: int = 0):
+        self.regex = re.compile(pattern, flags)
+        self.anchors = anchors
+        self.kind = kind
+
+    def evaluate(self, content: str, folded: str = None):
+        if folded is not None and self.anchors and not any(a in folded for a in self.anchors):
+            return {ANY: False, COUNT: 0, ALL: []}[self.kind]
+        if self.kind == ANY:
+            return self.regex.search(content) is not None
+        if self.kind == COUNT:
+            return sum(1 for _ in self.regex.finditer(content))
+        return self.regex.findall(content)
+
+I = re.IGNORECASE
+
+FEATURES = {
+    # Page shape
+    "long_text": Feature(r'<p|<div.*class=.*text|article|<span.*text', ("<p", "<div", "article", "<span"), flags=I),
+    "form": Feature(r'<form|<input|password|credit|card|payment', ("<form", "<input", "password", "credit", "card", "payment"), flags=I),
+    "complex_elements": Feature(r'<input|<select|<textarea|<option', ("<input", "<select", "<textarea", "<option"), COUNT, I),
+    "form_fields": Feature(r'<input|<select|<textarea', ("<input", "<select", "<textarea"), COUNT, I),
+    "nav_items": Feature(r'<NavLink|<Link|<a\s+href|nav-item', ("<navlink", "<link", "<a", "nav-item"), COUNT, I),
+    "nav_labels": Feature(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', ("<navlink", "<link", "<a"), ALL, I),
+    "hero": Feature(r'hero|<h1|banner', ("hero", "<h1", "banner"), flags=I),
+    "footer": Feature(r'footer|<footer', ("footer",), flags=I),
+    "images": Feature(r'<img|background-image:|bg-\[url', ("<img", "background-image:", "bg-[url")),
+    "img_without_alt": Feature(r'<img(?![^>]*alt=)[^>]*>', ("<img",)),
+    # Psychology and trust
+    "small_height": Feature(r'height:\s*([0-3]\d)px', ("height:",)),
+    "small_h_class": Feature(r'h-[1-9]\b|h-10\b', ("h-",)),
+    "multi_step": Feature(r'step|wizard|stage', ("step", "wizard", "stage"), flags=I),
+    "primary_cta": Feature(r'primary|bg-primary|Button.*primary|variant=["\']primary', ("primary",), flags=I),
+    "click": Feature(r'onClick|@click|onclick', ("onclick", "@click")),
+    "feedback": Feature(r'transition|animate|hover:|focus:|disabled|loading|spinner',
+                        ("transition", "animate", "hover:", "focus:", "disabled", "loading", "spinner"), flags=I),
+    "state_change": Feature(r'setState|useState|disabled|loading', ("setstate", "usestate", "disabled", "loading")),
+    "reflective": Feature(r'about|story|mission|values|why we|our journey|testimonials',
+                          ("about", "story", "mission", "values", "why we", "our journey", "testimonials"), flags=I),
+    "security_signals": Feature(r'ssl|secure|encrypt|lock|padlock|https', ("ssl", "secure", "encrypt", "lock", "https"), flags=I),
+    "checkout": Feature(r'checkout|payment', ("checkout", "payment"), flags=I),
+    "social_proof": Feature(r'review|testimonial|rating|star|trust|trusted by|customer|logo',
+                            ("review", "testimonial", "rating", "star", "trust", "customer", "logo"), flags=I),
+    "authority": Feature(r'certif|award|media|press|featured|as seen in',
+                         ("certif", "award", "media", "press", "featured", "as seen in"), flags=I),
+    "progressive": Feature(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more',
+                           ("step", "wizard", "stage", "accordion", "collapsible", "tab", "more...", "advanced", "show more"), flags=I),
+    "color_tokens": Feature(r'#[0-9a-fA-F]{3,6}|rgb|hsl', ("#", "rgb", "hsl"), COUNT),
+    "border_tokens": Feature(r'border:|border-', ("border:", "border-"), COUNT),
+    "labels": Feature(r'<label|placeholder|aria-label', ("<label", "placeholder", "aria-label"), flags=I),
+    "defaults": Feature(r'checked|selected|default|value=["\'].*["\']', ("checked", "selected", "default", "value=")),
+    "radio": Feature(r'type=["\']radio', ("type=",), flags=I),
+    "price": Feature(r'price|pricing|cost|\$\d+', ("price", "pricing", "cost", "$"), flags=I),
+    "price_anchor": Feature(r'original|was|strike|del|save \d+%', ("original", "was", "strike", "del", "save "), flags=I),
+    "social": Feature(r'join|subscriber|member|user', ("join", "subscriber", "member", "user"), flags=I),
+    "numbers": Feature(r'\d+[+kmb]|\d+,\d+', ()),
+    "progress": Feature(r'progress|step \d+|complete|%|bar', ("progress", "step ", "complete", "%", "bar"), flags=I),
+    # Typography
+    "font_faces": Feature(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', ("@font-face",), ALL, I),
+    "google_fonts": Feature(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', ("fonts.googleapis.com",), ALL, I),
+    "font_family_css": Feature(r'font-family:\s*([^;]+)', ("font-family:",), ALL, I),
+    "measure": Feature(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', ("max-w-", "max-width:")),
+    "text_elements": Feature(r'<p|<span|<div.*text|<h[1-6]', ("<p", "<span", "<div", "<h"), flags=I),
+    "leading": Feature(r'leading-|line-height:', ("leading-", "line-height:")),
+    "heading_text": Feature(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', ("<h", "text-"), flags=I),
+    "line_heights": Feature(r'(?:leading-|line-height:\s*)([\d.]+)', ("leading-", "line-height:"), ALL),
+    "uppercase": Feature(r'uppercase|text-transform:\s*uppercase', ("uppercase",), flags=I),
+    "tracking": Feature(r'tracking-|letter-spacing:', ("tracking-", "letter-spacing:")),
+    "display_text": Feature(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', ("text-", "font-size:")),
+    "tracking_tight": Feature(r'tracking-tight|letter-spacing:\s*-[0-9]', ("tracking-tight", "letter-spacing:")),
+    "weights": Feature(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)',
+                       ("font-", "fw-"), ALL, I),
+    "font_sizes": Feature(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', ("font-size:", "text-")),
+    "fluid_type": Feature(r'clamp\(|responsive:', ("clamp(", "responsive:")),
+    "headings": Feature(r'<(h[1-6])', ("<h",), ALL, I),
+    "font_size_values": Feature(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', ("font-size:",), ALL),
+    "paragraphs": Feature(r'<p[^>]*>([^<]+)</p>', ("<p",), ALL, I),
+    "subheadings": Feature(r'<h[2-6]', ("<h",), flags=I),
+    # Visual effects
+    "blur_effects": Feature(r'backdrop-filter|blur\(', ("backdrop-filter", "blur("), COUNT),
+    "translucent": Feature(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', ("background:", "bg-")),
+    "keyframes_or_transition": Feature(r'@keyframes|transition:', ("@keyframes", "transition:")),
+    "expensive_props": Feature(r'width|height|top|left|right|bottom|margin|padding',
+                               ("width", "height", "top", "left", "right", "bottom", "margin", "padding"), ALL),
+    "reduced_motion": Feature(r'prefers-reduced-motion', ("prefers-reduced-motion",)),
+    "box_shadows": Feature(r'box-shadow:\s*([^;]+)', ("box-shadow:",), ALL),
+    "opacities": Feature(r'rgba?\([^)]+,\s*([\d.]+)\)', ("rgb",), ALL),
+    "gradient": Feature(r'gradient|linear-gradient|radial-gradient|conic-gradient', ("gradient",)),
+    "gradient_count": Feature(r'gradient', ("gradient",), COUNT, I),
+    "background": Feature(r'background:|bg-', ("background:", "bg-")),
+    "border_declarations": Feature(r'border:', ("border:",), COUNT),
+    "text_shadows": Feature(r'text-shadow:', ("text-shadow:",), COUNT),
+    "glow_shadows": Feature(r'box-shadow:\s*[^;]*0\s+0\s+', ("box-shadow:",), COUNT),
+    "overlay": Feature(r'overlay|rgba\(0|gradient.*transparent|::after|::before',
+                       ("overlay", "rgba(0", "gradient", "::after", "::before")),
+    "will_change": Feature(r'will-change:\s*([^;]+)', ("will-change:",), ALL),
+    "will_change_count": Feature(r'will-change:', ("will-change:",), COUNT),
+    # Color
+    "hex_colors": Feature(r'#[0-9a-fA-F]{3,6}', ("#",), COUNT),
+    "hsl": Feature(r'hsl\(', ("hsl(",), COUNT),
+    "bg_declarations": Feature(r'(?:background|bg-|bg\[)([^;}\s]+)', ("background", "bg-", "bg[")),
+    "text_declarations": Feature(r'(?:color|text-)([^;}\s]+)', ("color", "text-")),
+    "hex6_colors": Feature(r'#[0-9a-fA-F]{6}', ("#",), ALL),
+    "hsl_hues": Feature(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', ("hsl(",), ALL),
+    "pure_black": Feature(r'color:\s*#000000|#000\b', ("#000",)),
+    "pure_white": Feature(r'background:\s*#ffffff|#fff\b', ("#fff",)),
+    "dark_mode": Feature(r'dark:\s*|dark:', ("dark:",)),
+    "light_on_light": Feature(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', ("bg-",)),
+    "dark_on_dark": Feature(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', ("bg-",)),
+    "blue": Feature(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', ("-blue", "#")),
+    "food": Feature(r'restaurant|food|cooking|recipe|menu|dish|meal',
+                    ("restaurant", "food", "cooking", "recipe", "menu", "dish", "meal"), flags=I),
+    "color_vars": Feature(r'--color-|color-|primary-|secondary-', ("color-", "primary-", "secondary-")),
+    # Animation and motion
+    "durations": Feature(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', ("duration:",), ALL),
+    "ease_in_entry": Feature(r'ease-in\s+.*entry|fade-in.*ease-in', ("ease-in",)),
+    "ease_out_exit": Feature(r'ease-out\s+.*exit|fade-out.*ease-out', ("ease-out",)),
+    "interactive": Feature(r'<button|<a\s+href|onClick|@click', ("<button", "<a", "onclick", "@click"), COUNT),
+    "hover_focus": Feature(r'hover:|focus:|:hover|:focus', ("hover", "focus")),
+    "async": Feature(r'async|await|fetch|axios|loading|isLoading', ("async", "await", "fetch", "axios", "loading")),
+    "loading_indicator": Feature(r'skeleton|spinner|progress|loading|<circle.*animate',
+                                 ("skeleton", "spinner", "progress", "loading", "<circle")),
+    "routing": Feature(r'router|navigate|Link.*to|useHistory', ("router", "navigate", "link", "usehistory")),
+    "page_transition": Feature(r'AnimatePresence|motion\.|transition.*page|fade.*route',
+                               ("animatepresence", "motion.", "transition", "fade")),
+    "scroll_animation": Feature(r'onScroll|scroll.*trigger|IntersectionObserver', ("scroll", "intersectionobserver")),
+    "scroll_layout": Feature(r'onScroll.*[^\w](width|height|top|left)', ("onscroll",)),
+    "animations": Feature(r'@keyframes|transition:|animate-', ("@keyframes", "transition:", "animate-"), COUNT),
+    "lottie": Feature(r'lottie|Lottie|@lottie-react', ("lottie",)),
+    "lottie_fallback": Feature(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', ("lottie",)),
+    "gsap": Feature(r'gsap|ScrollTrigger|from\(.*gsap', ("gsap", "scrolltrigger")),
+    "gsap_cleanup": Feature(r'kill\(|revert\(|useEffect.*return.*gsap', ("kill(", "revert(", "useeffect")),
+    "svg_animations": Feature(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset',
+                              ("<animate", "stroke-dash"), COUNT),
+    "transform_3d": Feature(r'transform3d|perspective\(|rotate3d|translate3d',
+                            ("transform3d", "perspective(", "rotate3d", "translate3d")),
+    "perspective": Feature(r'perspective:\s*\d+px|perspective\s*\(', ("perspective",)),
+    "particles": Feature(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js',
+                         ("particle", "canvas", "requestanimationframe", "three.js")),
+    "scroll_driven": Feature(r'IntersectionObserver.*animate|scroll.*progress|view-timeline',
+                             ("intersectionobserver", "scroll", "view-timeline")),
+    "throttle": Feature(r'throttle|debounce|requestAnimationFrame', ("throttle", "debounce", "requestanimationframe")),
+    "functional_animations": Feature(r'hover:|focus:|disabled|loading|error|success',
+                                     ("hover:", "focus:", "disabled", "loading", "error", "success"), COUNT),
+}
+
+SHADOW_Y_OFFSET = re.compile(r'\d+px\s+[1-9]\d*px')
+GENERIC_FONTS = {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia',
+                 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}
+NAMED_WEIGHTS = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500',
+                 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+MODULAR_RATIOS = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
+LAYOUT_PROPS = {'width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding'}
+IMPORTANT_NAV = ['contact', 'login', 'sign', 'get started', 'cta', 'button']
+PURPLES = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
+           '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
+           '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
+           'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
+
+# Values derived from other features (or from the lower-cased text) rather than from a pattern of their own
+
+def _font_families(v) -> set:
+    families = set()
+    for font in v["font_faces"]: families.add(font.strip().lower())
+    for font in v["google_fonts"]:
+        for f in font.replace('+', ' ').split('|'):
+            families.add(f.split(':')[0].strip().lower())
+    for family in v["font_family_css"]:
+        # First font of the stack
+        first_font = family.split(',')[0].strip().strip('"\'')
+        if first_font.lower() not in GENERIC_FONTS:
+            families.add(first_font.lower())
+    return families
+
+def _weight_values(v) -> list:
+    values = []
+    for w in v["weights"]:
+        val = w[0] or w[1]
+        if val:
+            try:
+                values.append(int(NAMED_WEIGHTS.get(val.lower(), val)))
+            except: pass
+    return values
+
+def _off_scale_ratio(v):
+    """First of the lowest three ratios between font sizes that is not a common modular scale, if any"""
+    sizes = [float(size) if unit in ('rem', 'em') else float(size) / 16 for size, unit in v["font_size_values"]]
+    if len(sizes) <= 2:
+        return None
+    sizes = sorted(set(sizes))
+    ratios = [sizes[i] / sizes[i-1] for i in range(1, len(sizes)) if sizes[i-1] > 0]
+    return next((r for r in ratios[:3] if not any(abs(r - cr) < 0.05 for cr in MODULAR_RATIOS)), None)
+
+def _shadow_opacities(v) -> list:
+    return [float(o) for o in v["opacities"] if float(o) < 0.5]
+
+def _hue_range(v):
+    hues = [int(h) for h in v["hsl_hues"]]
+    return max(hues) - min(hues) if len(hues) >= 3 else None
+
+def _duration_finding(v, duration: str, unit: str):
+    duration_ms = float(duration) * (1000 if unit == 's' else 1)
+    if duration_ms < 50:
+        return f"Very fast animation ({duration}{unit}). Minimum 50ms for visibility."
+    if duration_ms > 1000 and 'transition' in v.lower:
+        return f"Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness."
+    return None
+
+DERIVED = {
+    "last_nav_unimportant": lambda v: len(v["nav_labels"]) > 2 and not any(x in v["nav_labels"][-1].lower() for x in IMPORTANT_NAV),
+    "font_families": _font_families,
+    "weight_values": _weight_values,
+    "off_scale_ratio": _off_scale_ratio,
+    "effect_count": lambda v: v["gradient"] + len(v["box_shadows"]) + v["blur_effects"] + v["text_shadows"],
+    "shadow_opacities": _shadow_opacities,
+    "unique_hexes": lambda v: len(set(v["hex6_colors"])),
+    "hue_range": _hue_range,
+    "purple": lambda v: next((p for p in PURPLES if p.lower() in v.lower), None),
+    "total_animations": lambda v: v["animations"] + v["lottie"] + v["gsap"],
+}
+
+class FeatureVector:
+    """Feature values of one file, each computed on first use; with prefilter=False every pattern really runs"""
+
+    def __init__(self, content: str, prefilter: bool = True):
+        self.content = content
+        self.folded = content.casefold() if prefilter else None
+        self._lower = None
+        self._values = {}
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.content.lower()
+        return self._lower
+
+    def __getitem__(self, name: str):
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        feature = FEATURES.get(name)
+        value = feature.evaluate(self.content, self.folded) if feature else DERIVED[name](self)
+        self._values[name] = value
+        return value
+
+# ============================================================================
+#  RULE TABLE
+# ============================================================================
+
+ISSUE, WARNING, PASS = "issues", "warnings", "passed"
+
+class Rule:
+    """
+    One check. `when(v)` decides whether it fires; `each(v)` instead yields one
+    item per finding. The message is formatted with {filename}, {v[feature]}
+    and {item}.
+    """
+    __slots__ = ("level", "message", "when", "each")
+
+    def __init__(self, tag: str, level: str, message: str, when=None, each=None):
+        self.level = level
+        self.message = f"[{tag}] {{filename}}: {message}" if tag else ""
+        self.when = when
+        self.each = each
+
+    def evaluate(self, v: FeatureVector, filename: str):
+        if self.each is not None:
+            for item in self.each(v):
+                yield self.message.format(filename=filename, v=v, item=item)
+        elif self.when(v):
+            yield self.message.format(filename=filename, v=v)
+
+RULES = [
+    # --- 1. PSYCHOLOGY LAWS ---
+    Rule("Hick's Law", ISSUE, "{v[nav_items]} nav items (Max 7)",
+         lambda v: v["nav_items"] > 7),
+    Rule("Fitts' Law", WARNING, "Small targets (< 44px)",
+         lambda v: v["small_height"] or v["small_h_class"]),
+    Rule("Miller's Law", WARNING, "Complex form ({v[form_fields]} fields)",
+         lambda v: v["form_fields"] > 7 and not v["multi_step"]),
+    Rule("Von Restorff", WARNING, "No primary CTA",
+         lambda v: 'button' in v.lower and not v["primary_cta"]),
+    Rule("Serial Position", WARNING, "Last nav item may not be important. Place key actions at start/end.",
+         lambda v: v["nav_items"] > 3 and v["last_nav_unimportant"]),
+
+    # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
+    Rule("Visceral", WARNING, "Hero section lacks visual appeal. Consider gradients or subtle animations.",
+         lambda v: v["hero"] and not (v["gradient"] or v["animations"]) and not v["background"]),
+    Rule("Behavioral", WARNING, "Interactive elements lack immediate feedback. Add hover/focus/disabled states.",
+         lambda v: v["click"] and not v["feedback"] and not v["state_change"]),
+    Rule("Reflective", WARNING, "Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.",
+         lambda v: v["long_text"] and not v["reflective"]),
+
+    # --- 1.6 TRUST BUILDING ---
+    Rule("Trust", WARNING, "Form without security indicators. Add 'SSL Secure' or lock icon.",
+         lambda v: v["form"] and not v["security_signals"] and not v["checkout"]),
+    Rule(None, PASS, "", lambda v: v["social_proof"]),
+    Rule("Trust", WARNING, "No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.",
+         lambda v: not v["social_proof"] and v["long_text"]),
+    Rule("Trust", WARNING, "Footer lacks authority signals. Add certifications, awards, or media mentions.",
+         lambda v: v["footer"] and not v["authority"]),
+
+    # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
+    Rule("Cognitive Load", WARNING, "Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.",
+         lambda v: v["complex_elements"] > 5 and not v["progressive"]),
+    Rule("Cognitive Load", WARNING, "High visual noise detected. Many colors and borders increase cognitive load.",
+         lambda v: v["color_tokens"] > 15 and v["border_tokens"] > 10),
+    Rule("Cognitive Load", ISSUE, "Form inputs without labels. Use <label> for accessibility and clarity.",
+         lambda v: v["form"] and not v["labels"]),
+
+    # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
+    Rule("Persuasion", WARNING, "Radio buttons without default selection. Pre-select recommended option.",
+         lambda v: v["form"] and v["radio"] and not v["defaults"]),
+    Rule("Persuasion", WARNING, "Prices without anchoring. Show original price to frame discount value.",
+         lambda v: v["price"] and not v["price_anchor"]),
+    Rule("Persuasion", WARNING, "Social proof without specific numbers. Use 'Join 10,000+' format.",
+         lambda v: v["social"] and not v["numbers"]),
+    Rule("Persuasion", WARNING, "Long form without progress indicator. Add progress bar or 'Step X of Y'.",
+         lambda v: v["form"] and v["complex_elements"] > 5 and not v["progress"]),
+
+    # --- 2. TYPOGRAPHY SYSTEM ---
+    Rule("Typography", ISSUE, "{item} font families detected. Limit to 2-3 for cohesion.",
+         each=lambda v: [len(v["font_families"])] if len(v["font_families"]) > 3 else []),
+    Rule("Typography", WARNING, "No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].",
+         lambda v: v["long_text"] and not v["measure"]),
+    Rule("Typography", WARNING, "Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3",
+         lambda v: v["text_elements"] and not v["leading"]),
+    Rule("Typography", WARNING, "Heading has line-height {item} (>1.3). Headings should be tighter (1.1-1.3).",
+         each=lambda v: [lh for lh in v["line_heights"] if float(lh) > 1.5] if v["heading_text"] else []),
+    Rule("Typography", WARNING, "Uppercase text without tracking. ALL CAPS needs +5-10% spacing.",
+         lambda v: v["uppercase"] and not v["tracking"]),
+    Rule("Typography", WARNING, "Large display text without tracking-tight. Big text needs -1% to -4% spacing.",
+         lambda v: v["display_text"] and not v["tracking_tight"]),
+    Rule("Typography", WARNING, "Adjacent font weights ({item[0]}/{item[1]}). Skip at least 2 levels for contrast.",
+         each=lambda v: [(a, b) for a, b in zip(v["weight_values"], v["weight_values"][1:]) if abs(a - b) == 100]),
+    Rule("Typography", WARNING, "{item} font weights. Limit to 3-4 per page.",
+         each=lambda v: [len(set(v["weight_values"]))] if len(set(v["weight_values"])) > 4 else []),
+    Rule("Typography", WARNING, "Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)",
+         lambda v: v["font_sizes"] and not v["fluid_type"]),
+    Rule("Typography", WARNING, "Skipped heading level (h{item[0]} -> h{item[1]}). Maintain sequential hierarchy.",
+         each=lambda v: [(int(a[1]), int(b[1])) for a, b in zip(v["headings"], v["headings"][1:]) if int(b[1]) > int(a[1]) + 1]),
+    Rule("Typography", WARNING, "No h1 found. Each page should have one primary heading.",
+         lambda v: v["headings"] and 'h1' not in [h.lower() for h in v["headings"]] and v["long_text"]),
+    Rule("Typography", WARNING, "Font sizes may not follow modular scale (ratio: {item:.2f}). Consider consistent ratio like 1.25 (Major Third).",
+         each=lambda v: [v["off_scale_ratio"]] if v["off_scale_ratio"] is not None else []),
+    Rule("Typography", WARNING, "Long paragraph detected ({item} words). Break into 3-4 line chunks for readability.",
+         each=lambda v: [n for n in (len(p.split()) for p in v["paragraphs"]) if n > 100]),
+    Rule("Typography", WARNING, "Long content without subheadings. Add h2/h3 to break up text.",
+         lambda v: len(v["paragraphs"]) > 5 and not v["subheadings"]),
+
+    # --- 3. VISUAL EFFECTS ---
+    Rule("Visual", WARNING, "Blur used without semi-transparent background (Glassmorphism fail)",
+         lambda v: v["blur_effects"] and not v["translucent"]),
+    Rule("Performance", WARNING, "Animating expensive properties ({item}). Use transform/opacity where possible.",
+         each=lambda v: [', '.join(dict.fromkeys(v["expensive_props"]))] if v["keyframes_or_transition"] and v["expensive_props"] else []),
+    Rule("Accessibility", WARNING, "Animations found without prefers-reduced-motion check",
+         lambda v: v["keyframes_or_transition"] and not v["reduced_motion"]),
+    Rule("Visual", WARNING, "Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.",
+         each=lambda v: [s for s in v["box_shadows"] if ',' not in s and not SHADOW_Y_OFFSET.search(s)]),
+    Rule("Visual", WARNING, "Neomorphism inset detected. Ensure adequate contrast for accessibility.",
+         each=lambda v: [s for s in v["box_shadows"] if ',' in s and '-' in s and 'inset' in s]),
+    Rule("Visual", WARNING, "All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.",
+         lambda v: len(v["box_shadows"]) >= 3 and v["shadow_opacities"] and len(set(v["shadow_opacities"])) < 2),
+    Rule("Visual", WARNING, "Many gradients detected ({v[gradient_count]}). Ensure this serves purpose, not decoration.",
+         lambda v: v["gradient"] and v["gradient_count"] > 5),
+    Rule("Visual", WARNING, "Hero section without visual interest. Consider gradient for depth.",
+         lambda v: not v["gradient"] and v["hero"] and not v["background"]),
+    Rule("Visual", WARNING, "Many border declarations ({v[border_declarations]}). Simplify for cleaner look.",
+         lambda v: v["border_declarations"] > 8),
+    Rule("Visual", WARNING, "Multiple glow effects detected. Use sparingly for emphasis only.",
+         lambda v: v["glow_shadows"] > 2),
+    Rule("Visual", WARNING, "Text over image without overlay. Add gradient overlay for readability.",
+         lambda v: v["images"] and v["long_text"] and not v["overlay"]),
+    Rule("Performance", ISSUE, "will-change on '{item}' (layout property). Use only for transform/opacity.",
+         each=lambda v: [p for p in (p.strip().lower() for p in v["will_change"]) if p in LAYOUT_PROPS]),
+    Rule("Performance", WARNING, "Many will-change declarations ({v[will_change_count]}). Use sparingly, only for heavy animations.",
+         lambda v: v["will_change_count"] > 3),
+    Rule("Visual", WARNING, "Many visual effects ({v[effect_count]}). Ensure effects serve purpose, not decoration.",
+         lambda v: v["effect_count"] > 10),
+    Rule("Visual", WARNING, "Flat design with no depth. Consider shadows or subtle gradients for hierarchy.",
+         lambda v: v["long_text"] and v["effect_count"] == 0),
+
+    # --- 4. COLOR SYSTEM ---
+    Rule("Color", ISSUE, "PURPLE DETECTED ('{v[purple]}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.",
+         lambda v: v["purple"]),
+    Rule("Color", WARNING, "{v[unique_hexes]} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).",
+         lambda v: v["hex_colors"] + v["hsl"] > 3 and v["bg_declarations"] and v["text_declarations"] and v["unique_hexes"] > 5),
+    Rule("Color", WARNING, "Monochromatic palette detected (hue variance: {v[hue_range]}deg). Ensure adequate contrast.",
+         lambda v: v["hue_range"] is not None and v["hue_range"] < 10),
+    Rule("Color", WARNING, "Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.",
+         lambda v: v["pure_black"]),
+    Rule("Color", WARNING, "Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.",
+         lambda v: v["pure_white"] and v["dark_mode"]),
+    Rule("Color", WARNING, "Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).",
+         lambda v: v["light_on_light"] or v["dark_on_dark"]),
+    Rule("Color", WARNING, "Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).",
+         lambda v: v["blue"] and v["food"]),
+    Rule("Color", WARNING, "Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).",
+         lambda v: v["color_vars"] and not v["hsl"]),
+
+    # --- 5. ANIMATION GUIDE ---
+    Rule("Animation", WARNING, "{item}",
+         each=lambda v: [message for message in (_duration_finding(v, d, unit) for d, unit in v["durations"]) if message]),
+    Rule("Animation", WARNING, "Entry animation with ease-in. Entry should use ease-out for snappy feel.",
+         lambda v: v["ease_in_entry"]),
+    Rule("Animation", WARNING, "Exit animation with ease-out. Exit should use ease-in for natural feel.",
+         lambda v: v["ease_out_exit"]),
+    Rule("Animation", WARNING, "Interactive elements without hover/focus states. Add micro-interactions for feedback.",
+         lambda v: v["interactive"] > 2 and not v["hover_focus"]),
+    Rule("Animation", WARNING, "Async operations without loading indicator. Add skeleton or spinner for perceived performance.",
+         lambda v: v["async"] and not v["loading_indicator"]),
+    Rule("Animation", WARNING, "Routing detected without page transitions. Consider fade/slide for context continuity.",
+         lambda v: v["routing"] and not v["page_transition"]),
+    Rule("Animation", ISSUE, "Scroll handler animating layout properties. Use transform/opacity for 60fps.",
+         lambda v: v["scroll_animation"] and v["scroll_layout"]),
+
+    # --- 6. MOTION GRAPHICS ---
+    Rule("Motion", WARNING, "Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.",
+         lambda v: v["lottie"] and not v["lottie_fallback"]),
+    Rule("Motion", ISSUE, "GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.",
+         lambda v: v["gsap"] and not v["gsap_cleanup"]),
+    Rule("Motion", WARNING, "Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.",
+         lambda v: v["svg_animations"] > 3),
+    Rule("Motion", WARNING, "3D transform without perspective parent. Add perspective: 1000px for realistic depth.",
+         lambda v: v["transform_3d"] and not v["perspective"]),
+    Rule("Motion", WARNING, "3D transforms detected. Test on mobile; can impact performance on low-end devices.",
+         lambda v: v["transform_3d"]),
+    Rule("Motion", WARNING, "Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.",
+         lambda v: v["particles"]),
+    Rule("Motion", ISSUE, "Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.",
+         lambda v: v["scroll_driven"] and not v["throttle"]),
+    Rule("Motion", WARNING, "Many animations ({v[total_animations]}). Ensure majority serve functional purpose (feedback, guidance), not decoration.",
+         lambda v: v["total_animations"] > 5 and v["functional_animations"] < v["total_animations"] / 2),
+
+    # --- 7. ACCESSIBILITY ---
+    Rule("Accessibility", ISSUE, "Missing img alt text",
+         lambda v: v["img_without_alt"]),
+]
+
 class UXAuditor:
     def __init__(self):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        self.cache = None
     
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = read_text(filepath, errors='replace')
         except: return
         
         self.files_checked += 1
         filename = os.path.basename(filepath)
 
-        # Pre-calculate common flags
-        has_long_text = bool(re.search(r'<p|<div.*class=.*text|article|<span.*text', content, re.IGNORECASE))
-        has_form = bool(re.search(r'<form|<input|password|credit|card|payment', content, re.IGNORECASE))
-        complex_elements = len(re.findall(r'<input|<select|<textarea|<option', content, re.IGNORECASE))
-
-        # --- 1. PSYCHOLOGY LAWS ---
-        # Hick's Law
-        nav_items = len(re.findall(r'<NavLink|<Link|<a\s+href|nav-item', content, re.IGNORECASE))
-        if nav_items > 7:
-            self.issues.append(f"[Hick's Law] {filename}: {nav_items} nav items (Max 7)")
-        
-        # Fitts' Law
-        if re.search(r'height:\s*([0-3]\d)px', content) or re.search(r'h-[1-9]\b|h-10\b', content):
-            self.warnings.append(f"[Fitts' Law] {filename}: Small targets (< 44px)")
-        
-        # Miller's Law
-        form_fields = len(re.findall(r'<input|<select|<textarea', content, re.IGNORECASE))
-        if form_fields > 7 and not re.search(r'step|wizard|stage', content, re.IGNORECASE):
-            self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
-            
-        # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
-            self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
-
-        # Serial Position Effect - Important items at beginning/end
-        if nav_items > 3:
-            # Check if last nav item is important (contact, login, etc.)
-            nav_content = re.findall(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', content, re.IGNORECASE)
-            if nav_content and len(nav_content) > 2:
-                last_item = nav_content[-1].lower() if nav_content else ''
-                if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
-                    self.warnings.append(f"[Serial Position] {filename}: Last nav item may not be important. Place key actions at start/end.")
-
-        # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
-
-        # Visceral: First impressions (aesthetics, gradients, animations)
-        has_hero = bool(re.search(r'hero|<h1|banner', content, re.IGNORECASE))
-        if has_hero:
-            # Check for visual appeal elements
-            has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient', content))
-            has_animation = bool(re.search(r'@keyframes|transition:|animate-', content))
-            has_visual_interest = has_gradient or has_animation
-
-            if not has_visual_interest and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visceral] {filename}: Hero section lacks visual appeal. Consider gradients or subtle animations.")
-
-        # Behavioral: Instant feedback and usability
-        if 'onClick' in content or '@click' in content or 'onclick' in content:
-            has_feedback = re.search(r'transition|animate|hover:|focus:|disabled|loading|spinner', content, re.IGNORECASE)
-            has_state_change = re.search(r'setState|useState|disabled|loading', content)
-
-            if not has_feedback and not has_state_change:
-                self.warnings.append(f"[Behavioral] {filename}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
-
-        # Reflective: Brand story, values, identity
-        has_reflective = bool(re.search(r'about|story|mission|values|why we|our journey|testimonials', content, re.IGNORECASE))
-        if has_long_text and not has_reflective:
-            self.warnings.append(f"[Reflective] {filename}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
-
-        # --- 1.6 TRUST BUILDING (Enhanced) ---
-
-        # Security signals
-        if has_form:
-            security_signals = re.findall(r'ssl|secure|encrypt|lock|padlock|https', content, re.IGNORECASE)
-            if len(security_signals) == 0 and not re.search(r'checkout|payment', content, re.IGNORECASE):
-                self.warnings.append(f"[Trust] {filename}: Form without security indicators. Add 'SSL Secure' or lock icon.")
-
-        # Social proof elements
-        social_proof = re.findall(r'review|testimonial|rating|star|trust|trusted by|customer|logo', content, re.IGNORECASE)
-        if len(social_proof) > 0:
-            self.passed_count += 1
-        else:
-            if has_long_text:
-                self.warnings.append(f"[Trust] {filename}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
-
-        # Authority indicators
-        has_footer = bool(re.search(r'footer|<footer', content, re.IGNORECASE))
-        if has_footer:
-            authority = re.findall(r'certif|award|media|press|featured|as seen in', content, re.IGNORECASE)
-            if len(authority) == 0:
-                self.warnings.append(f"[Trust] {filename}: Footer lacks authority signals. Add certifications, awards, or media mentions.")
-
-        # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
-
-        # Progressive disclosure
-        if complex_elements > 5:
-            has_progressive = re.search(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', content, re.IGNORECASE)
-            if not has_progressive:
-                self.warnings.append(f"[Cognitive Load] {filename}: Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
-
-        # Visual noise check
-        has_many_colors = len(re.findall(r'#[0-9a-fA-F]{3,6}|rgb|hsl', content)) > 15
-        has_many_borders = len(re.findall(r'border:|border-', content)) > 10
-        if has_many_colors and has_many_borders:
-            self.warnings.append(f"[Cognitive Load] {filename}: High visual noise detected. Many colors and borders increase cognitive load.")
-
-        # Familiar patterns
-        if has_form:
-            has_standard_labels = bool(re.search(r'<label|placeholder|aria-label', content, re.IGNORECASE))
-            if not has_standard_labels:
-                self.issues.append(f"[Cognitive Load] {filename}: Form inputs without labels. Use <label> for accessibility and clarity.")
-
-        # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
-
-        # Smart defaults
-        if has_form:
-            has_defaults = bool(re.search(r'checked|selected|default|value=["\'].*["\']', content))
-            radio_inputs = len(re.findall(r'type=["\']radio', content, re.IGNORECASE))
-            if radio_inputs > 0 and not has_defaults:
-                self.warnings.append(f"[Persuasion] {filename}: Radio buttons without default selection. Pre-select recommended option.")
-
-        # Anchoring (showing original price)
-        if re.search(r'price|pricing|cost|\$\d+', content, re.IGNORECASE):
-            has_anchor = bool(re.search(r'original|was|strike|del|save \d+%', content, re.IGNORECASE))
-            if not has_anchor:
-                self.warnings.append(f"[Persuasion] {filename}: Prices without anchoring. Show original price to frame discount value.")
-
-        # Social proof live indicators
-        has_social = bool(re.search(r'join|subscriber|member|user', content, re.IGNORECASE))
-        if has_social:
-            has_count = bool(re.findall(r'\d+[+kmb]|\d+,\d+', content))
-            if not has_count:
-                self.warnings.append(f"[Persuasion] {filename}: Social proof without specific numbers. Use 'Join 10,000+' format.")
-
-        # Progress indicators
-        if has_form:
-            has_progress = bool(re.search(r'progress|step \d+|complete|%|bar', content, re.IGNORECASE))
-            if complex_elements > 5 and not has_progress:
-                self.warnings.append(f"[Persuasion] {filename}: Long form without progress indicator. Add progress bar or 'Step X of Y'.")
-
-        # --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
-
-        # 2.1 Font Pairing - Too many font families
-        font_families = set()
-        # Check for @font-face, Google Fonts, font-family declarations
-        font_faces = re.findall(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', content, re.IGNORECASE)
-        google_fonts = re.findall(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', content, re.IGNORECASE)
-        font_family_css = re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)
-
-        for font in font_faces: font_families.add(font.strip().lower())
-        for font in google_fonts:
-            for f in font.replace('+', ' ').split('|'):
-                font_families.add(f.split(':')[0].strip().lower())
-        for family in font_family_css:
-            # Extract first font from stack
-            first_font = family.split(',')[0].strip().strip('"\'')
-
-            if first_font.lower() not in {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}:
-                font_families.add(first_font.lower())
-
-        if len(font_families) > 3:
-            self.issues.append(f"[Typography] {filename}: {len(font_families)} font families detected. Limit to 2-3 for cohesion.")
-
-        # 2.2 Line Length - Character-based width
-        if has_long_text and not re.search(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', content):
-            self.warnings.append(f"[Typography] {filename}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
-
-        # 2.3 Line Height - Proper leading ratios
-        # Check for text without proper line-height
-        text_elements = len(re.findall(r'<p|<span|<div.*text|<h[1-6]', content, re.IGNORECASE))
-        if text_elements > 0 and not re.search(r'leading-|line-height:', content):
-            self.warnings.append(f"[Typography] {filename}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
-
-        # Check for heading-specific line height issues
-        if re.search(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', content, re.IGNORECASE):
-            # Extract line-height values
-            line_heights = re.findall(r'(?:leading-|line-height:\s*)([\d.]+)', content)
-            for lh in line_heights:
-                if float(lh) > 1.5:
-                    self.warnings.append(f"[Typography] {filename}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
-
-        # 2.4 Letter Spacing (Tracking)
-        # Uppercase without tracking
-        if re.search(r'uppercase|text-transform:\s*uppercase', content, re.IGNORECASE):
-            if not re.search(r'tracking-|letter-spacing:', content):
-                self.warnings.append(f"[Typography] {filename}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
-
-        # Large text (display/hero) should have negative tracking
-        if re.search(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', content):
-            if not re.search(r'tracking-tight|letter-spacing:\s*-[0-9]', content):
-                self.warnings.append(f"[Typography] {filename}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
-
-        # 2.5 Weight and Emphasis - Contrast levels
-        # Check for adjacent weight levels (poor contrast)
-        weights = re.findall(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', content, re.IGNORECASE)
-        weight_values = []
-        for w in weights:
-            val = w[0] or w[1]
-            if val:
-                # Map named weights to numbers
-                weight_map = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
-                val = weight_map.get(val.lower(), val)
-                try:
-                    weight_values.append(int(val))
-                except: pass
-
-        # Check for adjacent weights (400/500, 500/600, etc.)
-        for i in range(len(weight_values) - 1):
-            diff = abs(weight_values[i] - weight_values[i+1])
-            if diff == 100:
-                self.warnings.append(f"[Typography] {filename}: Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
-
-        # Too many weight levels
-        unique_weights = set(weight_values)
-        if len(unique_weights) > 4:
-            self.warnings.append(f"[Typography] {filename}: {len(unique_weights)} font weights. Limit to 3-4 per page.")
-
-        # 2.6 Responsive Typography - Fluid sizing with clamp()
-        has_font_sizes = bool(re.search(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', content))
-        if has_font_sizes and not re.search(r'clamp\(|responsive:', content):
-            self.warnings.append(f"[Typography] {filename}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
-
-        # 2.7 Hierarchy - Heading structure
-        headings = re.findall(r'<(h[1-6])', content, re.IGNORECASE)
-        if headings:
-            # Check for skipped levels (h1 -> h3)
-            for i in range(len(headings) - 1):
-                curr = int(headings[i][1])
-                next_h = int(headings[i+1][1])
-                if next_h > curr + 1:
-                    self.warnings.append(f"[Typography] {filename}: Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
-
-            # Check if h1 exists for main content
-            if 'h1' not in [h.lower() for h in headings] and has_long_text:
-                self.warnings.append(f"[Typography] {filename}: No h1 found. Each page should have one primary heading.")
-
-        # 2.8 Modular Scale - Consistent sizing
-        # Extract font-size values
-        font_sizes = re.findall(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', content)
-        size_values = []
-        for size, unit in font_sizes:
-            if unit == 'rem' or unit == 'em':
-                size_values.append(float(size))
-            elif unit == 'px':
-                size_values.append(float(size) / 16)  # Normalize to rem
-
-        if len(size_values) > 2:
-            # Check if sizes follow a modular scale roughly
-            sorted_sizes = sorted(set(size_values))
-            ratios = []
-            for i in range(1, len(sorted_sizes)):
-                if sorted_sizes[i-1] > 0:
-                    ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
-
-            # Common scale ratios: 1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618
-            common_ratios = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
-            for ratio in ratios[:3]:  # Check first 3 ratios
-                if not any(abs(ratio - cr) < 0.05 for cr in common_ratios):
-                    self.warnings.append(f"[Typography] {filename}: Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
-                    break
-
-        # 2.9 Readability - Content chunking
-        # Check for very long paragraphs (>5 lines estimated)
-        paragraphs = re.findall(r'<p[^>]*>([^<]+)</p>', content, re.IGNORECASE)
-        for p in paragraphs:
-            word_count = len(p.split())
-            if word_count > 100:  # ~5-6 lines
-                self.warnings.append(f"[Typography] {filename}: Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
-
-        # Check for missing subheadings in long content
-        if len(paragraphs) > 5:
-            subheadings = len(re.findall(r'<h[2-6]', content, re.IGNORECASE))
-            if subheadings == 0:
-                self.warnings.append(f"[Typography] {filename}: Long content without subheadings. Add h2/h3 to break up text.")
-
-        # --- 3. VISUAL EFFECTS (visual-effects.md) ---
-        
-        # Glassmorphism Check
-        if 'backdrop-filter' in content or 'blur(' in content:
-            if not re.search(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', content):
-                self.warnings.append(f"[Visual] {filename}: Blur used without semi-transparent background (Glassmorphism fail)")
-        
-        # GPU Acceleration / Performance
-        if re.search(r'@keyframes|transition:', content):
-            expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
-            if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
-            
-            # Reduced Motion
-            if not re.search(r'prefers-reduced-motion', content):
-                self.warnings.append(f"[Accessibility] {filename}: Animations found without prefers-reduced-motion check")
-
-        # Natural Shadows
-        shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in shadows:
-            # Check if natural (Y > X) or multiple layers
-            if ',' not in shadow and not re.search(r'\d+px\s+[1-9]\d*px', shadow): # Simple heuristic for Y-offset
-                 self.warnings.append(f"[Visual] {filename}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
-
-        # --- 3.1 NEOMORPHISM CHECK ---
-        # Check for neomorphism patterns (dual shadows with opposite directions)
-        neo_shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in neo_shadows:
-            # Neomorphism has two shadows: positive offset + negative offset
-            if ',' in shadow and '-' in shadow:
-                # Check for inset pattern (pressed state)
-                if 'inset' in shadow:
-                    self.warnings.append(f"[Visual] {filename}: Neomorphism inset detected. Ensure adequate contrast for accessibility.")
-
-        # --- 3.2 SHADOW HIERARCHY ---
-        # Count shadow levels to check for elevation consistency
-        shadow_count = len(shadows)
-        if shadow_count > 0:
-            # Check for shadow opacity levels (should indicate hierarchy)
-            opacities = re.findall(r'rgba?\([^)]+,\s*([\d.]+)\)', content)
-            shadow_opacities = [float(o) for o in opacities if float(o) < 0.5]
-            if shadow_count >= 3 and len(shadow_opacities) > 0:
-                # Check if there's variety in shadow opacities for different elevations
-                unique_opacities = len(set(shadow_opacities))
-                if unique_opacities < 2:
-                    self.warnings.append(f"[Visual] {filename}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
-
-        # --- 3.3 GRADIENT CHECKS ---
-        # Check for gradient usage
-        has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient|conic-gradient', content))
-        if has_gradient:
-            # Warn about mesh/aurora gradients (can be overused)
-            gradient_count = len(re.findall(r'gradient', content, re.IGNORECASE))
-            if gradient_count > 5:
-                self.warnings.append(f"[Visual] {filename}: Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
-        else:
-            # Check if hero section exists without gradient
-            if has_hero and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visual] {filename}: Hero section without visual interest. Consider gradient for depth.")
-
-        # --- 3.4 BORDER EFFECTS ---
-        # Check for gradient borders or animated borders
-        has_border = bool(re.search(r'border:|border-', content))
-        if has_border:
-            # Check for overly complex borders
-            border_count = len(re.findall(r'border:', content))
-            if border_count > 8:
-                self.warnings.append(f"[Visual] {filename}: Many border declarations ({border_count}). Simplify for cleaner look.")
-
-        # --- 3.5 GLOW EFFECTS ---
-        # Check for text-shadow or multiple box-shadow layers (glow effects)
-        text_shadows = re.findall(r'text-shadow:', content)
-        for ts in text_shadows:
-            # Multiple text-shadow layers indicate glow
-            if ',' in ts:
-                self.warnings.append(f"[Visual] {filename}: Text glow effect detected. Ensure readability is maintained.")
-
-        # Check for box-shadow glow (multiple layers with 0 offset)
-        glow_shadows = re.findall(r'box-shadow:\s*[^;]*0\s+0\s+', content)
-        if len(glow_shadows) > 2:
-            self.warnings.append(f"[Visual] {filename}: Multiple glow effects detected. Use sparingly for emphasis only.")
-
-        # --- 3.6 OVERLAY TECHNIQUES ---
-        # Check for image overlays (for readability)
-        has_images = bool(re.search(r'<img|background-image:|bg-\[url', content))
-        if has_images and has_long_text:
-            has_overlay = bool(re.search(r'overlay|rgba\(0|gradient.*transparent|::after|::before', content))
-            if not has_overlay:
-                self.warnings.append(f"[Visual] {filename}: Text over image without overlay. Add gradient overlay for readability.")
-
-        # --- 3.7 PERFORMANCE: will-change ---
-        # Check for will-change usage
-        if re.search(r'will-change:', content):
-            will_change_props = re.findall(r'will-change:\s*([^;]+)', content)
-            for prop in will_change_props:
-                prop = prop.strip().lower()
-                if prop in ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']:
-                    self.issues.append(f"[Performance] {filename}: will-change on '{prop}' (layout property). Use only for transform/opacity.")
-
-        # Check for excessive will-change usage
-        will_change_count = len(re.findall(r'will-change:', content))
-        if will_change_count > 3:
-            self.warnings.append(f"[Performance] {filename}: Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
-
-        # --- 3.8 EFFECT SELECTION ---
-        # Check for effect overuse (too many visual effects)
-        effect_count = (
-            (1 if has_gradient else 0) +
-            shadow_count +
-            len(re.findall(r'backdrop-filter|blur\(', content)) +
-            len(re.findall(r'text-shadow:', content))
-        )
-        if effect_count > 10:
-            self.warnings.append(f"[Visual] {filename}: Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
-
-        # Check for static/flat design (no depth)
-        if has_long_text and effect_count == 0:
-            self.warnings.append(f"[Visual] {filename}: Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
-
-        # --- 4. COLOR SYSTEM (color-system.md) ---
-
-        # 4.1 PURPLE BAN - Critical check from color-system.md
-        purple_hexes = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
-                        '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
-                        '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
-                        'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
-        for purple in purple_hexes:
-            if purple.lower() in content.lower():
-                self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
-                break
-
-        # 4.2 60-30-10 Rule check
-        # Count color usage to estimate ratio
-        color_hex_count = len(re.findall(r'#[0-9a-fA-F]{3,6}', content))
-        hsl_count = len(re.findall(r'hsl\(', content))
-        total_colors = color_hex_count + hsl_count
-        if total_colors > 3:
-            # Check for dominant colors (should be ~60%)
-            bg_declarations = re.findall(r'(?:background|bg-|bg\[)([^;}\s]+)', content)
-            text_declarations = re.findall(r'(?:color|text-)([^;}\s]+)', content)
-            if len(bg_declarations) > 0 and len(text_declarations) > 0:
-                # Just warn if too many distinct colors
-                unique_hexes = set(re.findall(r'#[0-9a-fA-F]{6}', content))
-                if len(unique_hexes) > 5:
-                    self.warnings.append(f"[Color] {filename}: {len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
-
-        # 4.3 Color Scheme Pattern Detection
-        # Detect monochromatic (same hue, different lightness)
-        hsl_matches = re.findall(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', content)
-        if len(hsl_matches) >= 3:
-            hues = [int(h) for h in hsl_matches]
-            hue_range = max(hues) - min(hues)
-            if hue_range < 10:
-                self.warnings.append(f"[Color] {filename}: Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
-
-        # 4.4 Dark Mode Compliance
-        # Check for pure black (#000000) or pure white (#FFFFFF) text (forbidden)
-        if re.search(r'color:\s*#000000|#000\b', content):
-            self.warnings.append(f"[Color] {filename}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
-        if re.search(r'background:\s*#ffffff|#fff\b', content) and re.search(r'dark:\s*|dark:', content):
-            self.warnings.append(f"[Color] {filename}: Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
-
-        # 4.5 WCAG Contrast Pattern Check
-        # Look for potential low-contrast combinations
-        light_bg_light_text = bool(re.search(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', content))
-        dark_bg_dark_text = bool(re.search(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', content))
-        if light_bg_light_text or dark_bg_dark_text:
-            self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
-
-        # 4.6 Color Psychology Context Check
-        # Warn if blue used for food/restaurant context
-        has_blue = bool(re.search(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', content))
-        has_food_context = bool(re.search(r'restaurant|food|cooking|recipe|menu|dish|meal', content, re.IGNORECASE))
-        if has_blue and has_food_context:
-            self.warnings.append(f"[Color] {filename}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
-
-        # 4.7 HSL-Based Palette Detection
-        # Check if using HSL for palette (recommended in color-system.md)
-        has_color_vars = bool(re.search(r'--color-|color-|primary-|secondary-', content))
-        if has_color_vars and not re.search(r'hsl\(', content):
-            self.warnings.append(f"[Color] {filename}: Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
-
-        # --- 5. ANIMATION GUIDE (animation-guide.md) ---
-
-        # 5.1 Duration Appropriateness
-        # Check for excessively long or short animations
-        durations = re.findall(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', content)
-        for duration, unit in durations:
-            duration_ms = float(duration) * (1000 if unit == 's' else 1)
-            if duration_ms < 50:
-                self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
-                self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
-
-        # 5.2 Easing Function Correctness
-        # Check for incorrect easing patterns
-        if re.search(r'ease-in\s+.*entry|fade-in.*ease-in', content):
-            self.warnings.append(f"[Animation] {filename}: Entry animation with ease-in. Entry should use ease-out for snappy feel.")
-        if re.search(r'ease-out\s+.*exit|fade-out.*ease-out', content):
-            self.warnings.append(f"[Animation] {filename}: Exit animation with ease-out. Exit should use ease-in for natural feel.")
-
-        # 5.3 Micro-interaction Feedback Patterns
-        # Check for interactive elements without hover/focus states
-        interactive_elements = len(re.findall(r'<button|<a\s+href|onClick|@click', content))
-        has_hover_focus = bool(re.search(r'hover:|focus:|:hover|:focus', content))
-        if interactive_elements > 2 and not has_hover_focus:
-            self.warnings.append(f"[Animation] {filename}: Interactive elements without hover/focus states. Add micro-interactions for feedback.")
-
-        # 5.4 Loading State Indicators
-        # Check for loading patterns
-        has_async = bool(re.search(r'async|await|fetch|axios|loading|isLoading', content))
-        has_loading_indicator = bool(re.search(r'skeleton|spinner|progress|loading|<circle.*animate', content))
-        if has_async and not has_loading_indicator:
-            self.warnings.append(f"[Animation] {filename}: Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
-
-        # 5.5 Page Transition Patterns
-        # Check for page/view transitions
-        has_routing = bool(re.search(r'router|navigate|Link.*to|useHistory', content))
-        has_page_transition = bool(re.search(r'AnimatePresence|motion\.|transition.*page|fade.*route', content))
-        if has_routing and not has_page_transition:
-            self.warnings.append(f"[Animation] {filename}: Routing detected without page transitions. Consider fade/slide for context continuity.")
-
-        # 5.6 Scroll Animation Performance
-        # Check for scroll-driven animations
-        has_scroll_anim = bool(re.search(r'onScroll|scroll.*trigger|IntersectionObserver', content))
-        if has_scroll_anim:
-            # Check if using expensive properties in scroll handlers
-            if re.search(r'onScroll.*[^\w](width|height|top|left)', content):
-                self.issues.append(f"[Animation] {filename}: Scroll handler animating layout properties. Use transform/opacity for 60fps.")
-
-        # --- 6. MOTION GRAPHICS (motion-graphics.md) ---
-
-        # 6.1 Lottie Animation Checks
-        has_lottie = bool(re.search(r'lottie|Lottie|@lottie-react', content))
-        if has_lottie:
-            # Check for reduced motion fallback
-            has_lottie_fallback = bool(re.search(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', content))
-            if not has_lottie_fallback:
-                self.warnings.append(f"[Motion] {filename}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
-
-        # 6.2 GSAP Memory Leak Risks
-        has_gsap = bool(re.search(r'gsap|ScrollTrigger|from\(.*gsap', content))
-        if has_gsap:
-            # Check for cleanup patterns
-            has_gsap_cleanup = bool(re.search(r'kill\(|revert\(|useEffect.*return.*gsap', content))
-            if not has_gsap_cleanup:
-                self.issues.append(f"[Motion] {filename}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
-
-        # 6.3 SVG Animation Performance
-        svg_animations = re.findall(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', content)
-        if len(svg_animations) > 3:
-            self.warnings.append(f"[Motion] {filename}: Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
-
-        # 6.4 3D Transform Performance
-        has_3d_transform = bool(re.search(r'transform3d|perspective\(|rotate3d|translate3d', content))
-        if has_3d_transform:
-            # Check for perspective on parent
-            has_perspective_parent = bool(re.search(r'perspective:\s*\d+px|perspective\s*\(', content))
-            if not has_perspective_parent:
-                self.warnings.append(f"[Motion] {filename}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
-
-            # Warn about mobile performance
-            self.warnings.append(f"[Motion] {filename}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.")
-
-        # 6.5 Particle Effect Warnings
-        # Check for canvas/WebGL particle systems
-        has_particles = bool(re.search(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', content))
-        if has_particles:
-            self.warnings.append(f"[Motion] {filename}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
-
-        # 6.6 Scroll-Driven Animation Performance
-        has_scroll_driven = bool(re.search(r'IntersectionObserver.*animate|scroll.*progress|view-timeline', content))
-        if has_scroll_driven:
-            # Check for throttling/debouncing
-            has_throttle = bool(re.search(r'throttle|debounce|requestAnimationFrame', content))
-            if not has_throttle:
-                self.issues.append(f"[Motion] {filename}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
-
-        # 6.7 Motion Decision Tree - Context Check
-        # Check if animation serves purpose (not just decoration)
-        total_animations = (
-            len(re.findall(r'@keyframes|transition:|animate-', content)) +
-            (1 if has_lottie else 0) +
-            (1 if has_gsap else 0)
-        )
-        if total_animations > 5:
-            # Check if animations are functional
-            functional_animations = len(re.findall(r'hover:|focus:|disabled|loading|error|success', content))
-            if functional_animations < total_animations / 2:
-                self.warnings.append(f"[Motion] {filename}: Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
-
-        # --- 7. ACCESSIBILITY ---
-        if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
-            self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
-
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        # One casefolded copy of the content; each feature is scanned for at most once
+        features = FeatureVector(content)
+        for rule in RULES:
+            for message in rule.evaluate(features, filename):
+                if rule.level == PASS:
+                    self.passed_count += 1
+                else:
+                    getattr(self, rule.level).append(message)
+
+    def audit_directory(self, directory: str, use_cache: bool = True) -> None:
+        if use_cache:
+            self.cache = open_cache("ux_audit", directory, __file__)
+        for filepath in walk_files(directory, AUDIT_EXTENSIONS, skip_dirs=SKIP_DIRS):
+            self._audit_cached(filepath)
+        if self.cache:
+            self.cache.save()
+
+    def _audit_cached(self, filepath: str) -> None:
+        """audit_file, replaying the recorded findings when the file is unchanged since the last run"""
+        if self.cache is None:
+            self.audit_file(filepath)
+            return
+        delta = self.cache.result(filepath, lambda: self._audit_file_delta(filepath))
+        self.issues.extend(delta["issues"])
+        self.warnings.extend(delta["warnings"])
+        self.passed_count += delta["passed"]
+        self.files_checked += delta["checked"]
+
+    def _audit_file_delta(self, filepath: str) -> dict:
+        """What audit_file adds to the report for one file, leaving the running totals alone"""
+        saved = (self.issues, self.warnings, self.passed_count, self.files_checked)
+        self.issues, self.warnings, self.passed_count, self.files_checked = [], [], 0, 0
+        try:
+            self.audit_file(filepath)
+            return {"issues": self.issues, "warnings": self.warnings,
+                    "passed": self.passed_count, "checked": self.files_checked}
+        finally:
+            self.issues, self.warnings, self.passed_count, self.files_checked = saved
 
     def get_report(self):
         return {
@@ -685,18 +620,52 @@ class UXAuditor:
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
-            "compliant": len(self.issues) == 0
+            "compliant": len(self.issues) == 0,
+            **({"cache": self.cache.stats()} if self.cache else {})
         }
 
-def main():
-    if len(sys.argv) < 2: sys.exit(1)
+def check_features(path: str) -> bool:
+    """
+    Audit every file under path with and without the anchor prefilter; any
+    difference means a feature's anchors miss some of its matches.
+    """
+    files = [path] if os.path.isfile(path) else list(walk_files(path, AUDIT_EXTENSIONS, skip_dirs=SKIP_DIRS))
+    mismatches = 0
+    timings = {True: 0.0, False: 0.0}
+    for filepath in files:
+        try:
+            content = read_text(filepath, errors='replace')
+        except Exception:
+            continue
+        values = {}
+        for prefilter in (True, False):
+            start = time.perf_counter()
+            features = FeatureVector(content, prefilter)
+            values[prefilter] = {name: features[name] for name in FEATURES}
+            timings[prefilter] += time.perf_counter() - start
+        for name in FEATURES:
+            if values[True][name] != values[False][name]:
+                mismatches += 1
+                print(f"[!!] {filepath}: feature '{name}' differs with its anchors {FEATURES[name].anchors}")
+
+    print(f"[CHECK] {len(files)} files, {len(FEATURES)} features, {len(RULES)} rules")
+    print(f"  every pattern run  {timings[False] * 1000:>9.1f} ms")
+    print(f"  anchor prefilter   {timings[True] * 1000:>9.1f} ms")
+    print(f"  features           {'[OK] identical' if not mismatches else f'[!!] {mismatches} MISMATCHES'}")
+    return mismatches == 0
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2: sys.exit(1)
     
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
+    path = argv[1]
+    is_json = "--json" in argv
+    if "--check" in argv:
+        sys.exit(0 if check_features(path) else 1)
     
     auditor = UXAuditor()
     if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
+    else: auditor.audit_directory(path, use_cache="--no-cache" not in argv)
     
     report = auditor.get_report()
     
@@ -713,10 +682,17 @@ def main():
             print(f"[*] WARNINGS ({len(report['warnings'])}):")
             for w in report['warnings'][:15]: print(f"  - {w}")
         print(f"[+] PASSED CHECKS: {report['passed_checks']}")
+        if 'cache' in report:
+            print(f"[+] CACHE: {report['cache']['hits']} unchanged / {report['cache']['misses']} re-audited ({report['cache']['hit_ratio']:.0%} hits)")
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
     sys.exit(0 if report['compliant'] else 1)
 
+def run(context):
+    """In-process entry point for checklist.py / verify_all.py"""
+    from check_runner import run_main
+    return run_main(main, [__file__, context.project_path])
+
 if __name__ == "__main__":
     main()
@@ -21,6 +21,10 @@ import re
 import json
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import walk_files, read_text
+from audit_cache import open_cache
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -80,26 +84,24 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    extensions = {'.html', '.htm', '.jsx', '.tsx'}
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:30]  # Limit to 30 pages
+    for f in walk_files(project_path, extensions, SKIP_DIRS):
+        # Check if it's likely a page (path relative to the project)
+        f = Path(f)
+        if is_page_file(f.relative_to(project_path)):
+            files.append(f)
+            if len(files) == 30:  # Limit to 30 pages
+                break
+    
+    return files
 
 
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
@@ -219,8 +221,9 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    target = argv[1] if len(argv) > 1 else "."
     target_path = Path(target).resolve()
     
     print("\n" + "=" * 60)
@@ -244,9 +247,12 @@ def main():
     
     # Check each page
     results = []
+    cache = open_cache("geo_checker", target_path, __file__) if "--no-cache" not in argv else None
     for page in pages:
-        result = check_page(page)
+        result = cache.result(page, lambda: check_page(page)) if cache else check_page(page)
         results.append(result)
+    if cache:
+        cache.save()
     
     # Print results
     for result in results:
@@ -278,12 +284,19 @@ def main():
         "project": str(target_path),
         "pages_checked": len(results),
         "average_score": round(avg_score),
-        "passed": avg_score >= 60
+        "passed": avg_score >= 60,
+        **({"cache": cache.stats()} if cache else {})
     }
     print("\n" + json.dumps(output, indent=2))
     
     sys.exit(0 if avg_score >= 60 else 1)
 
 
+def run(context):
+    """In-process entry point for checklist.py / verify_all.py"""
+    from check_runner import run_main
+    return run_main(main, [__file__, context.project_path])
+
+
 if __name__ == "__main__":
     main()
@@ -8,6 +8,9 @@ import re
 import json
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import walk_files, read_text
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -140,12 +143,9 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
-    
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    skip_dirs = {'node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', '.venv'}
+    code_files = [Path(f) for f in walk_files(project_path, extensions, skip_dirs)]
+    code_files = [f for f in code_files if not any(x in str(f.relative_to(project_path)) for x in ['test', 'spec'])]
     
     if not code_files:
         return {'passed': ["[!] No code files found"], 'issues': []}
@@ -156,7 +156,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     for file_path in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
             ext = file_path.suffix
             file_type = extensions.get(ext, 'jsx')
             
@@ -196,8 +196,9 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    target = argv[1] if len(argv) > 1 else "."
     project_path = Path(target)
     
     print("\n" + "=" * 60)
@@ -237,5 +238,10 @@ def main():
         print(f"[X] i18n CHECK: {critical_issues} issues found")
         sys.exit(1)
 
+def run(context):
+    """In-process entry point for checklist.py / verify_all.py"""
+    from check_runner import run_main
+    return run_main(main, [__file__, context.project_path])
+
 if __name__ == "__main__":
     main()
@@ -8,6 +8,9 @@ import re
 import subprocess
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import walk_files, read_text
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -21,15 +24,14 @@ def check_typescript_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
+    ts_files = [Path(f) for f in walk_files(project_path, {'.ts', '.tsx'}) if not f.endswith('.d.ts')]
     
     if not ts_files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
             
             # Count 'any' usage
             any_matches = re.findall(r':\s*any\b', content)
@@ -77,15 +79,14 @@ def check_python_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
+    py_files = [Path(f) for f in walk_files(project_path, {'.py'})]
     
     if not py_files:
         return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
     
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path, errors='ignore')
             
             # Count Any usage
             any_matches = re.findall(r':\s*Any\b', content)
@@ -125,8 +126,9 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    target = argv[1] if len(argv) > 1 else "."
     project_path = Path(target)
     
     print("\n" + "=" * 60)
@@ -169,5 +171,10 @@ def main():
         print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
         sys.exit(1)
 
+def run(context):
+    """In-process entry point for checklist.py / verify_all.py"""
+    from check_runner import run_main
+    return run_main(main, [__file__, context.project_path])
+
 if __name__ == "__main__":
     main()
@@ -63,13 +63,34 @@ Analyzes React Native / Flutter code for compliance with:
    - API Response Caching
 
 Total: 50+ mobile-specific checks
+
+Usage:
+    python mobile_audit.py <project>                  # whole tree
+    python mobile_audit.py <project> --jobs 0         # one worker process per CPU
+    python mobile_audit.py <project> --changed        # only files changed against HEAD
+    python mobile_audit.py <project> --changed main   # only files changed against main
 """
 
 import sys
 import os
 import re
 import json
+import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Optional
+
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import walk_files, read_text
+from audit_cache import open_cache
+
+AUDIT_EXTENSIONS = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', '.idea'}
+
+# Parallel mode: below this many files per worker a pool costs more than it saves
+MIN_FILES_PER_JOB = 50
+CHUNKS_PER_JOB = 8
 
 class MobileAuditor:
     def __init__(self):
@@ -77,11 +98,11 @@ class MobileAuditor:
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        self.cache = None
 
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = read_text(filepath, errors='replace')
         except:
             return
 
@@ -610,13 +631,56 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+    def audit_directory(self, directory: str, use_cache: bool = True, jobs: int = 1, changed: Optional[str] = None) -> None:
+        """
+        Audit the mobile source files under directory, or with `changed` (a git
+        ref) only those that differ from it. With jobs > 1 the files are audited
+        on a process pool; per-file findings are merged in file order, so the
+        report does not depend on the worker count.
+        """
+        if use_cache:
+            self.cache = open_cache("mobile_audit", directory, __file__)
+        files = changed_files(directory, changed) if changed else list(walk_files(directory, AUDIT_EXTENSIONS, SKIP_DIRS))
+
+        per_file = [self.cache.get(f) if self.cache else None for f in files]
+        todo = [f for f, found in zip(files, per_file) if found is None]
+
+        jobs = min(resolve_jobs(jobs), max(1, len(todo) // MIN_FILES_PER_JOB))
+        if jobs > 1:
+            # Small chunks form a work queue for uneven file sizes; map() keeps submission order
+            size = max(1, len(todo) // (jobs * CHUNKS_PER_JOB))
+            chunks = [todo[i:i + size] for i in range(0, len(todo), size)]
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                fresh = [delta for chunk in pool.map(_audit_chunk, chunks) for delta in chunk]
+        else:
+            fresh = [self._audit_file_delta(f) for f in todo]
+
+        fresh = iter(zip(todo, fresh))
+        for i, found in enumerate(per_file):
+            if found is None:
+                filepath, delta = next(fresh)
+                per_file[i] = self.cache.put(filepath, delta) if self.cache else delta
+            self._merge(per_file[i])
+        if self.cache:
+            # Files outside a changed-only run keep their cached findings
+            self.cache.save(prune=not changed)
+
+    def _merge(self, delta: dict) -> None:
+        self.issues.extend(delta["issues"])
+        self.warnings.extend(delta["warnings"])
+        self.passed_count += delta["passed"]
+        self.files_checked += delta["checked"]
+
+    def _audit_file_delta(self, filepath: str) -> dict:
+        """What audit_file adds to the report for one file, leaving the running totals alone"""
+        saved = (self.issues, self.warnings, self.passed_count, self.files_checked)
+        self.issues, self.warnings, self.passed_count, self.files_checked = [], [], 0, 0
+        try:
+            self.audit_file(filepath)
+            return {"issues": self.issues, "warnings": self.warnings,
+                    "passed": self.passed_count, "checked": self.files_checked}
+        finally:
+            self.issues, self.warnings, self.passed_count, self.files_checked = saved
 
     def get_report(self):
         return {
@@ -624,30 +688,78 @@ class MobileAuditor:
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
-            "compliant": len(self.issues) == 0
+            "compliant": len(self.issues) == 0,
+            **({"cache": self.cache.stats()} if self.cache else {})
         }
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python mobile_audit.py <directory>")
-        sys.exit(1)
-
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
+def _audit_chunk(paths: List[str]) -> List[dict]:
+    # Worker entry point: the findings of each file, in the order given
+    auditor = MobileAuditor()
+    return [auditor._audit_file_delta(path) for path in paths]
+
+
+def resolve_jobs(jobs: int) -> int:
+    """--jobs value to a worker count: 0 means one per CPU"""
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def changed_files(directory: str, ref: str = "HEAD") -> List[str]:
+    """
+    Mobile source files under directory that differ from ref (staged, unstaged
+    or committed since ref), from `git diff --name-only`. Deleted and untracked
+    files are left out. Raises RuntimeError outside a git work tree.
+    """
+    if not os.path.isdir(directory):
+        raise RuntimeError(f"{directory} is not a directory")
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", "-z", "--relative", "--diff-filter=d", ref, "--"],
+            cwd=directory, capture_output=True, text=True
+        )
+    except FileNotFoundError:
+        raise RuntimeError("git is not installed")
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr.strip().splitlines() or [f"git diff {ref} failed"])[0])
+
+    files = []
+    for name in sorted(filter(None, result.stdout.split("\0"))):
+        parts = Path(name).parts
+        if Path(name).suffix in AUDIT_EXTENSIONS and not SKIP_DIRS.intersection(parts[:-1]):
+            files.append(os.path.join(directory, name))
+    return files
+
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    parser = argparse.ArgumentParser(description="Mobile UX audit for React Native / Flutter code")
+    parser.add_argument("path", help="Project directory or a single file")
+    parser.add_argument("--json", action="store_true", help="Output JSON report")
+    parser.add_argument("--no-cache", action="store_true", help="Re-audit every file instead of reusing unchanged results")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Audit files on N processes (0 = one per CPU, default: 1)")
+    parser.add_argument("--changed", nargs="?", const="HEAD", metavar="REF",
+                        help="Only audit files that git diff reports as changed against REF (default: HEAD); "
+                             "untracked files are not audited")
+    args = parser.parse_args(argv[1:])
 
     auditor = MobileAuditor()
-    if os.path.isfile(path):
-        auditor.audit_file(path)
+    if os.path.isfile(args.path):
+        auditor.audit_file(args.path)
     else:
-        auditor.audit_directory(path)
+        try:
+            auditor.audit_directory(args.path, use_cache=not args.no_cache, jobs=args.jobs, changed=args.changed)
+        except RuntimeError as e:
+            print(f"[!] --changed: {e}")
+            sys.exit(1)
 
     report = auditor.get_report()
 
-    if is_json:
+    if args.json:
         print(json.dumps(report, indent=2))
     else:
-        print(f"\n[MOBILE AUDIT] {report['files_checked']} mobile files checked")
+        scope = f" (changed since {args.changed})" if args.changed else ""
+        print(f"\n[MOBILE AUDIT] {report['files_checked']} mobile files checked{scope}")
         print("-" * 50)
         if report['issues']:
             print(f"[!] ISSUES ({len(report['issues'])}):")
@@ -658,12 +770,20 @@ def main():
             for w in report['warnings'][:15]:
                 print(f"  - {w}")
         print(f"[+] PASSED CHECKS: {report['passed_checks']}")
+        if 'cache' in report:
+            print(f"[+] CACHE: {report['cache']['hits']} unchanged / {report['cache']['misses']} re-audited ({report['cache']['hit_ratio']:.0%} hits)")
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
     sys.exit(0 if report['compliant'] else 1)
 
 
+def run(context):
+    """In-process entry point for checklist.py / verify_all.py"""
+    from check_runner import run_main
+    return run_main(main, [__file__, context.project_path])
+
+
 if __name__ == "__main__":
     # Fix missing import
     import re
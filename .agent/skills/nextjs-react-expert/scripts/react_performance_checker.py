@@ -3,13 +3,50 @@
 React Performance Checker
 Automated performance audit for React/Next.js projects
 Based on Vercel Engineering best practices
+
+Source files are enumerated and read once into an index, and the import graph
+(.agent/scripts/import_graph.py: aliases, index files, transitive closures) is
+loaded and updated incrementally; every check queries them instead of walking
+the tree itself.
 """
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Iterator
+
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import read_text
+from import_graph import ModuleGraph, SOURCE_EXTENSIONS
+
+# A component whose static import closure is this large belongs behind dynamic()
+LARGE_COMPONENT_BYTES = 30 * 1024
+# First-party source an entry page may pull in statically before it is flagged
+PAGE_WEIGHT_BUDGET = 250 * 1024
+
+# Packages that are barrels themselves (2-bundle-bundle-size-optimization.md, Rule 2.1)
+BARREL_PACKAGES = ('lucide-react', '@mui/material', '@mui/icons-material', '@tabler/icons-react', 'react-icons',
+                   '@headlessui/react', '@radix-ui/react-', 'lodash', 'ramda', 'date-fns', 'rxjs', 'react-use')
+NEXT_CONFIGS = ('next.config.js', 'next.config.mjs', 'next.config.ts')
+# Of those, the ones Next.js >= 13.5 rewrites to direct imports without any config
+# (its built-in optimizePackageImports list)
+NEXT_OPTIMIZED_BY_DEFAULT = ('lucide-react', '@mui/material', '@mui/icons-material', '@tabler/icons-react', 'react-icons/',
+                             '@headlessui/react', 'ramda', 'date-fns', 'rxjs', 'react-use')
+NEXT_DEFAULT_OPTIMIZATION = (13, 5)
+
+
+def barrel_package(spec: str) -> Optional[str]:
+    """The barrel package a bare specifier imports from its root, if any (react-icons/fa counts as a root)"""
+    for package in BARREL_PACKAGES:
+        if package.endswith('-'):
+            if spec.startswith(package) and '/' not in spec[len(package):]:
+                return spec
+        elif spec == package or (package == 'react-icons' and spec.startswith('react-icons/') and spec.count('/') == 1):
+            return spec
+    return None
+
 
 class PerformanceChecker:
     def __init__(self, project_path: str):
@@ -17,24 +54,47 @@ class PerformanceChecker:
         self.issues = []
         self.warnings = []
         self.passed = []
+        self.sources: Optional[Dict[str, str]] = None
+        self.graph: Optional[ModuleGraph] = None
+
+    # ------------------------------------------------------------------
+    #  File index
+    # ------------------------------------------------------------------
+
+    def build_index(self) -> None:
+        """Bring the stored import graph up to date and read every source file once (path order)"""
+        self.graph = ModuleGraph.open(self.project_path)
+        self.graph.save()
+        self.sources = {}
+        for filepath in sorted(self.graph.nodes):
+            try:
+                self.sources[filepath] = read_text(filepath, encoding='utf-8')
+            except Exception:
+                continue
+
+    def files(self, extensions=SOURCE_EXTENSIONS) -> Iterator[Tuple[str, str]]:
+        """(path, content) of indexed files with one of the extensions"""
+        if self.sources is None:
+            self.build_index()
+        for path, content in self.sources.items():
+            if path.endswith(extensions):
+                yield path, content
+
+    def rel(self, path: str) -> str:
+        return os.path.relpath(path, self.project_path)
 
     def check_waterfalls(self):
         """Check for sequential await patterns (Section 1)"""
         print("\n[*] Checking for waterfalls (sequential awaits)...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.files():
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Pattern: multiple awaits in sequence without Promise.all
                 sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
 
                 if sequential_awaits:
                     self.issues.append({
-                        'file': str(filepath.relative_to(self.project_path)),
+                        'file': self.rel(filepath),
                         'type': 'CRITICAL',
                         'issue': 'Sequential awaits detected (waterfall)',
                         'fix': 'Use Promise.all() for parallel fetching',
@@ -47,79 +107,111 @@ class PerformanceChecker:
         """Check for barrel imports (Section 2)"""
         print("[*] Checking for barrel imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: import from index files or barrel exports
-                barrel_imports = re.findall(r"import.*from\s+['\"](@/.*?)/index['\"]", content)
-                barrel_imports += re.findall(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)", content)
-
-                if barrel_imports:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Potential barrel imports detected',
-                        'fix': 'Import directly from specific files',
-                        'section': '2-bundle-bundle-size-optimization.md'
-                    })
-            except Exception as e:
-                continue
+        optimized = self.optimized_packages()
+        for filepath, _content in self.files():
+            # Project modules that only re-export, and barrel packages Next.js does not rewrite
+            barrels = [self.rel(m) for m in dict.fromkeys(self.graph.imports(filepath)) if self.graph.is_barrel(m)]
+            barrels += [p for p in dict.fromkeys(map(barrel_package, self.graph.specifiers(filepath)))
+                        if p and not any(p.startswith(o) for o in optimized)]
+            if barrels and not self.graph.is_barrel(filepath):
+                self.warnings.append({
+                    'file': self.rel(filepath),
+                    'type': 'CRITICAL',
+                    'issue': f"Barrel imports detected: {', '.join(barrels)}",
+                    'fix': 'Import directly from specific files (or list the package in optimizePackageImports)',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
 
     def check_dynamic_imports(self):
         """Check if large components use dynamic imports (Section 2)"""
         print("[*] Checking for missing dynamic imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
+        if self.graph is None:
+            self.build_index()
+        entry_roots = {root for _page, roots in self.graph.entries() for root in roots}
+        for filepath, content in self.files(('.tsx', '.jsx')):
+            if filepath in entry_roots or self.graph.is_barrel(filepath):
+                continue
+            importers = self.graph.importers(filepath)
+            if not importers:
                 continue
 
+            # Everything the component pulls in statically ships with each importer's chunk
+            weight = self.graph.weight(self.graph.closure(filepath))
+            if weight > LARGE_COMPONENT_BYTES:
+                others = f' (+{len(importers) - 1} more importers)' if len(importers) > 1 else ''
+                self.warnings.append({
+                    'file': self.rel(importers[0]),
+                    'type': 'CRITICAL',
+                    'issue': f'Large component {Path(filepath).stem} imported statically '
+                             f'({weight / 1024:.0f} KB with its imports){others}',
+                    'fix': 'Use dynamic() for code splitting',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
+
+    def check_bundle_weight(self):
+        """Static import closure of every entry page (Section 2)"""
+        print("[*] Checking entry page bundle weight...")
+
+        if self.graph is None:
+            self.build_index()
+        pages = []
+        for page, roots in self.graph.entries():
+            files = self.graph.closure(*roots)
+            pages.append((self.graph.weight(files), len(files), page))
+        pages.sort(key=lambda p: (-p[0], p[2]))
+
+        for weight, count, page in pages[:5]:
+            print(f"    {weight / 1024:>8.1f} KB  {count:>5} modules  {self.rel(page)}")
+        for weight, count, page in pages:
+            if weight > PAGE_WEIGHT_BUDGET:
+                self.warnings.append({
+                    'file': self.rel(page),
+                    'type': 'HIGH',
+                    'issue': f'Entry page statically imports {weight / 1024:.0f} KB of source ({count} modules)',
+                    'fix': 'Split rarely used parts behind dynamic() and avoid barrel imports',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
+
+    def next_version(self) -> Optional[Tuple[int, int]]:
+        """(major, minor) of the installed next, else of the version package.json asks for"""
+        for manifest, key in ((self.project_path / 'node_modules' / 'next' / 'package.json', None),
+                              (self.project_path / 'package.json', 'next')):
             try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check file size - if > 10KB, should probably use dynamic import
-                if len(content) > 10000:
-                    # Check if it's imported statically somewhere
-                    filename = filepath.stem
-
-                    # Search for static imports of this component
-                    for check_file in self.project_path.rglob('*.{ts,tsx}'):
-                        if check_file == filepath or 'node_modules' in str(check_file):
-                            continue
-
-                        check_content = check_file.read_text(encoding='utf-8')
-                        if f"import {filename}" in check_content or f"import {{ {filename}" in check_content:
-                            if 'dynamic(' not in check_content:
-                                self.warnings.append({
-                                    'file': str(check_file.relative_to(self.project_path)),
-                                    'type': 'CRITICAL',
-                                    'issue': f'Large component {filename} imported statically',
-                                    'fix': 'Use dynamic() for code splitting',
-                                    'section': '2-bundle-bundle-size-optimization.md'
-                                })
-                                break
-            except Exception as e:
+                data = json.loads(read_text(manifest, errors='ignore'))
+            except (OSError, ValueError):
                 continue
+            if key:
+                data = {'version': {**data.get('devDependencies', {}), **data.get('dependencies', {})}.get(key, '')}
+            match = re.match(r'[\^~>=v\s]*(\d+)(?:\.(\d+))?', str(data.get('version', '')))
+            if match:
+                return int(match.group(1)), int(match.group(2) or 0)
+        return None
+
+    def optimized_packages(self) -> List[str]:
+        """Packages Next.js rewrites: its defaults (13.5+) plus next.config's optimizePackageImports"""
+        version = self.next_version()
+        packages = list(NEXT_OPTIMIZED_BY_DEFAULT) if version and version >= NEXT_DEFAULT_OPTIMIZATION else []
+        for name in NEXT_CONFIGS:
+            config = self.project_path / name
+            if config.is_file():
+                match = re.search(r'optimizePackageImports\s*:\s*\[([^\]]*)\]', read_text(config, errors='ignore'))
+                if match:
+                    packages += re.findall(r"""['"]([^'"]+)['"]""", match.group(1))
+                break
+        return packages
 
     def check_useEffect_fetching(self):
         """Check for data fetching in useEffect (Section 4)"""
         print("[*] Checking for useEffect data fetching...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.files(('.ts', '.tsx')):
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Pattern: fetch or axios in useEffect
                 if 'useEffect' in content:
                     if re.search(r'useEffect.*?fetch\(', content, re.DOTALL):
                         self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
+                            'file': self.rel(filepath),
                             'type': 'MEDIUM-HIGH',
                             'issue': 'Data fetching in useEffect',
                             'fix': 'Consider using SWR or React Query for deduplication',
@@ -132,13 +224,8 @@ class PerformanceChecker:
         """Check for missing React.memo, useMemo, useCallback (Section 5)"""
         print("[*] Checking for missing memoization...")
 
-        for filepath in self.project_path.rglob('*.{tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.files(('.tsx',)):
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Check for component definitions without memo
                 components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
 
@@ -146,7 +233,7 @@ class PerformanceChecker:
                     # Check if component receives props
                     if 'props:' in content or 'Props>' in content:
                         self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
+                            'file': self.rel(filepath),
                             'type': 'MEDIUM',
                             'issue': 'Component with props not memoized',
                             'fix': 'Consider using React.memo if props are stable',
@@ -159,17 +246,12 @@ class PerformanceChecker:
         """Check for unoptimized images (Section 6)"""
         print("[*] Checking for image optimization...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.files():
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Check for <img> tags instead of next/image
                 if '<img' in content and 'next/image' not in content:
                     self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
+                        'file': self.rel(filepath),
                         'type': 'MEDIUM',
                         'issue': 'Using <img> instead of next/image',
                         'fix': 'Use next/image for automatic optimization',
@@ -221,9 +303,14 @@ class PerformanceChecker:
         print("="*60)
         print(f"Scanning: {self.project_path}")
 
+        self.build_index()
+        print(f"Indexed: {len(self.sources)} source files "
+              f"({self.graph.reparsed} parsed, {len(self.graph.nodes) - self.graph.reparsed} unchanged since last run)")
+
         self.check_waterfalls()
         self.check_barrel_imports()
         self.check_dynamic_imports()
+        self.check_bundle_weight()
         self.check_useEffect_fetching()
         self.check_missing_memoization()
         self.check_image_optimization()
@@ -23,6 +23,10 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import walk_files, read_text
+from audit_cache import open_cache
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -77,20 +81,18 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_pages(project_path: Path) -> list:
     """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    extensions = {'.html', '.htm', '.jsx', '.tsx'}
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    for f in walk_files(project_path, extensions, SKIP_DIRS):
+        # Check if it's likely a page (path relative to the project)
+        f = Path(f)
+        if is_page_file(f.relative_to(project_path)):
+            files.append(f)
+            if len(files) == 50:  # Limit to 50 files
+                break
     
-    return files[:50]  # Limit to 50 files
+    return files
 
 
 def check_page(file_path: Path) -> dict:
@@ -98,7 +100,7 @@ def check_page(file_path: Path) -> dict:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, errors='ignore')
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
@@ -145,8 +147,9 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    project_path = Path(argv[1] if len(argv) > 1 else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"  SEO CHECKER - Search Engine Optimization Audit")
@@ -169,10 +172,13 @@ def main():
     
     # Check each page
     all_issues = []
+    cache = open_cache("seo_checker", project_path, __file__) if "--no-cache" not in argv else None
     for f in pages:
-        result = check_page(f)
+        result = cache.result(f, lambda: check_page(f)) if cache else check_page(f)
         if result["issues"]:
             all_issues.append(result)
+    if cache:
+        cache.save()
     
     # Summary
     print("=" * 60)
@@ -207,7 +213,8 @@ def main():
         "files_checked": len(pages),
         "files_with_issues": len(all_issues),
         "issues_found": total_issues,
-        "passed": passed
+        "passed": passed,
+        **({"cache": cache.stats()} if cache else {})
     }
     
     print("\n" + json.dumps(output, indent=2))
@@ -215,5 +222,11 @@ def main():
     sys.exit(0 if passed else 1)
 
 
+def run(context):
+    """In-process entry point for checklist.py / verify_all.py"""
+    from check_runner import run_main
+    return run_main(main, [__file__, context.project_path])
+
+
 if __name__ == "__main__":
     main()
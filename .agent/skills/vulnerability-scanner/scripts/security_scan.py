@@ -4,6 +4,9 @@ Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
 Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
+       python security_scan.py <project_path> --jobs 0    # scan on every CPU
+       python security_scan.py <project_path> --no-cache  # ignore findings cached for unchanged files
+       python security_scan.py --benchmark [--benchmark-files 5000] [--jobs N]
 Output: JSON with validation findings
 
 This script verifies:
@@ -17,11 +20,19 @@ import json
 import os
 import sys
 import re
+import time
 import argparse
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_index import walk_files, read_text, shared_store
+from audit_cache import open_cache
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -85,9 +96,260 @@ DANGEROUS_PATTERNS = [
     (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
 ]
 
+CONFIG_PATTERNS = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
+# Literal anchors per rule name, lowercase: every match of the rule contains at
+# least one of them, so files without any anchor skip the regex entirely.
+RULE_ANCHORS = {
+    # Secrets
+    "API Key": ("api",),
+    "Token": ("token",),
+    "Bearer Token": ("bearer",),
+    "AWS Access Key": ("akia",),
+    "AWS Secret": ("aws",),
+    "Azure Credential": ("azure",),
+    "GCP Credential": ("google",),
+    "Password": ("password",),
+    "Database Connection String": ("://",),
+    "Private Key": ("-----begin",),
+    "SSH Key": ("ssh-rsa",),
+    "JWT Token": ("eyj",),
+    # Dangerous patterns
+    "eval() usage": ("eval",),
+    "exec() usage": ("exec",),
+    "Function constructor": ("function",),
+    "child_process.exec": ("child_process.exec",),
+    "subprocess with shell=True": ("subprocess.call",),
+    "dangerouslySetInnerHTML": ("dangerouslysetinnerhtml",),
+    "innerHTML assignment": (".innerhtml",),
+    "document.write": ("document.write",),
+    "SQL String Concat": ("select", "insert", "update", "delete"),
+    "SQL f-string": ("select", "insert", "update", "delete"),
+    "SSL Verify Disabled": ("verify",),
+    "Insecure flag": ("--insecure",),
+    "SSL Disabled": ("disable",),
+    "pickle usage": ("pickle.",),
+    "Unsafe YAML load": ("yaml.load",),
+    # Configuration
+    "Debug mode enabled": ("debug",),
+    "Development mode in config": ("node_env",),
+    "CORS allow all origins": ('"cors_allow_all"',),
+    "CORS wildcard": ('"access-control-allow-origin"',),
+    "Dangerous CORS combo": ("allowcredentials",),
+}
+
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
+CONFIG_FILENAMES = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+
+SCAN_KINDS = ("secrets", "patterns", "config")
+
+# Parallel mode: below this many files per worker a pool costs more than it saves
+MIN_FILES_PER_JOB = 50
+CHUNKS_PER_JOB = 8
+
+
+# ============================================================================
+#  SCAN ENGINE
+# ============================================================================
+
+class Rule:
+    """A precompiled pattern plus the literal anchors that must be present for it to match."""
+    __slots__ = ("regex", "anchors", "name", "severity", "category")
+
+    def __init__(self, pattern: str, name: str, severity: str, category: str = None, line_local: bool = False):
+        if line_local:
+            # The pattern was written for one line at a time; keep whole-file matches
+            # on a single line (no \s inside character classes in such patterns)
+            pattern = pattern.replace("[^", "[^\\n").replace(r"\s", r"[^\S\n]")
+        self.regex = re.compile(pattern, re.IGNORECASE)
+        self.anchors = RULE_ANCHORS[name]
+        self.name = name
+        self.severity = severity
+        self.category = category
+
+    def may_match(self, folded: str) -> bool:
+        return any(anchor in folded for anchor in self.anchors)
+
+
+SECRET_RULES = [Rule(p, name, sev) for p, name, sev in SECRET_PATTERNS]
+DANGER_RULES = [Rule(p, name, sev, cat, line_local=True) for p, name, sev, cat in DANGEROUS_PATTERNS]
+CONFIG_RULES = [Rule(p, name, sev) for p, name, sev in CONFIG_PATTERNS]
+
+
+class _Lines:
+    """Line numbers and text from match offsets, computed once per file on demand."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.starts = [0]
+        self.starts.extend(m.end() for m in re.finditer("\n", content))
+
+    def number(self, offset: int) -> int:
+        return bisect_right(self.starts, offset)
+
+    def text(self, number: int) -> str:
+        end = self.starts[number] if number < len(self.starts) else len(self.content)
+        return self.content[self.starts[number - 1]:end]
+
+
+def _walk_targets(project_path: str, kinds) -> List[tuple]:
+    """Files to scan, in walk order, as (path, want_secrets, want_patterns, want_config)"""
+    targets = []
+    # .gitignore is not applied: ignored local config is exactly where stray secrets end up
+    for filepath in walk_files(project_path, skip_dirs=SKIP_DIRS, gitignore=False):
+        file = os.path.basename(filepath)
+        ext = Path(file).suffix.lower()
+        want_secrets = "secrets" in kinds and (ext in CODE_EXTENSIONS or ext in CONFIG_EXTENSIONS)
+        want_patterns = "patterns" in kinds and ext in CODE_EXTENSIONS
+        want_config = "config" in kinds and (ext in CONFIG_EXTENSIONS or file in CONFIG_FILENAMES)
+        if want_secrets or want_patterns or want_config:
+            targets.append((filepath, want_secrets, want_patterns, want_config))
+    return targets
+
+
+def _scan_file(project_path: str, target: tuple) -> tuple:
+    """(secret, pattern, config) findings for one file; empty if it cannot be read"""
+    filepath, want_secrets, want_patterns, want_config = target
+    secrets, patterns, config = [], [], []
+
+    try:
+        content = read_text(filepath, errors='ignore')
+    except Exception:
+        return secrets, patterns, config
+
+    folded = content.casefold()
+    rel_path = None
+    lines = None
+
+    if want_secrets:
+        for rule in SECRET_RULES:
+            if not rule.may_match(folded):
+                continue
+            matches = list(rule.regex.finditer(content))
+            if matches:
+                rel_path = rel_path or str(Path(filepath).relative_to(project_path))
+                lines = lines or _Lines(content)
+                secrets.append({
+                    "file": rel_path,
+                    "line": lines.number(matches[0].start()),
+                    "type": rule.name,
+                    "severity": rule.severity,
+                    "count": len(matches)
+                })
+
+    if want_patterns:
+        # One finding per (line, rule), ordered by line then rule as a per-line scan would
+        hits = set()
+        for index, rule in enumerate(DANGER_RULES):
+            if rule.may_match(folded):
+                for match in rule.regex.finditer(content):
+                    lines = lines or _Lines(content)
+                    hits.add((lines.number(match.start()), index))
+        for line_num, index in sorted(hits):
+            rule = DANGER_RULES[index]
+            rel_path = rel_path or str(Path(filepath).relative_to(project_path))
+            patterns.append({
+                "file": rel_path,
+                "line": line_num,
+                "pattern": rule.name,
+                "severity": rule.severity,
+                "category": rule.category,
+                "snippet": lines.text(line_num).strip()[:80]
+            })
+
+    if want_config:
+        for rule in CONFIG_RULES:
+            if not rule.may_match(folded):
+                continue
+            match = rule.regex.search(content)
+            if match:
+                rel_path = rel_path or str(Path(filepath).relative_to(project_path))
+                lines = lines or _Lines(content)
+                config.append({
+                    "file": rel_path,
+                    "line": lines.number(match.start()),
+                    "issue": rule.name,
+                    "severity": rule.severity
+                })
+
+    return secrets, patterns, config
+
+
+def _scan_chunk(project_path: str, chunk: List[tuple]) -> List[tuple]:
+    # Worker entry point: the rule tables are compiled once per worker, at import
+    return [_scan_file(project_path, target) for target in chunk]
+
+
+def resolve_jobs(jobs: int) -> int:
+    """--jobs value to a worker count: 0 means one per CPU"""
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def scan_tree(project_path: str, kinds=SCAN_KINDS, jobs: int = 1, cache: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Walk the tree once, read each file once and run every requested rule set
+    (secrets, dangerous patterns, configuration) over it in a single pass.
+    With jobs > 1 the files are sharded across a process pool; results are
+    merged in walk order, so the output does not depend on the worker count.
+    With cache, unchanged files reuse their findings from the previous run
+    and only the rest are scanned; raw["cache"] then holds the hit ratio.
+    Returns raw per-kind results; the scan_* functions turn them into reports.
+    """
+    raw = {
+        "secrets": {"findings": [], "scanned_files": 0, "by_severity": {"critical": 0, "high": 0, "medium": 0}},
+        "patterns": {"findings": [], "scanned_files": 0, "by_category": {}},
+        "config": {"findings": []},
+    }
+
+    targets = _walk_targets(project_path, kinds)
+    raw["secrets"]["scanned_files"] = sum(1 for target in targets if target[1])
+    raw["patterns"]["scanned_files"] = sum(1 for target in targets if target[2])
+
+    # Findings depend on which rule sets ran, so each kind combination has its own cache
+    results = open_cache("security_scan-" + "+".join(k for k in SCAN_KINDS if k in kinds), project_path, __file__) \
+        if cache else None
+    per_file = [results.get(target[0]) if results else None for target in targets]
+    todo = [target for target, found in zip(targets, per_file) if found is None]
+
+    jobs = min(resolve_jobs(jobs), max(1, len(todo) // MIN_FILES_PER_JOB))
+    if jobs > 1:
+        # Many small chunks form a work queue: idle workers pull the next one, which
+        # evens out uneven file sizes; map() still yields chunks in submission order
+        size = max(1, len(todo) // (jobs * CHUNKS_PER_JOB))
+        chunks = [todo[i:i + size] for i in range(0, len(todo), size)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            fresh = [result for chunk in pool.map(_scan_chunk, [project_path] * len(chunks), chunks) for result in chunk]
+    else:
+        fresh = _scan_chunk(project_path, todo)
+
+    fresh = iter(zip(todo, fresh))
+    for i, found in enumerate(per_file):
+        if found is None:
+            target, result = next(fresh)
+            per_file[i] = results.put(target[0], result) if results else result
+    if results:
+        results.save()
+        raw["cache"] = results.stats()
+
+    for secrets, patterns, config in per_file:
+        for finding in secrets:
+            raw["secrets"]["by_severity"][finding["severity"]] += finding["count"]
+        for finding in patterns:
+            raw["patterns"]["by_category"][finding["category"]] = raw["patterns"]["by_category"].get(finding["category"], 0) + 1
+        raw["secrets"]["findings"].extend(secrets)
+        raw["patterns"]["findings"].extend(patterns)
+        raw["config"]["findings"].extend(config)
+
+    return raw
 
 
 # ============================================================================
@@ -178,48 +440,20 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+def scan_secrets(project_path: str, raw: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
     """
+    raw = raw or scan_tree(project_path, ("secrets",))["secrets"]
     results = {
         "tool": "secret_scanner",
-        "findings": [],
+        "findings": raw["findings"],
         "status": "[OK] No secrets detected",
-        "scanned_files": 0,
-        "by_severity": {"critical": 0, "high": 0, "medium": 0}
+        "scanned_files": raw["scanned_files"],
+        "by_severity": raw["by_severity"]
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
-    
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
     elif results["by_severity"]["high"] > 0:
@@ -233,50 +467,20 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str, raw: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
     """
+    raw = raw or scan_tree(project_path, ("patterns",))["patterns"]
     results = {
         "tool": "pattern_scanner",
-        "findings": [],
+        "findings": raw["findings"],
         "status": "[OK] No dangerous patterns",
-        "scanned_files": 0,
-        "by_category": {}
+        "scanned_files": raw["scanned_files"],
+        "by_category": raw["by_category"]
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
-    
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
     
@@ -293,53 +497,19 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_configuration(project_path: str, raw: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
     """
+    raw = raw or scan_tree(project_path, ("config",))["config"]
     results = {
         "tool": "config_scanner",
-        "findings": [],
+        "findings": raw["findings"],
         "status": "[OK] Configuration secure",
         "checks": {}
     }
     
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
-    
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
     for hf in header_files:
@@ -365,12 +535,130 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
     return results
 
 
+# ============================================================================
+#  BENCHMARK
+# ============================================================================
+
+_FIXTURE_LINES = [
+    "import {{ helper{i} }} from './helper{i}';",
+    "export function render{i}(props) {{ return props.items.map((x) => x * {i}); }}",
+    "const total{i} = values.reduce((a, b) => a + b, 0);",
+    "// TODO: clean up module {i} once the API stabilises",
+    "el.innerHTML = template{i};",
+    "const api_key = 'sk_live_{i:06d}abcdefghijklmnop';",
+    "const query = \"SELECT * FROM users WHERE id = \" + userId + \"\";",
+    "eval(userInput{i});",
+]
+
+
+def _write_fixture(root: Path, files: int, lines_per_file: int = 120) -> int:
+    """Synthetic monorepo: packages of source and config files, a few findings in each"""
+    total_bytes = 0
+    for i in range(files):
+        package = root / "packages" / f"pkg-{i // 50:03d}"
+        if i % 10 == 0:
+            path, text = package / f"config-{i}.json", '{\n  "DEBUG": true,\n  "name": "pkg-%d"\n}\n' % i
+        else:
+            # Mostly clean lines; the tail of the template list carries findings
+            body = [_FIXTURE_LINES[(i + n) % 4 if n % 40 else 4 + (i + n) % 4].format(i=i) for n in range(lines_per_file)]
+            path, text = package / "src" / f"module-{i}.{'ts' if i % 3 else 'py'}", "\n".join(body) + "\n"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        total_bytes += len(text)
+        if i % 50 == 0:
+            (package / "node_modules" / "dep").mkdir(parents=True, exist_ok=True)
+            (package / "node_modules" / "dep" / "index.js").write_text("eval(x);\n", encoding="utf-8")
+    return total_bytes
+
+
+def _reference_scan(project_path: str) -> Dict[str, Dict[str, Any]]:
+    """The previous algorithm: one walk per scan, every pattern re-run per file (per line for patterns)"""
+    raw = {
+        "secrets": {"findings": [], "scanned_files": 0, "by_severity": {"critical": 0, "high": 0, "medium": 0}},
+        "patterns": {"findings": [], "scanned_files": 0, "by_category": {}},
+        "config": {"findings": []},
+    }
+    for kind in SCAN_KINDS:
+        for root, dirs, files in os.walk(project_path):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for file in files:
+                ext = Path(file).suffix.lower()
+                if kind == "secrets" and ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
+                    continue
+                if kind == "patterns" and ext not in CODE_EXTENSIONS:
+                    continue
+                if kind == "config" and ext not in CONFIG_EXTENSIONS and file not in CONFIG_FILENAMES:
+                    continue
+                filepath = Path(root) / file
+                rel_path = str(filepath.relative_to(project_path))
+                if kind != "config":
+                    raw[kind]["scanned_files"] += 1
+                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read()
+                if kind == "secrets":
+                    for pattern, secret_type, severity in SECRET_PATTERNS:
+                        count = len(re.findall(pattern, content, re.IGNORECASE))
+                        if count:
+                            raw[kind]["findings"].append({"file": rel_path, "type": secret_type, "severity": severity, "count": count})
+                            raw[kind]["by_severity"][severity] += count
+                elif kind == "patterns":
+                    for line_num, line in enumerate(content.split("\n"), 1):
+                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
+                            if re.search(pattern, line, re.IGNORECASE):
+                                raw[kind]["findings"].append({"file": rel_path, "line": line_num, "pattern": name,
+                                                              "severity": severity, "category": category,
+                                                              "snippet": line.strip()[:80]})
+                                raw[kind]["by_category"][category] = raw[kind]["by_category"].get(category, 0) + 1
+                else:
+                    for pattern, issue, severity in CONFIG_PATTERNS:
+                        if re.search(pattern, content, re.IGNORECASE):
+                            raw[kind]["findings"].append({"file": rel_path, "issue": issue, "severity": severity})
+    return raw
+
+
+def benchmark(files: int = 5000, repeats: int = 3, jobs: int = 1) -> bool:
+    """Time the single-pass engine (serial and on `jobs` processes) against the previous three-walk scan"""
+    jobs = resolve_jobs(jobs)
+    scans = [("three walks", _reference_scan), ("single pass", scan_tree)]
+    if jobs > 1:
+        scans.append((f"{jobs} jobs", lambda path: scan_tree(path, jobs=jobs)))
+    with tempfile.TemporaryDirectory(prefix="security-scan-bench-") as tmp:
+        size = _write_fixture(Path(tmp), files)
+        timings = {}
+        outputs = {}
+        for label, scan in scans:
+            best = 1e9
+            for _i in range(repeats):
+                # Time cold reads: drop contents the shared store kept from the previous run
+                shared_store().clear()
+                start = time.perf_counter()
+                outputs[label] = scan(tmp)
+                best = min(best, time.perf_counter() - start)
+            timings[label] = best
+
+    engine = outputs["single pass"]
+    same = all(outputs[label] == engine for label, _ in scans[2:])
+    for kind in ("secrets", "config"):
+        for finding in engine[kind]["findings"]:
+            finding.pop("line")
+    same = same and engine == outputs["three walks"]
+
+    print(f"Fixture: {files} files, {size / 1e6:.1f} MB")
+    for label, seconds in timings.items():
+        print(f"  {label:<12} {seconds * 1000:>9.1f} ms")
+    for label, _ in scans[1:]:
+        print(f"  speedup      {timings['three walks'] / timings[label]:>9.1f}x ({label})")
+    print(f"  findings     {'[OK] identical' if same else '[!!] MISMATCH'} "
+          f"({sum(len(r['findings']) for r in engine.values())} total)")
+    return same
+
+
 # ============================================================================
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all", jobs: int = 1, cache: bool = True) -> Dict[str, Any]:
+    """Execute security validation scans (file scans on `jobs` processes, incremental with `cache`)."""
     
     report = {
         "project": project_path,
@@ -392,9 +680,15 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         "config": ("configuration", scan_configuration),
     }
     
+    # Secrets, patterns and config share a single walk over the tree
+    tree_kinds = [kind for kind in SCAN_KINDS if scan_type in ("all", kind)]
+    tree = scan_tree(project_path, tree_kinds, jobs, cache) if tree_kinds else {}
+    if "cache" in tree:
+        report["cache"] = tree["cache"]
+    
     for key, (name, scanner) in scanners.items():
         if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
+            result = scanner(project_path, tree[key]) if key in tree else scanner(project_path)
             report["scans"][name] = result
             
             findings_count = len(result.get("findings", []))
@@ -418,7 +712,7 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
     )
@@ -427,14 +721,25 @@ def main():
                         default="all", help="Type of scan to run")
     parser.add_argument("--output", choices=["json", "summary"], default="json",
                         help="Output format")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Scan files on N processes (0 = one per CPU)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rescan every file instead of reusing findings for unchanged files")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Benchmark the scan engine on a generated monorepo fixture")
+    parser.add_argument("--benchmark-files", type=int, default=5000,
+                        help="Number of files in the benchmark fixture")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv[1:] if argv is not None else None)
+    
+    if args.benchmark:
+        sys.exit(0 if benchmark(args.benchmark_files, jobs=args.jobs) else 1)
     
     if not os.path.isdir(args.project_path):
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    result = run_full_scan(args.project_path, args.scan_type, args.jobs, not args.no_cache)
     
     if args.output == "summary":
         print(f"\n{'='*60}")
@@ -444,6 +749,9 @@ def main():
         print(f"Total Findings: {result['summary']['total_findings']}")
         print(f"  Critical: {result['summary']['critical']}")
         print(f"  High: {result['summary']['high']}")
+        if "cache" in result:
+            print(f"Cache: {result['cache']['hits']} unchanged / {result['cache']['misses']} rescanned "
+                  f"({result['cache']['hit_ratio']:.0%} hit ratio)")
         print(f"{'='*60}\n")
         
         for scan_name, scan_result in result['scans'].items():
@@ -454,5 +762,11 @@ def main():
         print(json.dumps(result, indent=2))
 
 
+def run(context):
+    """In-process entry point for checklist.py / verify_all.py"""
+    from check_runner import run_main
+    return run_main(main, [__file__, context.project_path])
+
+
 if __name__ == "__main__":
     main()
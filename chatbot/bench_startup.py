@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for chatbot_backend.
+
+Imports the module in a fresh interpreter with `-X importtime`, prints a summary
+of the slowest imports and fails if a deferred heavy dependency got pulled in
+at import time or the total import time exceeds the budget.
+
+Usage: python bench_startup.py [--budget-ms 1500] [--top 15] [--runs 3]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Must only be imported by the runtime factory, never by `import chatbot_backend`
+DEFERRED_MODULES = [
+    "langchain_community",
+    "langchain_ollama",
+    "langchain_mcp_adapters",
+    "langgraph",
+    "duckduckgo_search",
+]
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def profile_import() -> list:
+    """Return (self_us, cumulative_us, depth, module) rows for `import chatbot_backend`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import chatbot_backend"],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"import chatbot_backend failed (exit {proc.returncode})")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((int(self_us), int(cumulative_us), len(indent) // 2, module))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="chatbot_backend import-time benchmark")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Max total import time (default: 1500ms)")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest top-level imports to show")
+    parser.add_argument("--runs", type=int, default=3, help="Runs to take the best total from (default: 3)")
+    args = parser.parse_args()
+
+    best_rows, best_total = None, None
+    for _ in range(max(1, args.runs)):
+        rows = profile_import()
+        total = sum(r[1] for r in rows if r[2] == 0)
+        if best_total is None or total < best_total:
+            best_rows, best_total = rows, total
+
+    print("=" * 60)
+    print("chatbot_backend import-time profile (-X importtime)")
+    print("=" * 60)
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    top_level = sorted((r for r in best_rows if r[2] == 0), key=lambda r: r[1], reverse=True)
+    for self_us, cumulative_us, _, module in top_level[:args.top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {module}")
+    print("-" * 60)
+    print(f"Total: {best_total / 1000:.1f}ms (budget {args.budget_ms:.0f}ms, {len(best_rows)} modules)")
+
+    failures = []
+    leaked = sorted({r[3] for r in best_rows if r[3].split(".")[0] in DEFERRED_MODULES})
+    if leaked:
+        failures.append(f"deferred modules imported eagerly: {', '.join(leaked[:10])}")
+    if best_total / 1000 > args.budget_ms:
+        failures.append(f"import time {best_total / 1000:.1f}ms exceeds budget {args.budget_ms:.0f}ms")
+
+    if failures:
+        for failure in failures:
+            print(f"[FAIL] {failure}")
+        sys.exit(1)
+    print("[PASS] Fast-start import profile within budget")
+
+
+if __name__ == "__main__":
+    main()
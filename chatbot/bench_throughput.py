@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the chatbot API.
+
+Drives `/threads` and `/chat` with N concurrent clients against a running server
+and reports throughput and latency percentiles. Save a run before a change and
+compare against it afterwards to catch event-loop blocking regressions.
+A /chat request only succeeds once the model has answered, so the server needs
+its Ollama model (or a stand-in that speaks the Ollama API) while this runs.
+
+Usage:
+    python bench_throughput.py --clients 50 --requests 500 --save before.json
+    python bench_throughput.py --clients 50 --requests 500 --baseline before.json
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+
+import httpx
+
+
+async def _hit_threads(client: httpx.AsyncClient, base_url: str) -> bool:
+    res = await client.get(f"{base_url}/threads")
+    return res.status_code == 200
+
+
+async def _hit_chat(client: httpx.AsyncClient, base_url: str) -> bool:
+    payload = {"message": "hi", "thread_id": f"bench-{uuid.uuid4()}"}
+    async with client.stream("POST", f"{base_url}/chat", json=payload) as res:
+        if res.status_code != 200:
+            return False
+        async for line in res.aiter_lines():
+            if line.startswith("data: "):
+                kind = json.loads(line[6:]).get("type")
+                # An error event ends the stream early and would otherwise read as fast throughput
+                if kind in ("done", "error"):
+                    return kind == "done"
+    return False
+
+
+async def run_endpoint(name: str, base_url: str, clients: int, total: int, timeout: float) -> dict:
+    """Fire `total` requests at one endpoint with `clients` in flight at once."""
+    hit = _hit_threads if name == "threads" else _hit_chat
+    latencies, failures = [], 0
+    queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async def worker(client):
+        nonlocal failures
+        while not queue.empty():
+            queue.get_nowait()
+            start = time.perf_counter()
+            try:
+                ok = await hit(client, base_url)
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            failures += 0 if ok else 1
+
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(clients)))
+        wall = time.perf_counter() - wall_start
+
+    latencies.sort()
+    return {
+        "endpoint": f"/{name}",
+        "clients": clients,
+        "requests": total,
+        "failures": failures,
+        "rps": round(total / wall, 2) if wall else 0.0,
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+        "max_ms": round(latencies[-1] * 1000, 1),
+    }
+
+
+def print_report(results: list, baseline: dict = None):
+    print("=" * 72)
+    print(f"{'endpoint':<10} {'clients':>7} {'reqs':>6} {'fail':>5} {'req/s':>9} {'p50':>9} {'p95':>9}  vs baseline")
+    print("-" * 72)
+    for r in results:
+        delta = ""
+        base = (baseline or {}).get(r["endpoint"])
+        if base and base["rps"]:
+            delta = f"{(r['rps'] - base['rps']) / base['rps'] * 100:+.1f}% req/s"
+        print(f"{r['endpoint']:<10} {r['clients']:>7} {r['requests']:>6} {r['failures']:>5} "
+              f"{r['rps']:>9.1f} {r['p50_ms']:>7.1f}ms {r['p95_ms']:>7.1f}ms  {delta}")
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chatbot API concurrency benchmark")
+    parser.add_argument("--url", default="http://localhost:8000", help="Server base URL")
+    parser.add_argument("--clients", "-c", type=int, default=50, help="Concurrent clients (default: 50)")
+    parser.add_argument("--requests", "-n", type=int, default=500, help="Requests per endpoint (default: 500)")
+    parser.add_argument("--endpoints", nargs="+", choices=["threads", "chat"], default=["threads", "chat"])
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds")
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a JSON file written by --save")
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(run_endpoint(name, args.url.rstrip("/"), args.clients, args.requests, args.timeout))
+        for name in args.endpoints
+    ]
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = {r["endpoint"]: r for r in json.load(f)}
+    print_report(results, baseline)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved to {args.save}")
+
+    sys.exit(1 if any(r["failures"] for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,62 +1,49 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, APIRouter, Request
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from datetime import datetime, timezone
+from typing import Optional
+from contextlib import asynccontextmanager
 import json
 import uvicorn
 import asyncio
-import threading
 import os
+import sys
+import time
+import socket
+import subprocess
+import uuid
 import aiosqlite
-import requests
 import re
 from dotenv import load_dotenv
 
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
-from langchain_ollama import ChatOllama
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
-from langgraph.graph import StateGraph, START, END
-from langgraph.graph.message import add_messages
-from langgraph.prebuilt import ToolNode, tools_condition
-from langchain_community.tools import DuckDuckGoSearchRun
-from langchain_core.tools import tool, BaseTool
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from typing import TypedDict, Annotated
+import thread_transfer
+
+# NOTE: langchain / langgraph / MCP / DuckDuckGo are imported lazily inside the
+# runtime factory below. Importing this module must stay cheap so that test
+# collection and `uvicorn --reload` cycles start fast.
+# Run `python bench_startup.py` to check the import-time budget.
 
 # --- 1. Initialization & Config ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "chatbot.db")
 load_dotenv(os.path.join(os.path.dirname(BASE_DIR), "Backend", ".env"))
 
-app = FastAPI(title="Aivon Chatbot Nexus API")
-
-# Enable CORS for the Next.js frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Fast-start mode: skip building the graph in the lifespan and build it on the first request instead
+FAST_START = os.getenv("CHATBOT_FAST_START", "0") == "1"
 
-# Dedicated async loop for background AI processes
-_ASYNC_LOOP = asyncio.new_event_loop()
-_ASYNC_THREAD = threading.Thread(target=_ASYNC_LOOP.run_forever, daemon=True)
-_ASYNC_THREAD.start()
+# Background AI work (compression, titling) runs on the server loop; keep strong refs until done
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
 
-def run_async(coro):
-    return asyncio.run_coroutine_threadsafe(coro, _ASYNC_LOOP).result()
+def spawn_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
 
 # --- 2. AI Tools Setup ---
-search_tool = DuckDuckGoSearchRun(region="us-en")
-
-@tool
-def get_stock_price(symbol: str) -> dict:
-    """Fetch latest stock price for a given symbol (e.g. 'AAPL', 'TSLA')."""
-    url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey=C9PE94QUEW9VWGFM"
-    r = requests.get(url)
-    return r.json()
-
-client = MultiServerMCPClient({
+MCP_SERVERS = {
     "arith": {
         "transport": "stdio",
         "command": "python3",
@@ -66,25 +53,42 @@ client = MultiServerMCPClient({
         "transport": "streamable_http",
         "url": "https://splendid-gold-dingo.fastmcp.app/mcp"
     }
-})
-
-def load_mcp_tools() -> list[BaseTool]:
+}
+
+def _mcp_connections() -> dict:
+    """MCP connections for this process; stdio servers go through the shared broker in multi-worker mode."""
+    broker_url = os.getenv("CHATBOT_MCP_BROKER_URL")
+    if not broker_url:
+        return MCP_SERVERS
+    connections = {name: cfg for name, cfg in MCP_SERVERS.items() if cfg["transport"] != "stdio"}
+    connections["broker"] = {"transport": "streamable_http", "url": broker_url}
+    return connections
+
+async def _build_tools() -> list:
+    from langchain_community.tools import DuckDuckGoSearchRun
+    from langchain_core.tools import tool
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    import requests
+
+    search_tool = DuckDuckGoSearchRun(region="us-en")
+
+    @tool
+    def get_stock_price(symbol: str) -> dict:
+        """Fetch latest stock price for a given symbol (e.g. 'AAPL', 'TSLA')."""
+        url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey=C9PE94QUEW9VWGFM"
+        r = requests.get(url)
+        return r.json()
+
+    client = MultiServerMCPClient(_mcp_connections())
     try:
-        return run_async(client.get_tools())
+        mcp_tools = await client.get_tools()
     except Exception:
-        return []
+        mcp_tools = []
 
-mcp_tools = load_mcp_tools()
-tools = [search_tool, get_stock_price, *mcp_tools]
+    return [search_tool, get_stock_price, *mcp_tools]
 
 # --- 3. LangGraph & Ollama Architecture ---
-llm = ChatOllama(model="qwen2.5-coder:7b", num_ctx=32768)
-llm_with_tools = llm.bind_tools(tools) if tools else llm
-
-class ChatState(TypedDict):
-    messages: Annotated[list[BaseMessage], add_messages]
-
-async def chat_node(state: ChatState, config: dict):
+async def chat_node(state, config: dict):
     """LLM node that may answer or request a tool call."""
     messages = state["messages"]
     thread_id = config.get("configurable", {}).get("thread_id", "")
@@ -98,11 +102,10 @@ async def chat_node(state: ChatState, config: dict):
     recent_msgs = human_ai_msgs[-N:] if len(human_ai_msgs) > N else human_ai_msgs
     old_msgs = human_ai_msgs[:-N] if len(human_ai_msgs) > N else []
     
-    db_path = os.path.join(BASE_DIR, "chatbot.db")
     memory_summary = ""
     compressed_count = 0
     
-    async with aiosqlite.connect(database=db_path) as db:
+    async with aiosqlite.connect(database=DB_PATH) as db:
         cursor = await db.execute("SELECT compressed_summary, compressed_msg_count FROM threads_memory WHERE thread_id = ?", (thread_id,))
         row = await cursor.fetchone()
         if row:
@@ -111,7 +114,7 @@ async def chat_node(state: ChatState, config: dict):
     # Trigger background compression if enough new old messages fell out of window
     if len(old_msgs) > compressed_count:
         msgs_to_compress = old_msgs[compressed_count:]
-        asyncio.create_task(compress_memory_layer(thread_id, msgs_to_compress, memory_summary, len(old_msgs)))
+        spawn_background(compress_memory_layer(thread_id, msgs_to_compress, memory_summary, len(old_msgs)))
         
     # --- Prompt Assembler ---
     sys_content = sys_msgs[-1].content if sys_msgs else "You are an AI assistant."
@@ -121,14 +124,13 @@ async def chat_node(state: ChatState, config: dict):
     final_sys_msg = SystemMessage(content=sys_content, id="sync_sys_prompt")
     invoke_msgs = [final_sys_msg] + recent_msgs
     
-    response = await llm_with_tools.ainvoke(invoke_msgs)
+    response = await (await get_runtime()).llm_with_tools.ainvoke(invoke_msgs)
     return {"messages": [response]}
 
-tool_node = ToolNode(tools) if tools else None
-
-async def _init_checkpointer():
-    db_path = os.path.join(BASE_DIR, "chatbot.db")
-    conn = await aiosqlite.connect(database=db_path)
+async def _ensure_schema(conn):
+    """Create the app's own tables; cheap and idempotent, so it runs in every lifespan (fast-start included)."""
+    # WAL lets several uvicorn workers read while one writes
+    await conn.execute("PRAGMA journal_mode=WAL")
     
     # Phase 14 Schema: Thread Metadata
     await conn.execute("""
@@ -152,34 +154,117 @@ async def _init_checkpointer():
             last_compressed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
-    await conn.commit()
-    return AsyncSqliteSaver(conn)
 
-checkpointer = run_async(_init_checkpointer())
+    # Multi-worker Schema: per-thread background job leases
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS threads_leases (
+            thread_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            PRIMARY KEY (thread_id, kind)
+        )
+    """)
+
+    # Deletion Schema: threads hidden immediately, rows removed later by the purger
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS threads_tombstones (
+            thread_id TEXT PRIMARY KEY,
+            deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS threads_activity (
+            thread_id TEXT PRIMARY KEY,
+            last_active_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    await conn.commit()
 
-graph = StateGraph(ChatState)
-graph.add_node("chat_node", chat_node)
-graph.add_edge(START, "chat_node")
+async def _init_checkpointer(db_path: str = DB_PATH):
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
-if tool_node:
-    graph.add_node("tools", tool_node)
-    graph.add_conditional_edges("chat_node", tools_condition)
-    graph.add_edge("tools", "chat_node")
-else:
-    graph.add_edge("chat_node", END)
+    conn = await aiosqlite.connect(database=db_path)
+    await _ensure_schema(conn)
 
-chatbot = graph.compile(checkpointer=checkpointer)
+    saver = AsyncSqliteSaver(conn)
+    await saver.setup()
+    # Purge batches must be index range deletes on thread_id
+    for table in CHECKPOINT_TABLES:
+        await _ensure_thread_index(conn, table)
+    await conn.commit()
+    return saver
+
+async def _ensure_thread_index(conn, table: str):
+    """Create a thread_id index on `table` unless an existing index (e.g. the PK) already leads with it."""
+    cursor = await conn.execute(f"PRAGMA index_list({table})")
+    for index in await cursor.fetchall():
+        info = await conn.execute(f'PRAGMA index_info("{index[1]}")')
+        columns = sorted(await info.fetchall())
+        if columns and columns[0][2] == "thread_id":
+            return
+    await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_thread_id ON {table}(thread_id)")
+
+class _Runtime:
+    """Heavy AI objects (LLM, tools, checkpointer, compiled graph), all bound to the server loop."""
+
+    def __init__(self, tools: list, checkpointer):
+        from typing import TypedDict, Annotated
+        from langchain_core.messages import BaseMessage
+        from langchain_ollama import ChatOllama
+        from langgraph.graph import StateGraph, START, END
+        from langgraph.graph.message import add_messages
+        from langgraph.prebuilt import ToolNode, tools_condition
+
+        class ChatState(TypedDict):
+            messages: Annotated[list[BaseMessage], add_messages]
+
+        self.tools = tools
+        self.llm = ChatOllama(model="qwen2.5-coder:7b", num_ctx=32768)
+        self.llm_with_tools = self.llm.bind_tools(self.tools) if self.tools else self.llm
+        self.checkpointer = checkpointer
+
+        graph = StateGraph(ChatState)
+        graph.add_node("chat_node", chat_node)
+        graph.add_edge(START, "chat_node")
+
+        if self.tools:
+            graph.add_node("tools", ToolNode(self.tools))
+            graph.add_conditional_edges("chat_node", tools_condition)
+            graph.add_edge("tools", "chat_node")
+        else:
+            graph.add_edge("chat_node", END)
+
+        self.chatbot = graph.compile(checkpointer=self.checkpointer)
+
+    async def aclose(self):
+        await self.checkpointer.conn.close()
+
+_RUNTIME = None
+_RUNTIME_LOCK = asyncio.Lock()
+
+async def get_runtime() -> _Runtime:
+    """Lazy application factory for the AI runtime (built at most once, on the calling loop)."""
+    global _RUNTIME
+    if _RUNTIME is None:
+        async with _RUNTIME_LOCK:
+            if _RUNTIME is None:
+                tools = await _build_tools()
+                checkpointer = await _init_checkpointer()
+                _RUNTIME = _Runtime(tools, checkpointer)
+    return _RUNTIME
 
 async def _alist_threads():
     all_threads = set()
-    async for checkpoint in checkpointer.alist(None):
+    async for checkpoint in (await get_runtime()).checkpointer.alist(None):
         all_threads.add(checkpoint.config["configurable"]["thread_id"])
         
-    db_path = os.path.join(BASE_DIR, "chatbot.db")
-    async with aiosqlite.connect(database=db_path) as db:
+    async with aiosqlite.connect(database=DB_PATH) as db:
         cursor = await db.execute("SELECT thread_id, title FROM threads_metadata")
         rows = await cursor.fetchall()
         meta_dict = {row[0]: row[1] for row in rows}
+        cursor = await db.execute("SELECT thread_id FROM threads_tombstones")
+        all_threads.difference_update(row[0] for row in await cursor.fetchall())
         
     # Return array of dicts instead of just strings
     result_threads = []
@@ -192,13 +277,35 @@ async def _alist_threads():
         
     return result_threads
 
-def retrieve_all_threads():
-    return run_async(_alist_threads())
+async def retrieve_all_threads():
+    return await _alist_threads()
 
 # --- 4. FastAPI Routes ---
 
 from fastapi import HTTPException
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Checkpointer, MCP client and graph all live on uvicorn's loop.
+    # Fast-start mode defers building them to the first request.
+    global _RUNTIME
+    async with aiosqlite.connect(database=DB_PATH) as conn:
+        await _ensure_schema(conn)
+    # The purger does not need the runtime, so tombstones are purged in fast-start mode too
+    _start_purger()
+    if not FAST_START:
+        await get_runtime()
+    yield
+    if _PURGER_TASK is not None:
+        _PURGER_TASK.cancel()
+    if _BACKGROUND_TASKS:
+        await asyncio.wait(list(_BACKGROUND_TASKS), timeout=10)
+    if _RUNTIME is not None:
+        await _RUNTIME.aclose()
+        _RUNTIME = None
+
+router = APIRouter()
+
 class ChatRequest(BaseModel):
     message: str
     thread_id: str
@@ -207,16 +314,19 @@ class ChatRequest(BaseModel):
 class TitleUpdateRequest(BaseModel):
     title: str
 
-@app.get("/threads")
+class BulkDeleteRequest(BaseModel):
+    thread_ids: list[str] = []
+    older_than: Optional[datetime] = None
+
+@router.get("/threads")
 async def get_threads():
-    threads = retrieve_all_threads()
+    threads = await retrieve_all_threads()
     return {"threads": threads}
 
-@app.put("/threads/{thread_id}/title")
+@router.put("/threads/{thread_id}/title")
 async def update_thread_title(thread_id: str, req: TitleUpdateRequest):
     try:
-        db_path = os.path.join(BASE_DIR, "chatbot.db")
-        async with aiosqlite.connect(database=db_path) as db:
+        async with aiosqlite.connect(database=DB_PATH) as db:
             await db.execute("""
                 INSERT INTO threads_metadata (thread_id, title, title_confidence, title_source, is_frozen)
                 VALUES (?, ?, 1.0, 'user', 1)
@@ -228,9 +338,14 @@ async def update_thread_title(thread_id: str, req: TitleUpdateRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/history/{thread_id}")
+@router.get("/history/{thread_id}")
 async def get_history(thread_id: str):
-    state = chatbot.get_state(config={"configurable": {"thread_id": thread_id}})
+    if await is_tombstoned(thread_id):
+        raise HTTPException(status_code=404, detail=f"Thread {thread_id} not found")
+
+    from langchain_core.messages import HumanMessage, AIMessage
+    chatbot = (await get_runtime()).chatbot
+    state = await chatbot.aget_state(config={"configurable": {"thread_id": thread_id}})
     messages = state.values.get("messages", [])
     
     # Filter out SystemMessages and tool calls for the raw UI history
@@ -288,6 +403,14 @@ def classify_message_importance(msg_content: str) -> str:
     return "SUPPORTING"
 
 async def compress_memory_layer(thread_id: str, msgs_to_compress: list, current_summary: str, new_total: int):
+    # Only one worker may compress a given thread at a time
+    async with thread_lease(thread_id, "compress") as acquired:
+        if acquired:
+            await _compress_memory_layer(thread_id, msgs_to_compress, current_summary, new_total)
+
+async def _compress_memory_layer(thread_id: str, msgs_to_compress: list, current_summary: str, new_total: int):
+    from langchain_core.messages import HumanMessage, AIMessage
+
     try:
         meaningful = []
         for m in msgs_to_compress:
@@ -297,9 +420,8 @@ async def compress_memory_layer(thread_id: str, msgs_to_compress: list, current_
             elif isinstance(m, AIMessage) and m.content:
                 meaningful.append(f"AI: {m.content}")
                 
-        db_path = os.path.join(BASE_DIR, "chatbot.db")
         if not meaningful:
-            async with aiosqlite.connect(database=db_path) as db:
+            async with aiosqlite.connect(database=DB_PATH) as db:
                 await db.execute("INSERT INTO threads_memory (thread_id, compressed_msg_count) VALUES (?, ?) ON CONFLICT(thread_id) DO UPDATE SET compressed_msg_count = excluded.compressed_msg_count", (thread_id, new_total))
                 await db.commit()
             return
@@ -311,10 +433,10 @@ New Conversation Context to Merge:
 {transcript}
 
 Task: Update the memory summary to incorporate critical facts, user goals, and current progress from the new context. Be extremely concise (max 4 sentences). Key constraints: Output JSON or conversational text. NO, JUST PLAINTEXT. Keep it objective."""
-        ai_msg = await llm.ainvoke([HumanMessage(content=prompt)])
+        ai_msg = await (await get_runtime()).llm.ainvoke([HumanMessage(content=prompt)])
         new_summary = ai_msg.content.strip() if ai_msg.content else current_summary
         
-        async with aiosqlite.connect(database=db_path) as db:
+        async with aiosqlite.connect(database=DB_PATH) as db:
             await db.execute("""
                 INSERT INTO threads_memory (thread_id, compressed_summary, compressed_msg_count)
                 VALUES (?, ?, ?)
@@ -380,9 +502,13 @@ def deterministic_title_extraction(user_msg: str) -> dict:
     return {"title": title, "confidence": confidence, "source": "deterministic"}
 
 async def generate_and_save_title(thread_id: str, user_message: str):
+    async with thread_lease(thread_id, "title") as acquired:
+        if acquired:
+            await _generate_and_save_title(thread_id, user_message)
+
+async def _generate_and_save_title(thread_id: str, user_message: str):
     try:
-        db_path = os.path.join(BASE_DIR, "chatbot.db")
-        async with aiosqlite.connect(database=db_path) as db:
+        async with aiosqlite.connect(database=DB_PATH) as db:
             cursor = await db.execute("SELECT is_frozen, title_confidence FROM threads_metadata WHERE thread_id = ?", (thread_id,))
             row = await cursor.fetchone()
             
@@ -399,7 +525,7 @@ async def generate_and_save_title(thread_id: str, user_message: str):
                 try:
                     prompt = f"Summarize this intent in max 6 words (Title Case, no quotes, no punctuation). Input: {user_message}"
                     from langchain_core.messages import HumanMessage
-                    ai_msg = await llm.ainvoke([HumanMessage(content=prompt)])
+                    ai_msg = await (await get_runtime()).llm.ainvoke([HumanMessage(content=prompt)])
                     if ai_msg.content:
                         clean_title = ai_msg.content.strip(' "\'.')
                         if len(clean_title.split()) <= 6:
@@ -424,8 +550,35 @@ class ChatRequest(BaseModel):
     thread_id: str
     model: str = "nexus-core"
 
-@app.post("/chat")
+# Tool-call leakage filters, compiled once per worker
+_RAW_TOOL_JSON_RE = re.compile(r'\{[^{]*?["\']name["\']\s*:\s*["\']\w+["\'][^}]*?\}')
+_ACTION_RE = re.compile(r'Action:\s*\w+\s*(?:Action Input:.*)?')
+_TOOL_JSON_BLOCK_RE = re.compile(r'```json\s*\{[^{]*?["\']name["\']\s*:.*?\s*\}\s*```', re.DOTALL)
+
+def sanitize_chunk(content: str) -> str:
+    """Strip tool-call JSON / ReAct scaffolding the model leaks into its text. Returns '' if nothing is left."""
+    text_content = content.strip()
+
+    # 1. Block lone JSON dicts at the start or lone dicts
+    is_raw_json = text_content.startswith('{"name":') or text_content.startswith("{'name':") or ('"arguments"' in text_content and text_content.startswith("{"))
+    if is_raw_json:
+        return ""
+
+    # 2. Regex out JSON objects that look like tool calls embedded anywhere in the text
+    cleaned = _RAW_TOOL_JSON_RE.sub('', content)
+    # 3. Regex out Action: tool_name
+    cleaned = _ACTION_RE.sub('', cleaned)
+    # 4. Regex out Markdown JSON blocks containing tool names
+    cleaned = _TOOL_JSON_BLOCK_RE.sub('', cleaned)
+
+    return cleaned if cleaned.strip() else ""
+
+@router.post("/chat")
 async def chat_stream(request: ChatRequest):
+    # A deleted thread must not be resumed while its checkpoints wait for the purger
+    if await is_tombstoned(request.thread_id):
+        raise HTTPException(status_code=404, detail=f"Thread {request.thread_id} not found")
+
     async def generate():
         CONFIG = {
             "configurable": {"thread_id": request.thread_id},
@@ -434,7 +587,9 @@ async def chat_stream(request: ChatRequest):
         }
         
         try:
-            from langchain_core.messages import SystemMessage
+            from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
+
+            chatbot = (await get_runtime()).chatbot
             
             # Intent Classification and Dynamic Tone
             current_mode = classify_intent(request.message)
@@ -444,11 +599,13 @@ async def chat_stream(request: ChatRequest):
             system_prompt = SystemMessage(content=dynamic_content, id="sync_sys_prompt")
             messages_to_send = [system_prompt, HumanMessage(content=request.message)]
             
+            await touch_thread_activity(request.thread_id)
+
             # Trigger Background Title Naming if early in conversation
-            state = chatbot.get_state(CONFIG)
+            state = await chatbot.aget_state(CONFIG)
             msg_count = len(state.values.get("messages", [])) if state and hasattr(state, "values") else 0
             if msg_count <= 2:
-                asyncio.create_task(generate_and_save_title(request.thread_id, request.message))
+                spawn_background(generate_and_save_title(request.thread_id, request.message))
                 
             async for message_chunk, metadata in chatbot.astream(
                 {"messages": messages_to_send},
@@ -460,21 +617,9 @@ async def chat_stream(request: ChatRequest):
                     yield f"data: {json.dumps({'type': 'tool_start', 'tool': tool_name})}\n\n"
                     
                 elif isinstance(message_chunk, AIMessage) and message_chunk.content:
-                    text_content = message_chunk.content.strip()
-                    
-                    # 1. Block lone JSON dicts at the start or lone dicts
-                    is_raw_json = text_content.startswith('{"name":') or text_content.startswith("{'name':") or ('"arguments"' in text_content and text_content.startswith("{"))
-                    
-                    if not is_raw_json:
-                        # 2. Regex out JSON objects that look like tool calls embedded anywhere in the text
-                        cleaned = re.sub(r'\{[^{]*?["\']name["\']\s*:\s*["\']\w+["\'][^}]*?\}', '', message_chunk.content)
-                        # 3. Regex out Action: tool_name
-                        cleaned = re.sub(r'Action:\s*\w+\s*(?:Action Input:.*)?', '', cleaned)
-                        # 4. Regex out Markdown JSON blocks containing tool names
-                        cleaned = re.sub(r'```json\s*\{[^{]*?["\']name["\']\s*:.*?\s*\}\s*```', '', cleaned, flags=re.DOTALL)
-                        
-                        if cleaned.strip():
-                            yield f"data: {json.dumps({'type': 'message_chunk', 'content': cleaned})}\n\n"
+                    cleaned = sanitize_chunk(message_chunk.content)
+                    if cleaned:
+                        yield f"data: {json.dumps({'type': 'message_chunk', 'content': cleaned})}\n\n"
 
             yield f"data: {json.dumps({'type': 'done'})}\n\n"
             
@@ -483,20 +628,282 @@ async def chat_stream(request: ChatRequest):
 
     return StreamingResponse(generate(), media_type="text/event-stream")
 
-@app.delete("/threads/{thread_id}")
+@router.delete("/threads/{thread_id}")
 async def delete_thread(thread_id: str):
-    """Deletes a thread and all its checkpoints from the SQLite database."""
+    """Tombstones a thread; its checkpoints are removed later by the background purger."""
     try:
-        async with aiosqlite.connect("chatbot.db") as db:
-            await db.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
-            await db.execute("DELETE FROM checkpoint_blobs WHERE thread_id = ?", (thread_id,))
-            await db.execute("DELETE FROM checkpoint_writes WHERE thread_id = ?", (thread_id,))
-            await db.execute("DELETE FROM threads_metadata WHERE thread_id = ?", (thread_id,))
-            await db.execute("DELETE FROM threads_memory WHERE thread_id = ?", (thread_id,))
-            await db.commit()
-            return {"status": "success", "message": f"Thread {thread_id} deleted"}
+        await tombstone_threads([thread_id])
+        return {"status": "success", "message": f"Thread {thread_id} deleted"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/threads/bulk-delete")
+async def bulk_delete_threads(req: BulkDeleteRequest):
+    """Tombstones a list of threads and/or every thread inactive since `older_than`, then returns immediately."""
+    if not req.thread_ids and req.older_than is None:
+        raise HTTPException(status_code=400, detail="Provide thread_ids or older_than")
+    try:
+        count = 0
+        if req.thread_ids:
+            count += await tombstone_threads(req.thread_ids)
+        if req.older_than is not None:
+            count += await tombstone_threads_older_than(req.older_than)
+        return {"status": "accepted", "tombstoned": count}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/threads/export")
+async def export_threads(after: Optional[str] = None):
+    """Streams every live thread as NDJSON; pass the last thread_id received as `after` to resume."""
+    await get_runtime()
+    return StreamingResponse(thread_transfer.iter_export_ndjson(DB_PATH, after), media_type="application/x-ndjson")
+
+@router.post("/threads/import")
+async def import_threads(request: Request, skip: int = 0):
+    """Imports an NDJSON body produced by /threads/export in batched transactions; `skip` resumes after N lines."""
+    await get_runtime()
+    try:
+        result = await thread_transfer.import_ndjson(DB_PATH, thread_transfer.aiter_lines(request.stream()), skip=skip)
+        return {"status": "success", **result}
+    except thread_transfer.ImportFailed as e:
+        raise HTTPException(status_code=400, detail={"error": str(e), "committed": e.committed})
+
+# --- 8. Multi-Worker Mode ---
+# Each uvicorn worker is its own process (so CPU-bound sanitizing scales across cores);
+# per-thread background jobs are serialized through the threads_leases table, and
+# stdio MCP servers are hosted once by mcp_broker.py instead of once per worker.
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+LEASE_TTL_SECONDS = 120
+# Held leases are extended this often, so a job may run longer than the TTL
+LEASE_RENEW_SECONDS = LEASE_TTL_SECONDS / 3
+
+async def acquire_lease(thread_id: str, kind: str, owner: str, ttl: float = LEASE_TTL_SECONDS) -> bool:
+    """Take (or steal an expired) lease on a per-thread job for `owner`. Returns False if anyone else holds it."""
+    now = time.time()
+    async with aiosqlite.connect(database=DB_PATH) as db:
+        cursor = await db.execute("""
+            INSERT INTO threads_leases (thread_id, kind, owner, expires_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(thread_id, kind) DO UPDATE SET
+            owner = excluded.owner, expires_at = excluded.expires_at
+            WHERE threads_leases.expires_at < ?
+        """, (thread_id, kind, owner, now + ttl, now))
+        await db.commit()
+        return cursor.rowcount > 0
+
+async def renew_lease(thread_id: str, kind: str, owner: str, ttl: float = LEASE_TTL_SECONDS) -> bool:
+    """Push back the expiry of a lease `owner` still holds. Returns False if it expired and was taken over."""
+    async with aiosqlite.connect(database=DB_PATH) as db:
+        cursor = await db.execute(
+            "UPDATE threads_leases SET expires_at = ? WHERE thread_id = ? AND kind = ? AND owner = ?",
+            (time.time() + ttl, thread_id, kind, owner),
+        )
+        await db.commit()
+        return cursor.rowcount > 0
+
+async def _lease_heartbeat(thread_id: str, kind: str, owner: str, interval: float = LEASE_RENEW_SECONDS):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not await renew_lease(thread_id, kind, owner):
+                print(f"Lease Lost: {kind} on {thread_id}")
+                return
+        except Exception as e:
+            # Retried on the next beat; the TTL leaves room for two misses
+            print("Lease Error:", e)
+
+async def release_lease(thread_id: str, kind: str, owner: str):
+    async with aiosqlite.connect(database=DB_PATH) as db:
+        await db.execute("DELETE FROM threads_leases WHERE thread_id = ? AND kind = ? AND owner = ?", (thread_id, kind, owner))
+        await db.commit()
+
+@asynccontextmanager
+async def thread_lease(thread_id: str, kind: str):
+    # One token per acquisition: coroutines of the same worker exclude each other too
+    owner = f"{WORKER_ID}:{uuid.uuid4()}"
+    try:
+        acquired = await acquire_lease(thread_id, kind, owner)
+    except Exception as e:
+        print("Lease Error:", e)
+        acquired = False
+    heartbeat = asyncio.create_task(_lease_heartbeat(thread_id, kind, owner)) if acquired else None
+    try:
+        yield acquired
+    finally:
+        if heartbeat is not None:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+        if acquired:
+            await release_lease(thread_id, kind, owner)
+
+def start_mcp_broker(host: str = "127.0.0.1", port: int = 8765, wait: float = 10.0) -> Optional[subprocess.Popen]:
+    """Launch mcp_broker.py and point every worker (via the inherited env) at it.
+
+    Returns None, with the env left unset so each worker keeps its own stdio servers,
+    if the broker exits or does not accept connections within `wait` seconds."""
+    proc = subprocess.Popen([sys.executable, os.path.join(BASE_DIR, "mcp_broker.py"), "--host", host, "--port", str(port)])
+    deadline = time.monotonic() + wait
+    ready = False
+    while not ready and time.monotonic() < deadline and proc.poll() is None:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                ready = True
+        except OSError:
+            time.sleep(0.2)
+    if not ready or proc.poll() is not None:
+        print("MCP Broker Error: not reachable, workers fall back to their own stdio servers")
+        if proc.poll() is None:
+            proc.terminate()
+        return None
+    os.environ["CHATBOT_MCP_BROKER_URL"] = f"http://{host}:{port}/mcp"
+    return proc
+
+# --- 9. Thread Deletion & Purge Pipeline ---
+
+CHECKPOINT_TABLES = ("checkpoints", "writes")
+THREAD_TABLES = ("threads_metadata", "threads_memory", "threads_activity", "threads_leases")
+PURGE_BATCH_SIZE = 500
+PURGE_INTERVAL_SECONDS = 5.0
+_PURGER_TASK: Optional[asyncio.Task] = None
+
+async def touch_thread_activity(thread_id: str):
+    async with aiosqlite.connect(database=DB_PATH) as db:
+        await db.execute("""
+            INSERT INTO threads_activity (thread_id) VALUES (?)
+            ON CONFLICT(thread_id) DO UPDATE SET last_active_at = CURRENT_TIMESTAMP
+        """, (thread_id,))
+        await db.commit()
+
+async def is_tombstoned(thread_id: str) -> bool:
+    async with aiosqlite.connect(database=DB_PATH) as db:
+        cursor = await db.execute("SELECT 1 FROM threads_tombstones WHERE thread_id = ?", (thread_id,))
+        return await cursor.fetchone() is not None
+
+async def _existing_tables(db, tables) -> list[str]:
+    """The subset of `tables` that exist; the checkpoint tables only appear once the runtime has been built."""
+    cursor = await db.execute(
+        f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({', '.join('?' for _ in tables)})", tuple(tables)
+    )
+    found = {row[0] for row in await cursor.fetchall()}
+    return [table for table in tables if table in found]
+
+def _checkpoint_id_floor(cutoff: datetime) -> str:
+    """Smallest checkpoint_id LangGraph can have issued at `cutoff`.
+
+    Checkpoint ids are uuid6: the 60-bit timestamp (100ns ticks since 1582-10-15)
+    leads, so the ids of a thread sort by creation time as plain strings."""
+    ticks = int(cutoff.timestamp() * 10_000_000) + 0x01B21DD213814000
+    value = (ticks >> 12) << 80 | 0x6 << 76 | (ticks & 0x0FFF) << 64 | 0x8 << 60
+    return str(uuid.UUID(int=value))
+
+async def tombstone_threads(thread_ids: list[str]) -> int:
+    async with aiosqlite.connect(database=DB_PATH) as db:
+        cursor = await db.executemany("INSERT OR IGNORE INTO threads_tombstones (thread_id) VALUES (?)", [(tid,) for tid in thread_ids])
+        await db.commit()
+        return cursor.rowcount
+
+async def tombstone_threads_older_than(cutoff: datetime) -> int:
+    if cutoff.tzinfo is None:
+        cutoff = cutoff.replace(tzinfo=timezone.utc)
+    # Same format as CURRENT_TIMESTAMP so the comparison is a plain string compare
+    cutoff_ts = cutoff.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    async with aiosqlite.connect(database=DB_PATH) as db:
+        cursor = await db.execute("""
+            INSERT OR IGNORE INTO threads_tombstones (thread_id)
+            SELECT m.thread_id FROM threads_metadata m
+            LEFT JOIN threads_activity a ON a.thread_id = m.thread_id
+            WHERE COALESCE(a.last_active_at, m.last_evaluated_at) < ?
+            UNION
+            SELECT thread_id FROM threads_activity WHERE last_active_at < ?
+        """, (cutoff_ts, cutoff_ts))
+        count = cursor.rowcount
+        if await _existing_tables(db, ("checkpoints",)):
+            # Threads from before metadata/activity tracking: age by their newest checkpoint
+            cursor = await db.execute("""
+                INSERT OR IGNORE INTO threads_tombstones (thread_id)
+                SELECT thread_id FROM checkpoints
+                WHERE thread_id NOT IN (SELECT thread_id FROM threads_metadata UNION SELECT thread_id FROM threads_activity)
+                GROUP BY thread_id
+                HAVING MAX(checkpoint_id) < ?
+            """, (_checkpoint_id_floor(cutoff),))
+            count += cursor.rowcount
+        await db.commit()
+        return count
+
+async def purge_tombstoned_threads(batch_size: int = PURGE_BATCH_SIZE, max_threads: int = 100) -> int:
+    """Remove checkpoint rows of tombstoned threads, at most `batch_size` rows per table per transaction."""
+    purged = 0
+    async with aiosqlite.connect(database=DB_PATH) as db:
+        cursor = await db.execute("SELECT thread_id FROM threads_tombstones ORDER BY deleted_at LIMIT ?", (max_threads,))
+        thread_ids = [row[0] for row in await cursor.fetchall()]
+        checkpoint_tables = await _existing_tables(db, CHECKPOINT_TABLES) if thread_ids else []
+
+        for thread_id in thread_ids:
+            while checkpoint_tables:
+                removed = 0
+                for table in checkpoint_tables:
+                    cursor = await db.execute(
+                        f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} WHERE thread_id = ? LIMIT ?)",
+                        (thread_id, batch_size),
+                    )
+                    removed += cursor.rowcount
+                await db.commit()
+                if removed == 0:
+                    break
+                # Release the write lock between batches so requests are not starved
+                await asyncio.sleep(0)
+
+            for table in THREAD_TABLES + ("threads_tombstones",):
+                await db.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            await db.commit()
+            purged += 1
+    return purged
+
+async def purge_loop(interval: float = PURGE_INTERVAL_SECONDS):
+    while True:
+        try:
+            # One purger across all workers
+            async with thread_lease("*", "purge") as acquired:
+                if acquired:
+                    await purge_tombstoned_threads()
+        except Exception as e:
+            print("Purge Error:", e)
+        await asyncio.sleep(interval)
+
+def _start_purger():
+    global _PURGER_TASK
+    if _PURGER_TASK is None or _PURGER_TASK.done():
+        _PURGER_TASK = asyncio.create_task(purge_loop())
+
+def create_app() -> FastAPI:
+    """Application factory; cheap to call, heavy AI objects are built on the server loop in the lifespan."""
+    app = FastAPI(title="Aivon Chatbot Nexus API", lifespan=lifespan)
+
+    # Enable CORS for the Next.js frontend
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.include_router(router)
+    return app
+
+app = create_app()
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    workers = int(os.getenv("CHATBOT_WORKERS", "1"))
+    if workers > 1:
+        broker = start_mcp_broker()
+        try:
+            uvicorn.run("chatbot_backend:app", host="0.0.0.0", port=8000, workers=workers)
+        finally:
+            if broker is not None:
+                broker.terminate()
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000)
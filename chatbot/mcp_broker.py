@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Local MCP broker for multi-worker deployments.
+
+Hosts the stdio MCP servers from chatbot_backend.MCP_SERVERS once and re-exposes
+them over streamable HTTP, so N uvicorn workers share one set of subprocesses
+instead of spawning their own. Workers find it through CHATBOT_MCP_BROKER_URL.
+
+Usage: python mcp_broker.py [--host 127.0.0.1] [--port 8765]
+       (started automatically by `CHATBOT_WORKERS=4 python chatbot_backend.py`)
+"""
+
+import argparse
+import sys
+
+from chatbot_backend import MCP_SERVERS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared MCP broker for chatbot workers")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    args = parser.parse_args()
+
+    try:
+        from fastmcp import FastMCP
+    except ImportError:
+        print("fastmcp is required for the MCP broker: pip install fastmcp", file=sys.stderr)
+        sys.exit(1)
+
+    stdio_servers = {
+        name: {"command": cfg["command"], "args": cfg.get("args", [])}
+        for name, cfg in MCP_SERVERS.items()
+        if cfg["transport"] == "stdio"
+    }
+    if not stdio_servers:
+        print("No stdio MCP servers configured; nothing to broker.", file=sys.stderr)
+        sys.exit(0)
+
+    proxy = FastMCP.as_proxy({"mcpServers": stdio_servers}, name="aivon-mcp-broker")
+    proxy.run(transport="streamable-http", host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
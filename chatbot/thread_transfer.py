@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Streaming NDJSON export/import of chat threads in chatbot.db.
+
+One line per thread: its latest root checkpoint (raw saver row, base64 blobs)
+plus its threads_metadata and threads_memory rows. Export pages through
+thread IDs in key order and import inserts in large batched transactions, so
+memory use stays flat regardless of history size.
+
+Resuming:
+  export  --after <thread_id>   continue after the last thread_id written
+  import  --skip <N>            skip the first N lines (reported on failure)
+
+Usage: python thread_transfer.py export [-o backup.ndjson] [--after THREAD_ID]
+       python thread_transfer.py import backup.ndjson [--skip N]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import sys
+
+import aiosqlite
+
+EXPORT_PAGE_SIZE = 200
+IMPORT_BATCH_SIZE = 1000
+
+METADATA_COLUMNS = ("title", "title_confidence", "title_source", "is_frozen", "last_evaluated_at")
+MEMORY_COLUMNS = ("long_term_facts", "compressed_summary", "compressed_msg_count", "last_compressed_at")
+
+
+class ImportFailed(Exception):
+    """Raised when a line cannot be imported; `committed` lines are already durable."""
+
+    def __init__(self, message: str, committed: int):
+        super().__init__(f"{message} (committed through line {committed}; resume with skip={committed})")
+        self.committed = committed
+
+
+# ============ EXPORT ============
+def _b64(value) -> str:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return base64.b64encode(value).decode("ascii")
+
+
+async def _fetch_row(db, sql: str, params: tuple, columns: tuple):
+    cursor = await db.execute(sql, params)
+    row = await cursor.fetchone()
+    return dict(zip(columns, row)) if row else None
+
+
+async def _export_thread(db, thread_id: str):
+    cursor = await db.execute("""
+        SELECT checkpoint_id, type, checkpoint, metadata FROM checkpoints
+        WHERE thread_id = ? AND checkpoint_ns = ''
+        ORDER BY checkpoint_id DESC LIMIT 1
+    """, (thread_id,))
+    row = await cursor.fetchone()
+    if row is None:
+        return None
+    checkpoint_id, cp_type, checkpoint, metadata = row
+
+    return {
+        "thread_id": thread_id,
+        "checkpoint": {
+            "checkpoint_id": checkpoint_id,
+            "type": cp_type,
+            "checkpoint": _b64(checkpoint),
+            "metadata": _b64(metadata),
+        },
+        "metadata": await _fetch_row(
+            db, f"SELECT {', '.join(METADATA_COLUMNS)} FROM threads_metadata WHERE thread_id = ?", (thread_id,), METADATA_COLUMNS
+        ),
+        "memory": await _fetch_row(
+            db, f"SELECT {', '.join(MEMORY_COLUMNS)} FROM threads_memory WHERE thread_id = ?", (thread_id,), MEMORY_COLUMNS
+        ),
+    }
+
+
+async def iter_export(db_path: str, after: str = None, page_size: int = EXPORT_PAGE_SIZE):
+    """Yield one record per live thread, ordered by thread_id, starting after `after`."""
+    cursor_id = after or ""
+    async with aiosqlite.connect(database=db_path) as db:
+        while True:
+            cursor = await db.execute("""
+                SELECT DISTINCT thread_id FROM checkpoints
+                WHERE checkpoint_ns = '' AND thread_id > ?
+                AND thread_id NOT IN (SELECT thread_id FROM threads_tombstones)
+                ORDER BY thread_id LIMIT ?
+            """, (cursor_id, page_size))
+            thread_ids = [row[0] for row in await cursor.fetchall()]
+            if not thread_ids:
+                return
+            for thread_id in thread_ids:
+                record = await _export_thread(db, thread_id)
+                if record is not None:
+                    yield record
+            cursor_id = thread_ids[-1]
+
+
+async def iter_export_ndjson(db_path: str, after: str = None):
+    async for record in iter_export(db_path, after):
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+# ============ IMPORT ============
+def _unb64(value):
+    return base64.b64decode(value, validate=True) if value is not None else None
+
+
+def _check_row(record: dict, key: str, columns: tuple):
+    row = record.get(key)
+    if row is None:
+        return
+    if not isinstance(row, dict):
+        raise ValueError(f"{key} must be an object")
+    for column in columns:
+        if not isinstance(row.get(column), (str, int, float, type(None))):
+            raise ValueError(f"{key}.{column} must be a scalar")
+
+
+def _parse_record(line) -> dict:
+    """Decode and validate one NDJSON line, blobs included; any malformed field raises ValueError."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8")
+    record = json.loads(line)
+    if not isinstance(record, dict) or not isinstance(record.get("thread_id"), str) or not record["thread_id"]:
+        raise ValueError("missing thread_id")
+    checkpoint = record.get("checkpoint")
+    if not isinstance(checkpoint, dict) or not isinstance(checkpoint.get("checkpoint_id"), str) or not checkpoint["checkpoint_id"]:
+        raise ValueError("missing checkpoint")
+    for key in ("type", "checkpoint"):
+        if not isinstance(checkpoint.get(key), str):
+            raise ValueError(f"missing checkpoint.{key}")
+    _check_row(record, "metadata", METADATA_COLUMNS)
+    _check_row(record, "memory", MEMORY_COLUMNS)
+    # Decoded here so bad base64 is reported against its line, not in the middle of a batch
+    record["checkpoint"] = {
+        **checkpoint,
+        "checkpoint": _unb64(checkpoint["checkpoint"]),
+        "metadata": _unb64(checkpoint.get("metadata")),
+    }
+    return record
+
+
+async def _insert_batch(db, records: list):
+    """Write a batch of parsed records in a single transaction."""
+    await db.executemany("""
+        INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata)
+        VALUES (?, '', ?, NULL, ?, ?, ?)
+    """, [
+        (r["thread_id"], r["checkpoint"]["checkpoint_id"], r["checkpoint"]["type"],
+         r["checkpoint"]["checkpoint"], r["checkpoint"]["metadata"])
+        for r in records
+    ])
+
+    metadata_rows = [(r["thread_id"], *(r["metadata"].get(c) for c in METADATA_COLUMNS)) for r in records if r.get("metadata")]
+    if metadata_rows:
+        await db.executemany(
+            f"INSERT OR REPLACE INTO threads_metadata (thread_id, {', '.join(METADATA_COLUMNS)}) VALUES (?{', ?' * len(METADATA_COLUMNS)})",
+            metadata_rows,
+        )
+
+    memory_rows = [(r["thread_id"], *(r["memory"].get(c) for c in MEMORY_COLUMNS)) for r in records if r.get("memory")]
+    if memory_rows:
+        await db.executemany(
+            f"INSERT OR REPLACE INTO threads_memory (thread_id, {', '.join(MEMORY_COLUMNS)}) VALUES (?{', ?' * len(MEMORY_COLUMNS)})",
+            memory_rows,
+        )
+
+    # An imported thread must not be picked up by a pending purge
+    await db.executemany("DELETE FROM threads_tombstones WHERE thread_id = ?", [(r["thread_id"],) for r in records])
+    await db.commit()
+
+
+async def import_ndjson(db_path: str, lines, skip: int = 0, batch_size: int = IMPORT_BATCH_SIZE) -> dict:
+    """Import records from an async iterable of NDJSON lines (str, or UTF-8 bytes). Returns counts for resuming."""
+    imported, lineno, committed = 0, 0, skip
+    batch = []
+    async with aiosqlite.connect(database=db_path) as db:
+        async for line in lines:
+            lineno += 1
+            if lineno <= skip or not line.strip():
+                continue
+            try:
+                # ValueError covers bad JSON, bad UTF-8 (UnicodeDecodeError) and bad base64 (binascii.Error)
+                record = _parse_record(line)
+            except (ValueError, TypeError) as e:
+                if batch:
+                    await _insert_batch(db, batch)
+                    imported += len(batch)
+                committed = lineno - 1
+                raise ImportFailed(f"Invalid record on line {lineno}: {e}", committed)
+
+            batch.append(record)
+            if len(batch) >= batch_size:
+                await _insert_batch(db, batch)
+                imported += len(batch)
+                committed = lineno
+                batch = []
+
+        if batch:
+            await _insert_batch(db, batch)
+            imported += len(batch)
+    return {"imported": imported, "lines": lineno}
+
+
+async def aiter_lines(chunks):
+    """Split an async stream of byte chunks (e.g. a request body) into byte lines.
+
+    Lines are left undecoded: import_ndjson decodes them, so invalid UTF-8 is
+    reported as an ImportFailed on its line instead of escaping the import."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for line in complete:
+            yield line
+    if buffer:
+        yield buffer
+
+
+async def _aiter_file(path: str):
+    with open(path, "rb") as f:
+        for line in f:
+            yield line
+
+
+# ============ CLI ============
+async def _run_export(db_path: str, output: str, after: str):
+    out = open(output, "a", encoding="utf-8") if output else sys.stdout
+    count = 0
+    try:
+        async for line in iter_export_ndjson(db_path, after):
+            out.write(line)
+            count += 1
+    finally:
+        if output:
+            out.close()
+    print(f"Exported {count} threads", file=sys.stderr)
+
+
+async def _run_import(db_path: str, path: str, skip: int):
+    # Make sure the saver and app tables exist when importing into a fresh database
+    from chatbot_backend import _init_checkpointer
+    saver = await _init_checkpointer(db_path)
+    await saver.conn.close()
+
+    result = await import_ndjson(db_path, _aiter_file(path), skip=skip)
+    print(f"Imported {result['imported']} threads ({result['lines']} lines read)", file=sys.stderr)
+
+
+def main():
+    from chatbot_backend import DB_PATH
+
+    parser = argparse.ArgumentParser(description="Export/import chat threads as NDJSON")
+    parser.add_argument("--db", default=DB_PATH, help=f"SQLite database (default: {DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = sub.add_parser("export", help="Stream threads to NDJSON")
+    export_parser.add_argument("--output", "-o", help="Output file, appended to (default: stdout)")
+    export_parser.add_argument("--after", help="Resume after this thread_id")
+
+    import_parser = sub.add_parser("import", help="Load threads from NDJSON")
+    import_parser.add_argument("file", help="NDJSON file written by export")
+    import_parser.add_argument("--skip", type=int, default=0, help="Skip the first N lines (resume)")
+
+    args = parser.parse_args()
+    try:
+        if args.command == "export":
+            asyncio.run(_run_export(args.db, args.output, args.after))
+        else:
+            asyncio.run(_run_import(args.db, args.file, args.skip))
+    except ImportFailed as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()